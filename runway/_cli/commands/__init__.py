@@ -1,20 +1,51 @@
-"""Runway command import aggregation."""
-
-from ._deploy import deploy
-from ._destroy import destroy
-from ._dismantle import dismantle
-from ._docs import docs
-from ._envvars import envvars
-from ._gen_sample import gen_sample
-from ._init import init
-from ._new import new
-from ._plan import plan
-from ._run_python import run_python
-from ._schema import schema
-from ._takeoff import takeoff
-from ._taxi import taxi
-from ._tfenv import tfenv
-from ._whichenv import whichenv
+"""Runway command import aggregation.
+
+Commands are imported when they are first accessed so that running a
+command does not require importing the dependencies of every other command.
+
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ._deploy import deploy
+    from ._destroy import destroy
+    from ._dismantle import dismantle
+    from ._docs import docs
+    from ._envvars import envvars
+    from ._gen_sample import gen_sample
+    from ._init import init
+    from ._new import new
+    from ._plan import plan
+    from ._run_python import run_python
+    from ._schema import schema
+    from ._takeoff import takeoff
+    from ._taxi import taxi
+    from ._tfenv import tfenv
+    from ._whichenv import whichenv
+
+COMMANDS: dict[str, str] = {
+    "deploy": "deploy",
+    "destroy": "destroy",
+    "dismantle": "dismantle",
+    "docs": "docs",
+    "envvars": "envvars",
+    "gen-sample": "gen_sample",
+    "init": "init",
+    "new": "new",
+    "plan": "plan",
+    "run-python": "run_python",
+    "schema": "schema",
+    "takeoff": "takeoff",
+    "taxi": "taxi",
+    "tfenv": "tfenv",
+    "whichenv": "whichenv",
+}
+"""Map of command name to the name of the object (and module, with a leading
+underscore) that defines it."""
 
 __all__ = [
     "deploy",
@@ -33,3 +64,10 @@ __all__ = [
     "tfenv",
     "whichenv",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a command when it is first accessed."""
+    if name in __all__:
+        return getattr(importlib.import_module(f"._{name}", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
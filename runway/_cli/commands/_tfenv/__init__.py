@@ -9,11 +9,12 @@ from ... import options
 from ._install import install
 from ._list import list_installed
 from ._run import run
+from ._seed import seed
 from ._uninstall import uninstall
 
-__all__ = ["install", "list_installed", "run", "uninstall"]
+__all__ = ["install", "list_installed", "run", "seed", "uninstall"]
 
-COMMANDS = [install, list_installed, run, uninstall]
+COMMANDS = [install, list_installed, run, seed, uninstall]
 
 
 @click.group("tfenv", short_help="terraform (install|run)")
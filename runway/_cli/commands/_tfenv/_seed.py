@@ -0,0 +1,74 @@
+"""Cache Terraform releases so they can be installed without network access."""
+
+# docs: file://./../../../../docs/source/commands.rst
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+import click
+
+from ....env_mgr.tfenv import TFEnvManager, fetch_tf_release, get_tf_release_versions
+from ....utils import DOC_SITE
+from ... import options
+
+LOGGER = logging.getLogger(__name__.replace("._", "."))
+
+
+@click.command("seed", short_help="cache releases for offline use")
+@click.argument("versions", metavar="[<version>]...", nargs=-1)
+@click.option(
+    "--arch",
+    default=None,
+    help="Architecture of the releases to cache (e.g. amd64). "
+    "Releases are only installed when neither this nor --platform is provided.",
+)
+@click.option(
+    "--platform",
+    "tf_platform",
+    default=None,
+    help="Operating system of the releases to cache (e.g. linux). "
+    "Releases are only installed when neither this nor --arch is provided.",
+)
+@options.debug
+@options.no_color
+@options.verbose
+@click.pass_context
+def seed(
+    ctx: click.Context,
+    versions: tuple[str, ...],
+    arch: str | None = None,
+    tf_platform: str | None = None,
+    **_: Any,
+) -> None:
+    """Cache Terraform releases so they can be installed without network access.
+
+    Refreshes the cached Terraform release index then downloads each
+    <version> (e.g. 1.5.0, latest, latest:^1.5) to the archive store,
+    verifying it against the SHA256SUMS of the release.
+
+    If no version is specified, Runway will attempt to find and read a
+    ".terraform-version" file in the current directory.
+    If this file doesn't exist, nothing will be cached.
+
+    """
+    tfenv = TFEnvManager()
+    versions = versions or tuple(filter(None, [tfenv.get_version_from_file()]))
+    if not versions:
+        LOGGER.error("unable to find a .terraform-version file")
+        LOGGER.error(
+            "learn how to use Runway to manage Terraform versions at "
+            "%s/page/terraform/advanced_features.html#version-management",
+            DOC_SITE,
+        )
+        ctx.exit(1)
+    LOGGER.info("refreshing Terraform release index...")
+    get_tf_release_versions(refresh=True, store=True)
+    for version_requested in versions:
+        tfenv.set_version(version_requested)
+        version = str(tfenv.version)
+        LOGGER.info(
+            "cached Terraform %s: %s", version, fetch_tf_release(version, tf_platform, arch)
+        )
+        if not (arch or tf_platform):
+            LOGGER.debug("terraform path: %s", tfenv.install())
@@ -1,5 +1,7 @@
 """Runway CLI entrypoint."""
 
+from __future__ import annotations
+
 import argparse
 import logging
 import os
@@ -26,8 +28,21 @@ class _CliGroup(click.Group):
 
     This should only be used for the main application group.
 
+    Commands are registered lazily, being imported the first time they are
+    needed.
+
     """
 
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        """Get a command by name, importing it if it has not been registered."""
+        if cmd_name not in self.commands and cmd_name in commands.COMMANDS:
+            self.add_command(getattr(commands, commands.COMMANDS[cmd_name]), cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        """List the names of all commands."""
+        return sorted({*commands.COMMANDS, *super().list_commands(ctx)})
+
     def invoke(self, ctx: click.Context) -> Any:
         """Replace invoke command to pass along args."""
         ctx.meta["global.options"] = self.__parse_global_options(ctx)
@@ -71,9 +86,3 @@ def cli(ctx: click.Context, **_: Any) -> None:
     opts = ctx.meta["global.options"]
     setup_logging(debug=opts["debug"], no_color=opts["no_color"], verbose=opts["verbose"])
     ctx.obj = CliContext(**opts)
-
-
-# register all the other commands from the importable modules defined
-# in commands.
-for cmd in commands.__all__:
-    cli.add_command(getattr(commands, cmd))
@@ -12,18 +12,18 @@ import click
 import yaml
 
 from ..compat import cached_property
-from ..config import RunwayConfig
-from ..context import RunwayContext
-from ..core.components import DeployEnvironment
 from ..exceptions import ConfigNotFound
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
 
+    from ..config import RunwayConfig
     from ..config.components.runway import (
         RunwayDeploymentDefinition,
         RunwayModuleDefinition,
     )
+    from ..context import RunwayContext
+    from ..core.components import DeployEnvironment
 
 LOGGER = logging.getLogger(__name__)
 
@@ -58,6 +58,8 @@ class CliContext:
     @cached_property
     def env(self) -> DeployEnvironment:
         """Name of the current deploy environment."""
+        from ..core.components import DeployEnvironment  # noqa: PLC0415
+
         environ = os.environ.copy()
         # carefully update environ with values passed from the cli
         if self.ci and "CI" not in environ:
@@ -75,6 +77,8 @@ class CliContext:
     @cached_property
     def runway_config(self) -> RunwayConfig:
         """Runway config."""
+        from ..config import RunwayConfig  # noqa: PLC0415
+
         config = RunwayConfig.parse_file(file_path=self.runway_config_path)
         self.env.ignore_git_branch = config.ignore_git_branch
         return config
@@ -87,6 +91,8 @@ class CliContext:
             SystemExit: Config file not found or multiple were matches were found.
 
         """
+        from ..config import RunwayConfig  # noqa: PLC0415
+
         try:
             path = RunwayConfig.find_config_file(self.root_dir)
             self.root_dir = path.parent
@@ -112,6 +118,8 @@ class CliContext:
             RunwayContext
 
         """
+        from ..context import RunwayContext  # noqa: PLC0415
+
         return RunwayContext(
             deploy_environment=deploy_environment or self.env,
             work_dir=self.runway_config_path.parent / ".runway",
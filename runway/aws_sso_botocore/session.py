@@ -19,8 +19,21 @@ from .credentials import create_credential_resolver
 class Session(BotocoreSession):
     """Extends the botocore session to support AWS SSO."""
 
+    def __init__(self, *args, credential_cache=None, **kwargs):
+        """Instantiate class.
+
+        Args:
+            credential_cache: Cache used by credential fetchers (assume role,
+                AWS SSO) so credentials can be shared between sessions.
+
+        """
+        self._credential_cache = credential_cache
+        super().__init__(*args, **kwargs)
+
     def _create_credential_resolver(self):
         """Replace the parent method with one that includes AWS SSO support."""
         return create_credential_resolver(
-            self, region_name=self._last_client_region_used
+            self,
+            cache=self._credential_cache,
+            region_name=self._last_client_region_used,
         )
@@ -2,20 +2,32 @@
 
 from __future__ import annotations
 
+import json
 import logging
 import os
 import sys
 import threading
+import time
 from typing import TYPE_CHECKING, Any, Callable, ClassVar
 
 import botocore.exceptions
 
+from ...constants import TRUTHY_VALUES
+from ...utils import (
+    RATE_LIMITER,
+    file_lock,
+    get_cache_dir,
+    read_json_file,
+    write_file_atomic,
+)
 from ..dag import ThreadedWalker, UnlimitedSemaphore, walk
 from ..exceptions import CfnginBucketNotFound, PlanFailed
 from ..plan import Graph, Plan, Step, merge_graphs
 from ..utils import ensure_s3_bucket, get_s3_endpoint, stack_template_key_name
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from mypy_boto3_s3.client import S3Client
 
     from ...context import CfnginContext
@@ -79,6 +91,16 @@ def stack_template_url(bucket_name: str, blueprint: Blueprint, endpoint: str) ->
     return f"{endpoint}/{bucket_name}/{stack_template_key_name(blueprint)}"
 
 
+def stack_template_prefix(stack: Stack) -> str:
+    """Produce the S3 key prefix where templates of a stack are stored.
+
+    Args:
+        stack: The stack to create the prefix for.
+
+    """
+    return f"stack_templates/{stack.fqn}/"
+
+
 class BaseAction:
     """Actions perform the actual work of each Command.
 
@@ -88,6 +110,8 @@ class BaseAction:
     Attributes:
         DESCRIPTION: Description used when creating a plan for an action.
         NAME: Name of the action.
+        TEMPLATE_INDEX_TTL: Seconds a template in the persisted template index
+            is trusted before it must be found by listing the bucket again.
         bucket_name: S3 bucket used by the action.
         bucket_region: AWS region where S3 bucket is located.
         cancel: Cancel handler.
@@ -95,11 +119,14 @@ class BaseAction:
         provider_builder: An object that will build a provider that will be
             interacted with in order to perform the necessary actions.
         s3_conn: Boto3 S3 client.
+        template_index: Keys of templates known to exist in the S3 bucket.
+            ``None`` until :meth:`build_template_index` has been called.
 
     """
 
     DESCRIPTION: ClassVar[str] = "Base action"
     NAME: ClassVar[str | None] = None
+    TEMPLATE_INDEX_TTL: ClassVar[int] = 86400
 
     bucket_name: str | None
     bucket_region: str | None
@@ -107,6 +134,7 @@ class BaseAction:
     context: CfnginContext
     provider_builder: ProviderBuilder | None
     s3_conn: S3Client
+    template_index: set[str] | None
 
     def __init__(
         self,
@@ -131,12 +159,30 @@ class BaseAction:
         if not self.bucket_region and provider_builder:
             self.bucket_region = provider_builder.region
         self.s3_conn = self.context.s3_client
+        self.template_index = None
+        self._template_index_built = threading.Event()
+        self._template_index_build_lock = threading.Lock()
+        self._template_index_lock = threading.Lock()
 
     @property
     def _stack_action(self) -> Callable[..., Any]:
         """Run against a step."""
         raise NotImplementedError
 
+    @property
+    def _template_index_path(self) -> Path | None:
+        """Path to the persisted template index if it is enabled."""
+        if not self.bucket_name:
+            return None
+        if (
+            self.context.env.vars.get("RUNWAY_CFNGIN_TEMPLATE_INDEX", "").lower()
+            not in TRUTHY_VALUES
+        ):
+            return None
+        return (
+            get_cache_dir(self.context.env.vars) / "cfngin_templates" / f"{self.bucket_name}.json"
+        )
+
     @property
     def provider(self) -> Provider:
         """Return a generic provider using the default region.
@@ -154,6 +200,47 @@ class BaseAction:
             raise ValueError("ProviderBuilder required to build a provider")
         return self.provider_builder.build()
 
+    def build_template_index(self, stacks: list[Stack]) -> None:
+        """Find the templates of stacks that already exist in the S3 bucket.
+
+        Rather than checking for each template as it is pushed, the
+        ``stack_templates/<fqn>/`` prefix of each stack is listed. If the index
+        has been persisted locally, listing is skipped entirely when it contains
+        at least one template of every stack. Templates missing from it are
+        pushed as usual.
+
+        If the bucket can't be listed, templates will be checked individually.
+
+        Args:
+            stacks: Stacks whose templates will be pushed.
+
+        """
+        if not self.bucket_name or not stacks:
+            return
+        prefixes = sorted({stack_template_prefix(stack) for stack in stacks})
+        index = self._load_template_index()
+        if index and all(any(key.startswith(prefix) for key in index) for prefix in prefixes):
+            LOGGER.debug("using local template index for bucket %s", self.bucket_name)
+            with self._template_index_lock:
+                self.template_index = index
+            return
+        index = set()
+        LOGGER.debug("listing templates of %s stack(s) in %s", len(prefixes), self.bucket_name)
+        try:
+            paginator = self.s3_conn.get_paginator("list_objects_v2")
+            for prefix in prefixes:
+                for page in paginator.paginate(Bucket=self.bucket_name, Prefix=prefix):
+                    index.update(obj["Key"] for obj in page.get("Contents", []) if "Key" in obj)
+        except botocore.exceptions.ClientError as err:
+            LOGGER.debug(
+                "unable to list templates in bucket %s; templates will be checked individually: %s",
+                self.bucket_name,
+                err,
+            )
+            return
+        with self._template_index_lock:
+            self.template_index = index
+
     def ensure_cfn_bucket(self) -> None:
         """CloudFormation bucket where templates will be stored."""
         if self.bucket_name:
@@ -164,6 +251,7 @@ class BaseAction:
 
     def execute(self, **kwargs: Any) -> None:
         """Run the action with pre and post steps."""
+        RATE_LIMITER.reset_stats()
         try:
             self.pre_run(**kwargs)
             self.run(**kwargs)
@@ -171,6 +259,8 @@ class BaseAction:
         except PlanFailed as err:
             LOGGER.error(str(err))
             sys.exit(1)
+        finally:
+            RATE_LIMITER.log_stats(LOGGER)
 
     def pre_run(self, *, dump: bool | str = False, outline: bool = False, **__kwargs: Any) -> None:
         """Perform steps before running the action."""
@@ -196,7 +286,9 @@ class BaseAction:
         """Push the rendered blueprint's template to S3.
 
         Verifies that the template doesn't already exist in S3 before
-        pushing.
+        pushing. The first push builds an index of existing templates for all
+        stacks (see :meth:`build_template_index`) so the bucket doesn't need to
+        be checked for each template individually.
 
         Returns:
             URL to the template in S3.
@@ -206,13 +298,18 @@ class BaseAction:
             raise ValueError("bucket_name required")
         key_name = stack_template_key_name(blueprint)
         template_url = self.stack_template_url(blueprint)
-        try:
-            template_exists = bool(self.s3_conn.head_object(Bucket=self.bucket_name, Key=key_name))
-        except botocore.exceptions.ClientError as err:
-            if err.response["Error"]["Code"] == "404":
-                template_exists = False
-            else:
-                raise
+        if not self._template_index_built.is_set():
+            with self._template_index_build_lock:
+                if not self._template_index_built.is_set():
+                    try:
+                        self.build_template_index(self.context.stacks)
+                    finally:
+                        self._template_index_built.set()
+        with self._template_index_lock:
+            template_index = self.template_index
+            template_exists = template_index is not None and key_name in template_index
+        if template_index is None:
+            template_exists = self._template_exists(key_name)
 
         if template_exists and not force:
             LOGGER.debug("CloudFormation template already exists: %s", template_url)
@@ -224,9 +321,59 @@ class BaseAction:
             ServerSideEncryption="AES256",
             ACL="bucket-owner-full-control",
         )
+        if template_index is not None:
+            with self._template_index_lock:
+                template_index.add(key_name)
         LOGGER.debug("blueprint %s pushed to %s", blueprint.name, template_url)
         return template_url
 
+    def _template_exists(self, key_name: str) -> bool:
+        """Check if a template exists in the CFNgin bucket."""
+        try:
+            return bool(self.s3_conn.head_object(Bucket=self.bucket_name, Key=key_name))
+        except botocore.exceptions.ClientError as err:
+            if err.response["Error"]["Code"] == "404":
+                return False
+            raise
+
+    def save_template_index(self) -> None:
+        """Persist the template index locally if enabled.
+
+        The persisted index is merged with any index written by another
+        process since it was loaded.
+
+        """
+        path = self._template_index_path
+        if not path or self.template_index is None:
+            return
+        now = time.time()
+        with file_lock(path.with_suffix(".lock")):
+            keys = self._read_template_index(path)
+            with self._template_index_lock:
+                keys.update(dict.fromkeys(self.template_index, now))
+            write_file_atomic(path, json.dumps({"keys": keys}, indent=2, sort_keys=True))
+
+    def _load_template_index(self) -> set[str]:
+        """Load the persisted template index if enabled."""
+        path = self._template_index_path
+        if not path:
+            return set()
+        with file_lock(path.with_suffix(".lock"), shared=True):
+            return set(self._read_template_index(path))
+
+    @classmethod
+    def _read_template_index(cls, path: Path) -> dict[str, float]:
+        """Read a persisted template index, excluding expired entries."""
+        data = read_json_file(path)
+        if not isinstance(data, dict) or not isinstance(data.get("keys"), dict):
+            return {}
+        oldest = time.time() - cls.TEMPLATE_INDEX_TTL
+        return {
+            key: timestamp
+            for key, timestamp in data["keys"].items()
+            if isinstance(timestamp, (int, float)) and timestamp > oldest
+        }
+
     def stack_template_url(self, blueprint: Blueprint) -> str:
         """S3 URL for CloudFormation template object."""
         if not self.bucket_name:
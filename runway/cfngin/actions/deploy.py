@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
 from typing import TYPE_CHECKING, Any, Callable
 
@@ -12,6 +14,7 @@ from ..exceptions import (
     StackDidNotChange,
     StackDoesNotExist,
 )
+from ..hooks.utils import build_hook_steps, is_scheduled_hook
 from ..hooks.utils import handle_hooks as _handle_hooks
 from ..plan import Graph, Plan, Step
 from ..providers.base import Template
@@ -47,11 +50,42 @@ LOGGER = logging.getLogger(__name__)
 
 DESTROYED_STATUS = CompleteStatus("stack destroyed")
 DESTROYING_STATUS = SubmittedStatus("submitted for destruction")
+FINGERPRINT_TAG = "cfngin_deploy_fingerprint"
 
 
-def build_stack_tags(stack: Stack) -> list[TagTypeDef]:
-    """Build a common set of tags to attach to a stack."""
-    return [{"Key": t[0], "Value": t[1]} for t in stack.tags.items()]
+def build_stack_fingerprint(stack: Stack, *, service_role: str | None = None) -> str:
+    """Build a fingerprint of everything that would be submitted for a stack.
+
+    The stack must be resolved before calling this.
+
+    Args:
+        stack: The stack object to fingerprint.
+        service_role: IAM role that CloudFormation will use.
+
+    """
+    data = {
+        "parameters": _resolve_parameters(stack.parameter_values, stack.blueprint),
+        "service_role": service_role,
+        "stack_policy": stack.stack_policy,
+        "tags": stack.tags,
+        "template": stack.blueprint.rendered,
+        "termination_protection": stack.termination_protection,
+    }
+    return hashlib.sha256(json.dumps(data, default=str, sort_keys=True).encode()).hexdigest()
+
+
+def build_stack_tags(stack: Stack, fingerprint: str | None = None) -> list[TagTypeDef]:
+    """Build a common set of tags to attach to a stack.
+
+    Args:
+        stack: The stack object to build tags for.
+        fingerprint: Fingerprint of the stack to include as a tag.
+
+    """
+    tags: list[TagTypeDef] = [{"Key": t[0], "Value": t[1]} for t in stack.tags.items()]
+    if fingerprint:
+        tags.append({"Key": FINGERPRINT_TAG, "Value": fingerprint})
+    return tags
 
 
 def should_update(stack: Stack) -> bool:
@@ -412,10 +446,20 @@ class Action(BaseAction):
         LOGGER.debug("%s:resolving stack", stack.fqn)
         stack.resolve(self.context, self.provider)
 
+        fingerprint = self._fingerprint(stack, provider)
+        if (
+            provider_stack
+            and not recreate
+            and self._fingerprint_matches(provider, provider_stack, fingerprint)
+        ):
+            LOGGER.debug("%s:deploy fingerprint matches the existing stack", stack.fqn)
+            stack.set_outputs(provider.get_output_dict(provider_stack))
+            return DidNotChangeStatus()
+
         LOGGER.debug("%s:launching stack now", stack.fqn)
         template = self._template(stack.blueprint)
         stack_policy = self._stack_policy(stack)
-        tags = build_stack_tags(stack)
+        tags = build_stack_tags(stack, fingerprint)
         parameters = self.build_parameters(stack, provider_stack)
         force_change_set = stack.blueprint.requires_change_set
 
@@ -478,6 +522,33 @@ class Action(BaseAction):
         """Run against a step."""
         return self._launch_stack
 
+    def _fingerprint(self, stack: Stack, provider: Provider) -> str | None:
+        """Build the fingerprint of a resolved stack if enabled."""
+        if not self.context.config.deploy_fingerprint:
+            return None
+        return build_stack_fingerprint(stack, service_role=provider.service_role)
+
+    @staticmethod
+    def _fingerprint_matches(
+        provider: Provider, provider_stack: StackTypeDef, fingerprint: str | None
+    ) -> bool:
+        """Whether an existing stack was last deployed with the same fingerprint.
+
+        Args:
+            provider: CFNgin provider.
+            provider_stack: An existing CloudFormation stack.
+            fingerprint: Fingerprint of the stack being deployed.
+
+        """
+        if not fingerprint or not provider.is_stack_completed(provider_stack):
+            return False
+        if provider.is_stack_destroyed(provider_stack):
+            return False
+        return any(
+            tag["Key"] == FINGERPRINT_TAG and tag["Value"] == fingerprint
+            for tag in provider.get_stack_tags(provider_stack)
+        )
+
     def _template(self, blueprint: Blueprint) -> Template:
         """Generate a template based on whether or not an S3 bucket is set.
 
@@ -545,13 +616,38 @@ class Action(BaseAction):
 
         return Plan(context=self.context, description=self.DESCRIPTION, graph=graph)
 
+    def _serial_hooks(
+        self, hooks: list[CfnginHookDefinitionModel]
+    ) -> list[CfnginHookDefinitionModel]:
+        """Get the hooks that run before/after every stack rather than alongside them.
+
+        All hooks are run before/after every stack when specific stacks are
+        targeted.
+
+        """
+        if self.context.stack_names:
+            return hooks
+        return [hook for hook in hooks if not is_scheduled_hook(hook)]
+
+    def _schedule_hooks(self, plan: Plan) -> None:
+        """Add the hooks that are scheduled alongside stacks to a plan."""
+        if self.context.stack_names:
+            return
+        hooks = {
+            "pre_deploy": self.context.config.pre_deploy,
+            "post_deploy": self.context.config.post_deploy,
+        }
+        if not any(is_scheduled_hook(hook) for stage in hooks.values() for hook in stage):
+            return
+        plan.graph.add_steps(build_hook_steps(hooks, self.provider, self.context))
+
     def pre_run(self, *, dump: bool | str = False, outline: bool = False, **_: Any) -> None:
         """Any steps that need to be taken prior to running the action."""
         if should_ensure_cfn_bucket(outline, bool(dump)):
             self.ensure_cfn_bucket()
         handle_hooks(
             "pre_deploy",
-            self.context.config.pre_deploy,
+            self._serial_hooks(self.context.config.pre_deploy),
             self.provider,
             self.context,
             dump=bool(dump),
@@ -589,6 +685,7 @@ class Action(BaseAction):
         if not plan.keys():
             LOGGER.warning("no stacks detected (error in config?)")
         if not outline and not dump:
+            self._schedule_hooks(plan)
             plan.outline(logging.DEBUG)
             self.context.lock_persistent_graph(plan.lock_code)
             LOGGER.debug("launching stacks: %s", ", ".join(plan.keys()))
@@ -598,6 +695,7 @@ class Action(BaseAction):
             finally:
                 # always unlock the graph at the end
                 self.context.unlock_persistent_graph(plan.lock_code)
+                self.save_template_index()
         if outline:
             plan.outline()
         if isinstance(dump, str):
@@ -607,7 +705,7 @@ class Action(BaseAction):
         """Any steps that need to be taken after running the action."""
         handle_hooks(
             "post_deploy",
-            self.context.config.post_deploy,
+            self._serial_hooks(self.context.config.post_deploy),
             self.provider,
             self.context,
             dump=bool(dump),
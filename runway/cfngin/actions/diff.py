@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import concurrent.futures
+import json
 import logging
 import sys
 from operator import attrgetter
@@ -16,6 +18,7 @@ from typing import (
 
 from botocore.exceptions import ClientError
 
+from ...constants import TRUTHY_VALUES
 from ...core.providers.aws.s3 import Bucket
 from .. import exceptions
 from ..status import (
@@ -26,11 +29,19 @@ from ..status import (
     NotUpdatedStatus,
     SkippedStatus,
 )
+from ..utils import parse_cloudformation_template
 from . import deploy
 from .base import build_walker
 
 if TYPE_CHECKING:
+    import threading
+
+    from mypy_boto3_cloudformation.type_defs import ParameterTypeDef, StackTypeDef
+
     from ..._logging import RunwayLogger
+    from ...context import CfnginContext
+    from ...core.providers.aws.type_defs import TagTypeDef
+    from ..providers.aws.default import ProviderBuilder
     from ..stack import Stack
     from ..status import Status
 
@@ -171,6 +182,37 @@ def diff_parameters(
     return diff
 
 
+def diff_templates(
+    old_template: dict[str, Any], new_template: dict[str, Any]
+) -> list[DictValue[str, str]]:
+    """Compare the top-level sections of two CloudFormation templates.
+
+    Each section is normalized so that the order of keys does not matter.
+    If there are no changes, we return an empty list.
+
+    Args:
+        old_template: Parsed template currently deployed.
+        new_template: Parsed template that would be deployed.
+
+    Returns:
+        A list of differences.
+
+    """
+    changes, diff = diff_dictionaries(
+        {
+            key: json.dumps(value, default=str, sort_keys=True)
+            for key, value in old_template.items()
+        },
+        {
+            key: json.dumps(value, default=str, sort_keys=True)
+            for key, value in new_template.items()
+        },
+    )
+    if changes == 0:
+        return []
+    return [value for value in diff if value.status() is not DictValue.UNMODIFIED]
+
+
 class Action(deploy.Action):
     """Responsible for diffing CloudFormation stacks in AWS and locally.
 
@@ -186,11 +228,116 @@ class Action(deploy.Action):
     DESCRIPTION = "Diff stacks"
     NAME = "diff"
 
+    _deployed_stacks: dict[
+        str, concurrent.futures.Future[tuple[StackTypeDef, dict[str, Any], dict[str, Any]] | None]
+    ]
+
+    def __init__(
+        self,
+        context: CfnginContext,
+        provider_builder: ProviderBuilder | None = None,
+        cancel: threading.Event | None = None,
+    ) -> None:
+        """Instantiate class.
+
+        Args:
+            context: The context for the current run.
+            provider_builder: An object that will build a provider that will be
+                interacted with in order to perform the necessary actions.
+            cancel: Cancel handler.
+
+        """
+        super().__init__(context, provider_builder, cancel)
+        self._deployed_stacks = {}
+
     @property
     def _stack_action(self) -> Callable[..., Status]:
         """Run against a step."""
         return self._diff_stack
 
+    @property
+    def local_diff(self) -> bool:
+        """Whether stacks are compared locally before creating a change set.
+
+        Enabled by ``RUNWAY_CFNGIN_LOCAL_DIFF``.
+
+        """
+        return self.context.env.vars.get("RUNWAY_CFNGIN_LOCAL_DIFF", "").lower() in TRUTHY_VALUES
+
+    def _fetch_deployed_stack(
+        self, fqn: str
+    ) -> tuple[StackTypeDef, dict[str, Any], dict[str, Any]] | None:
+        """Get a stack, its template, and its parameters from CloudFormation.
+
+        Args:
+            fqn: Fully qualified name of the stack.
+
+        Returns:
+            The stack, its parsed template, and its parameters or ``None`` if
+            the stack does not exist.
+
+        """
+        provider = self.build_provider()
+        try:
+            provider_stack = provider.get_stack(fqn)
+            if provider.is_stack_in_review(provider_stack):
+                return None
+            template, parameters = provider.get_stack_info(provider_stack)
+        except exceptions.StackDoesNotExist:
+            return None
+        return provider_stack, json.loads(template), parameters
+
+    def _matches_deployed_stack(
+        self, stack: Stack, parameters: list[ParameterTypeDef], tags: list[TagTypeDef]
+    ) -> bool:
+        """Whether a resolved stack matches what is currently deployed.
+
+        Only used when :attr:`local_diff` is enabled. Any difference, or
+        failure to get the deployed stack, results in a change set being
+        created to get the changes.
+
+        Args:
+            stack: Resolved stack.
+            parameters: Parameters that would be deployed.
+            tags: Tags that would be deployed.
+
+        """
+        future = self._deployed_stacks.get(stack.fqn)
+        if not future:
+            return False
+        try:
+            deployed = future.result()
+        except ClientError as err:
+            LOGGER.debug("%s:unable to get deployed stack: %s", stack.fqn, err)
+            return False
+        if not deployed:
+            return False
+        provider_stack, old_template, old_params = deployed
+        new_params = {
+            param["ParameterKey"]: param.get(
+                "ParameterValue", old_params.get(param["ParameterKey"])
+            )
+            for param in parameters
+        }
+        template_diff = diff_templates(
+            old_template, parse_cloudformation_template(stack.blueprint.rendered)
+        )
+        if template_diff:
+            LOGGER.debug(
+                "%s:template sections changed: %s",
+                stack.fqn,
+                ", ".join(value.key for value in template_diff),
+            )
+            return False
+        if diff_parameters(old_params, new_params):
+            LOGGER.debug("%s:parameters changed", stack.fqn)
+            return False
+        old_tags = {tag["Key"]: tag["Value"] for tag in provider_stack.get("Tags", [])}
+        if old_tags != {tag["Key"]: tag["Value"] for tag in tags}:
+            LOGGER.debug("%s:tags changed", stack.fqn)
+            return False
+        return True
+
     def _diff_stack(self, stack: Stack, **_: Any) -> Status:  # noqa: C901
         """Handle diffing a stack in CloudFormation vs our config."""
         if self.cancel.wait(0):
@@ -205,8 +352,6 @@ class Action(deploy.Action):
             stack.set_outputs(provider.get_outputs(stack.fqn))
             return NotUpdatedStatus()
 
-        tags = deploy.build_stack_tags(stack)
-
         try:
             provider_stack = provider.get_stack(stack.fqn)
         except exceptions.StackDoesNotExist:
@@ -214,7 +359,10 @@ class Action(deploy.Action):
 
         try:
             stack.resolve(self.context, provider)
+            tags = deploy.build_stack_tags(stack, self._fingerprint(stack, provider))
             parameters = self.build_parameters(stack, provider_stack)
+            if self._matches_deployed_stack(stack, parameters, tags):
+                raise exceptions.StackDidNotChange
             outputs = provider.get_stack_changes(
                 stack, self._template(stack.blueprint), parameters, tags
             )
@@ -262,7 +410,15 @@ class Action(deploy.Action):
         else:
             LOGGER.warning("no stacks detected (error in config?)")
         walker = build_walker(concurrency)
-        plan.execute(walker)
+        if not self.local_diff:
+            plan.execute(walker)
+            return
+        with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency or None) as executor:
+            self._deployed_stacks = {
+                stack.fqn: executor.submit(self._fetch_deployed_stack, stack.fqn)
+                for stack in self.context.stacks
+            }
+            plan.execute(walker)
 
     def pre_run(
         self,
@@ -19,6 +19,8 @@ from typing import TYPE_CHECKING, Any, cast
 
 import yaml
 
+from ..utils import YamlLoader, yaml_load
+
 if TYPE_CHECKING:
     from collections.abc import MutableMapping, MutableSequence
 
@@ -64,6 +66,13 @@ def intrinsics_multi_constructor(
     return {cfntag: value}
 
 
+class CfnYamlLoader(YamlLoader):
+    """Safe YAML loader that parses CloudFormation intrinsics."""
+
+
+CfnYamlLoader.add_multi_constructor("!", intrinsics_multi_constructor)
+
+
 def yaml_dump(dict_to_dump: dict[str, Any]) -> str:
     """Dump the dictionary as a YAML document."""
     return yaml.safe_dump(dict_to_dump, default_flow_style=False)
@@ -77,5 +86,4 @@ def yaml_parse(yamlstr: str) -> dict[str, Any]:
         # json parser.
         return json.loads(yamlstr)
     except ValueError:
-        yaml.SafeLoader.add_multi_constructor("!", intrinsics_multi_constructor)
-        return yaml.safe_load(yamlstr)
+        return yaml_load(yamlstr, loader=CfnYamlLoader)
@@ -5,23 +5,79 @@ from __future__ import annotations
 import hashlib
 import json
 import logging
+import os
 import sys
+import threading
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 
 from ...compat import cached_property
+from ...constants import TRUTHY_VALUES
+from ...utils import get_cache_dir
 from ..exceptions import InvalidConfig, UnresolvedBlueprintVariable
 from ..utils import parse_cloudformation_template
 from .base import Blueprint
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from ...context import CfnginContext
     from ...variables import Variable
 
 LOGGER = logging.getLogger(__name__)
 
+_JINJA_ENVIRONMENTS: dict[tuple[Path, Path | None], Environment] = {}
+_JINJA_ENVIRONMENTS_LOCK = threading.Lock()
+
+
+def get_jinja_bytecode_cache_dir(environ: Mapping[str, str] | None = None) -> Path | None:
+    """Get the directory where compiled Jinja templates are cached between runs.
+
+    Args:
+        environ: Environment variables. If not provided, ``os.environ`` is used.
+
+    Returns:
+        Path to the directory or None if the cache is not enabled.
+
+    """
+    environ = os.environ if environ is None else environ
+    if environ.get("RUNWAY_JINJA_BYTECODE_CACHE", "").lower() not in TRUTHY_VALUES:
+        return None
+    return get_cache_dir(environ) / "jinja2"
+
+
+def get_jinja_environment(
+    searchpath: Path, *, bytecode_cache_dir: Path | None = None
+) -> Environment:
+    """Get the Jinja environment used to render raw templates in a directory.
+
+    Environments are shared by all blueprints so that each template is only
+    compiled once per process, no matter how many stacks use it.
+
+    Args:
+        searchpath: Directory containing the templates.
+        bytecode_cache_dir: Directory used to cache compiled templates between
+            runs. Compiled templates are only cached in memory if not provided
+            or if it can't be created.
+
+    """
+    key = (searchpath.resolve(), bytecode_cache_dir)
+    with _JINJA_ENVIRONMENTS_LOCK:
+        if key not in _JINJA_ENVIRONMENTS:
+            bytecode_cache = None
+            if bytecode_cache_dir:
+                try:
+                    bytecode_cache_dir.mkdir(parents=True, exist_ok=True)
+                    bytecode_cache = FileSystemBytecodeCache(str(bytecode_cache_dir))
+                except OSError as exc:
+                    LOGGER.debug("unable to create jinja2 bytecode cache directory: %s", exc)
+            _JINJA_ENVIRONMENTS[key] = Environment(  # noqa: S701
+                bytecode_cache=bytecode_cache, loader=FileSystemLoader(searchpath=key[0])
+            )
+        return _JINJA_ENVIRONMENTS[key]
+
 
 def get_template_path(file_path: Path) -> Path | None:
     """Find raw template in working directory or in sys.path.
@@ -161,8 +217,9 @@ class RawTemplateBlueprint(Blueprint):
             if template_path:
                 if template_path.suffix == ".j2":
                     self._rendered = (
-                        Environment(  # noqa: S701
-                            loader=FileSystemLoader(searchpath=template_path.parent)
+                        get_jinja_environment(
+                            template_path.parent,
+                            bytecode_cache_dir=get_jinja_bytecode_cache_dir(self.context.env.vars),
                         )
                         .get_template(template_path.name)
                         .render(
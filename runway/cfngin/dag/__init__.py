@@ -5,6 +5,7 @@ from __future__ import annotations
 import collections
 import collections.abc
 import contextlib
+import contextvars
 import logging
 from collections import OrderedDict
 from copy import copy, deepcopy
@@ -449,7 +450,11 @@ class ThreadedWalker:
                     self.semaphore.release()
 
             deps = dag.all_downstreams(node)
-            threads[node] = Thread(target=_fn, args=(node, deps), name=node)
+            # run in a copy of the current context so context variables
+            # (e.g. the scope of API call statistics) are inherited
+            threads[node] = Thread(
+                target=contextvars.copy_context().run, args=(_fn, node, deps), name=node
+            )
 
         # Start up all of the threads.
         for node in nodes:
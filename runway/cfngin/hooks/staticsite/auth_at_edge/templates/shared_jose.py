@@ -5,12 +5,23 @@ import codecs
 import json
 import logging
 import re
+import time
 from urllib import request
 
 from jose import jwt
 
 LOGGER = logging.getLogger(__name__)
 
+# Number of seconds that signing keys retrieved from a JWKS endpoint are reused.
+JWKS_CACHE_TTL = 3600
+# Minimum number of seconds between refreshes triggered by an unknown key id.
+JWKS_REFRESH_MIN_INTERVAL = 60
+
+# Module level so that it persists between warm invocations of the Lambda
+# function. Maps a JWKS URI to the time the keys were fetched and a mapping of
+# key id to PEM encoded public key.
+_JWKS_CACHE = {}
+
 
 def prepad_signed(hex_str):
     """Given a hexadecimal string prepad with 00 if not within range.
@@ -196,17 +207,49 @@ def is_rsa_signing_key(key):
     return "rsaPublicKey" in key
 
 
+def fetch_signing_keys(jwks_uri):
+    """Fetch the signing keys from the JWKS uri and store them in the cache.
+
+    Args:
+        jwks_uri (str): The URI in which to retrieve the JWKs.
+
+    Returns:
+        dict[str, str]: Mapping of key id to public key.
+
+    """
+    client = JwksClient({"jwks_uri": jwks_uri})
+    keys = {
+        jwk["kid"]: jwk.get("rsaPublicKey") if is_rsa_signing_key(jwk) else jwk.get("publicKey")
+        for jwk in client.get_signing_keys()
+    }
+    _JWKS_CACHE[jwks_uri] = {"fetched_at": time.time(), "keys": keys}
+    return keys
+
+
 def get_signing_key(jwks_uri, kid):
     """Retrieve the signing keys from the JWKS uri that match the key id specified.
 
+    Keys are cached for ``JWKS_CACHE_TTL`` seconds. If the key id is not found
+    in the cache, the keys are refreshed (at most once every
+    ``JWKS_REFRESH_MIN_INTERVAL`` seconds) to support key rotation.
+
     Args:
         jwks_uri (str): The URI in which to retrieve the JWKs.
         kid (str): Key ID of the signing key we are looking for.
 
     """
-    client = JwksClient({"jwks_uri": jwks_uri})
-    jwk = client.get_signing_key(kid)
-    return jwk.get("rsaPublicKey") if is_rsa_signing_key(jwk) else jwk.get("publicKey")
+    now = time.time()
+    cached = _JWKS_CACHE.get(jwks_uri)
+    if cached and now - cached["fetched_at"] < JWKS_CACHE_TTL:
+        if kid in cached["keys"]:
+            return cached["keys"][kid]
+        if now - cached["fetched_at"] < JWKS_REFRESH_MIN_INTERVAL:
+            raise Exception(f"Was not able to locate a key with kid {kid}")
+    LOGGER.info("Fetching signing key for %s", kid)
+    keys = fetch_signing_keys(jwks_uri)
+    if kid not in keys:
+        raise Exception(f"Was not able to locate a key with kid {kid}")
+    return keys[kid]
 
 
 def validate_jwt(jwt_token, jwks_uri, issuer, audience):
@@ -9,6 +9,7 @@ import os
 import time
 from operator import itemgetter
 from typing import TYPE_CHECKING, Any, cast
+from urllib.parse import quote
 
 import yaml
 
@@ -18,7 +19,7 @@ from ....utils import JsonEncoder
 from ..base import HookArgsBaseModel
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Iterable, Iterator
 
     from boto3.session import Session
     from mypy_boto3_s3.type_defs import ListObjectsV2OutputTypeDef
@@ -26,6 +27,18 @@ if TYPE_CHECKING:
     from ....context import CfnginContext
 
 LOGGER = logging.getLogger(__name__)
+INVALIDATION_MAX_PATHS = 3000
+"""Max number of paths invalidated before they are collapsed into wildcards.
+
+This is the CloudFront quota for file paths in active invalidations.
+
+"""
+INVALIDATION_MAX_WILDCARDS = 15
+"""Max number of wildcard paths invalidated before the whole distribution is invalidated.
+
+This is the CloudFront quota for wildcard paths in active invalidations.
+
+"""
 
 
 class HookArgs(HookArgsBaseModel):
@@ -43,12 +56,19 @@ class HookArgs(HookArgsBaseModel):
     distribution_id: str = "undefined"
     """CloudFront distribution ID."""
 
-    distribution_path: str = "/*"
-    """Path in the CloudFront distribution to invalidate."""
+    distribution_path: str | None = None
+    """Path in the CloudFront distribution to invalidate.
+
+    If not provided, only the paths of objects that were changed are invalidated.
+
+    """
 
     extra_files: list[RunwayStaticSiteExtraFileDataModel] = []
     """Extra files to sync to the S3 bucket."""
 
+    rewrite_directory_index: str | None = None
+    """Index document served by the CloudFront distribution for directory paths."""
+
     website_url: str | None = None
     """S3 bucket website URL."""
 
@@ -88,36 +108,47 @@ def sync(context: CfnginContext, *__args: Any, **kwargs: Any) -> bool:
     build_context = context.hook_data["staticsite"]
     invalidate_cache = False
 
-    synced_extra_files = sync_extra_files(
+    changed_keys = sync_extra_files(
         context,
         args.bucket_name,
         args.extra_files,
         hash_tracking_parameter=build_context.get("hash_tracking_parameter"),
     )
 
-    if synced_extra_files:
+    if changed_keys:
         invalidate_cache = True
 
     if build_context["deploy_is_current"]:
         LOGGER.info("skipped upload; latest version already deployed")
     else:
         bucket = Bucket(context, args.bucket_name)
-        bucket.sync_from_local(
-            build_context["app_directory"],
-            delete=True,
-            exclude=[f.name for f in args.extra_files if f.name],
+        changed_keys.extend(
+            bucket.sync_from_local(
+                build_context["app_directory"],
+                delete=True,
+                exclude=[f.name for f in args.extra_files if f.name],
+            )
         )
         invalidate_cache = True
 
     if args.cf_disabled:
         LOGGER.info("STATIC WEBSITE URL: %s", args.website_url)
-    elif invalidate_cache:
+    elif args.distribution_path and invalidate_cache:
         invalidate_distribution(
             session,
             identifier=args.distribution_id,
             domain=args.distribution_domain,
             path=args.distribution_path,
         )
+    elif changed_keys:
+        invalidate_distribution(
+            session,
+            identifier=args.distribution_id,
+            domain=args.distribution_domain,
+            paths=get_invalidation_paths(changed_keys, index_document=args.rewrite_directory_index),
+        )
+    elif invalidate_cache:
+        LOGGER.info("skipped CloudFront invalidation; content of all objects is unchanged")
 
     LOGGER.info("sync complete")
 
@@ -155,12 +186,53 @@ def update_ssm_hash(context: CfnginContext, session: Session) -> bool:
     return True
 
 
+def get_invalidation_paths(
+    keys: Iterable[str],
+    *,
+    index_document: str | None = None,
+    max_paths: int = INVALIDATION_MAX_PATHS,
+    max_wildcards: int = INVALIDATION_MAX_WILDCARDS,
+) -> list[str]:
+    """Get the paths to invalidate in a CloudFront distribution for S3 object keys.
+
+    The default root object (``index.html``) is also invalidated by ``/`` and
+    an index document by the path of its directory.
+    If there would be too many paths, the deepest paths are collapsed into
+    wildcards for their parent directory until under the limits.
+
+    Args:
+        keys: S3 object keys.
+        index_document: Index document served for directory paths.
+            If not provided, only the default root object is served for a directory.
+        max_paths: Max number of paths.
+        max_wildcards: Max number of wildcard paths.
+
+    """
+    paths: set[str] = set()
+    for key in keys:
+        paths.add(f"/{quote(key)}")
+        if key == "index.html":
+            paths.add("/")
+        if index_document and (key == index_document or key.endswith(f"/{index_document}")):
+            paths.add(f"/{quote(key.removesuffix(index_document))}")
+    level = max((i.count("/") for i in paths), default=0)
+    while level > 0 and (
+        len(paths) > max_paths or sum(i.endswith("*") for i in paths) > max_wildcards
+    ):
+        level -= 1
+        paths = {
+            "/".join(i.split("/")[: level + 1]) + "/*" if i.count("/") > level else i for i in paths
+        }
+    return sorted(paths)
+
+
 def invalidate_distribution(
     session: Session,
     *,
     domain: str = "undefined",
     identifier: str,
     path: str = "/*",
+    paths: list[str] | None = None,
     **_: Any,
 ) -> bool:
     """Invalidate the current distribution.
@@ -170,14 +242,23 @@ def invalidate_distribution(
         domain: The distribution domain.
         identifier: The distribution id.
         path: The distribution path.
+        paths: Multiple distribution paths. Takes precedence over ``path``.
 
     """
+    items = paths or [path]
     LOGGER.info("invalidating CloudFront distribution: %s (%s)", identifier, domain)
+    LOGGER.info(
+        "invalidating %s path(s): %s%s",
+        len(items),
+        ", ".join(items[:10]),
+        f", ... ({len(items) - 10} more)" if len(items) > 10 else "",
+    )
+    LOGGER.debug("invalidation paths: %s", items)
     cf_client = session.client("cloudfront")
     cf_client.create_invalidation(
         DistributionId=identifier,
         InvalidationBatch={
-            "Paths": {"Quantity": 1, "Items": [path]},
+            "Paths": {"Quantity": len(items), "Items": items},
             "CallerReference": str(time.time()),
         },
     )
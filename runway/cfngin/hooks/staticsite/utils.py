@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import collections
+import concurrent.futures
 import hashlib
 import logging
 import os
@@ -10,7 +12,7 @@ from typing import TYPE_CHECKING, cast
 
 import igittigitt
 
-from ....utils import FileHash, change_dir
+from ....utils import change_dir
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
@@ -18,11 +20,16 @@ if TYPE_CHECKING:
     from _typeshed import StrPath
 
 LOGGER = logging.getLogger(__name__)
+HASH_MAX_WORKERS = 8
+"""Max number of files read at once when calculating a hash of files."""
 
 
 def calculate_hash_of_files(files: Iterable[StrPath], root: Path) -> str:
     """Return a hash of all of the given files at the given root.
 
+    Files are read concurrently but added to the hash in sorted order so
+    the result is the same as adding each file sequentially.
+
     Args:
         files: file names to include in the hash calculation, relative to ``root``.
         root: base directory to analyze files in.
@@ -31,16 +38,27 @@ def calculate_hash_of_files(files: Iterable[StrPath], root: Path) -> str:
         A hash of the hashes of the given files.
 
     """
-    file_hash = FileHash(hashlib.md5())  # noqa: S324
-    file_hash.add_files(sorted(str(f) for f in files), relative_to=root)
-    return file_hash.hexdigest
-
-
-def get_hash_of_files(
+    file_hash = hashlib.md5()  # noqa: S324
+    file_names = sorted(str(f) for f in files)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=HASH_MAX_WORKERS) as executor:
+        # limit the number of files held in memory while preserving order
+        pending: collections.deque[concurrent.futures.Future[bytes]] = collections.deque()
+        queued = iter(file_names)
+        for file_name in file_names:
+            while len(pending) < HASH_MAX_WORKERS * 2 and (next_name := next(queued, None)):
+                pending.append(executor.submit(Path(next_name).read_bytes))
+            file_hash.update(f"{Path(file_name).relative_to(root)}\0".encode())
+            file_hash.update(pending.popleft().result())
+            # end of file contents; only necessary with multiple files
+            file_hash.update(b"\0")
+    return file_hash.hexdigest()
+
+
+def get_files_to_hash(
     root_path: Path,
     directories: list[dict[str, list[str] | str | None]] | None = None,
-) -> str:
-    """Generate md5 hash of files.
+) -> list[Path]:
+    """Get the files that are included when generating a hash of files.
 
     Args:
         root_path: Base directory where all paths will be relative to.
@@ -48,10 +66,13 @@ def get_hash_of_files(
         directories: List of mappings that describe the paths to hash and files
             to exclude.
 
+    Returns:
+        Resolved paths of files that are not ignored.
+
     """
     directories = directories or [{"path": "./"}]
 
-    files_to_hash: list[StrPath] = []
+    files_to_hash: list[Path] = []
     for i in directories:
         gitignore = get_ignorer(
             root_path / cast("str", i["path"]),
@@ -59,18 +80,34 @@ def get_hash_of_files(
         )
 
         with change_dir(root_path):
-            for root, dirs, files in os.walk(cast("str", i["path"]), topdown=True):
+            top = cast("str", i["path"])
+            if top != "./" and gitignore.match(Path(top).resolve()):
+                continue
+            for root, dirs, files in os.walk(top, topdown=True):
                 sub_root = Path(root).resolve()
-                if root != "./" and gitignore.match(sub_root):
-                    dirs[:] = []
-                    files[:] = []
-                else:
-                    for filename in files:
-                        filepath = sub_root / filename
-                        if not gitignore.match(filepath):
-                            files_to_hash.append(filepath)
-
-    return calculate_hash_of_files(files_to_hash, root_path)
+                # prune ignored directories before descending into them
+                dirs[:] = [d for d in dirs if not gitignore.match(sub_root / d)]
+                for filename in files:
+                    filepath = sub_root / filename
+                    if not gitignore.match(filepath):
+                        files_to_hash.append(filepath)
+    return files_to_hash
+
+
+def get_hash_of_files(
+    root_path: Path,
+    directories: list[dict[str, list[str] | str | None]] | None = None,
+) -> str:
+    """Generate md5 hash of files.
+
+    Args:
+        root_path: Base directory where all paths will be relative to.
+            This should already be resolve to an absolute path.
+        directories: List of mappings that describe the paths to hash and files
+            to exclude.
+
+    """
+    return calculate_hash_of_files(get_files_to_hash(root_path, directories), root_path)
 
 
 def get_ignorer(
@@ -10,15 +10,25 @@ from typing import TYPE_CHECKING, Annotated, Any
 
 import pydantic
 
+from ...config.models.cfngin import CfnginStackDefinitionModel
 from ...exceptions import FailedVariableLookup
+from ...lookups.handlers.cfn import CfnLookup
 from ...utils import BaseModel, load_object_from_string
 from ...variables import Variable, resolve_variables
 from ..blueprints.base import Blueprint
+from ..lookups.handlers.hook_data import HookDataLookup
+from ..plan import Step
+from ..stack import Stack
+from ..status import COMPLETE, FailedStatus
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping
+
     from ...config.models.cfngin import CfnginHookDefinitionModel
     from ...context import CfnginContext
+    from ...variables import VariableValueLookup
     from ..providers.aws.default import Provider
+    from ..status import Status
 
 LOGGER = logging.getLogger(__name__)
 
@@ -45,8 +55,7 @@ def full_path(path: str) -> str:
     return str(Path(path).absolute())
 
 
-# TODO (kyle): split up to reduce number of statements
-def handle_hooks(  # noqa: C901, PLR0912, PLR0915
+def handle_hooks(
     stage: str,
     hooks: list[CfnginHookDefinitionModel],
     provider: Provider,
@@ -77,62 +86,227 @@ def handle_hooks(  # noqa: C901, PLR0912, PLR0915
 
     LOGGER.info("executing %s hooks: %s", stage, ", ".join(hook_paths))
     for hook in hooks:
-        if not hook.enabled:
-            LOGGER.debug("hook with method %s is disabled; skipping", hook.path)
-            continue
+        if not run_hook(stage, hook, provider, context):
+            sys.exit(1)
 
-        try:
-            method = load_object_from_string(hook.path, try_reload=True)
-        except (AttributeError, ImportError):
-            LOGGER.exception("unable to load method at %s", hook.path)
-            if hook.required:
-                raise
-            continue
-
-        if hook.args:
-            args = [Variable(k, v) for k, v in hook.args.items()]
-            try:  # handling for output or similar being used in pre_deploy
-                resolve_variables(args, context, provider)
-            except FailedVariableLookup:
-                if "pre" in stage:
-                    LOGGER.error(
-                        "lookups that change the order of execution, like "
-                        '"output", can only be used in "post_*" hooks; '
-                        "please ensure that the hook being used does "
-                        "not rely on a stack, hook_data, or context that "
-                        "does not exist yet"
-                    )
-                raise
-            kwargs: dict[str, Any] = {v.name: v.value for v in args}
-        else:
-            kwargs = {}
 
-        try:
-            if isinstance(method, type):
-                result: Any = getattr(method(context=context, provider=provider, **kwargs), stage)()
-            else:
-                result = method(context=context, provider=provider, **kwargs)
-        except Exception:
-            LOGGER.exception("hook %s threw an exception", hook.path)
-            if hook.required:
-                raise
-            continue
-
-        if not result:
-            if hook.required:
-                LOGGER.error("required hook %s failed; return value: %s", hook.path, result)
-                sys.exit(1)
-            LOGGER.warning("non-required hook %s failed; return value: %s", hook.path, result)
-        elif isinstance(result, (collections.abc.Mapping, pydantic.BaseModel)):
-            if hook.data_key:
-                LOGGER.debug(
-                    "adding result for hook %s to context in data_key %s",
-                    hook.path,
-                    hook.data_key,
-                )
-                context.set_hook_data(hook.data_key, result)
-            else:
-                LOGGER.debug(
-                    "hook %s returned result data but no data key set; ignoring",
-                    hook.path,
+def run_hook(  # noqa: C901, PLR0912
+    stage: str,
+    hook: CfnginHookDefinitionModel,
+    provider: Provider,
+    context: CfnginContext,
+) -> bool:
+    """Run a single hook.
+
+    Args:
+        stage: The current stage (pre_run, post_run, etc).
+        hook: Hook to execute.
+        provider: Provider instance.
+        context: Context instance.
+
+    Returns:
+        False if a required hook returned a falsy result, otherwise True.
+
+    """
+    if not hook.enabled:
+        LOGGER.debug("hook with method %s is disabled; skipping", hook.path)
+        return True
+
+    try:
+        method = load_object_from_string(hook.path, try_reload=True)
+    except (AttributeError, ImportError):
+        LOGGER.exception("unable to load method at %s", hook.path)
+        if hook.required:
+            raise
+        return True
+
+    if hook.args:
+        args = [Variable(k, v) for k, v in hook.args.items()]
+        try:  # handling for output or similar being used in pre_deploy
+            resolve_variables(args, context, provider)
+        except FailedVariableLookup:
+            if "pre" in stage and not is_scheduled_hook(hook):
+                LOGGER.error(
+                    "lookups that change the order of execution, like "
+                    '"output", can only be used in "post_*" hooks; '
+                    "please ensure that the hook being used does "
+                    "not rely on a stack, hook_data, or context that "
+                    "does not exist yet"
                 )
+            raise
+        kwargs: dict[str, Any] = {v.name: v.value for v in args}
+    else:
+        kwargs = {}
+
+    try:
+        if isinstance(method, type):
+            result: Any = getattr(method(context=context, provider=provider, **kwargs), stage)()
+        else:
+            result = method(context=context, provider=provider, **kwargs)
+    except Exception:
+        LOGGER.exception("hook %s threw an exception", hook.path)
+        if hook.required:
+            raise
+        return True
+
+    if not result:
+        if hook.required:
+            LOGGER.error("required hook %s failed; return value: %s", hook.path, result)
+            return False
+        LOGGER.warning("non-required hook %s failed; return value: %s", hook.path, result)
+    elif isinstance(result, (collections.abc.Mapping, pydantic.BaseModel)):
+        if hook.data_key:
+            LOGGER.debug(
+                "adding result for hook %s to context in data_key %s",
+                hook.path,
+                hook.data_key,
+            )
+            context.set_hook_data(hook.data_key, result)
+        else:
+            LOGGER.debug(
+                "hook %s returned result data but no data key set; ignoring",
+                hook.path,
+            )
+    return True
+
+
+def is_scheduled_hook(hook: CfnginHookDefinitionModel) -> bool:
+    """Determine if a hook is scheduled alongside stacks.
+
+    Hooks that declare ``requires`` or ``required_by`` are run as steps in the
+    same graph as stacks rather than before/after every stack.
+
+    """
+    return hook.enabled and (hook.requires is not None or hook.required_by is not None)
+
+
+def _get_hook_data_key(query: str, data_keys: Iterable[str]) -> str | None:
+    """Get the ``data_key`` of the hook referenced by a ``hook_data`` lookup query."""
+    for data_key in data_keys:
+        if query == data_key or query.startswith(f"{data_key}."):
+            return data_key
+    return None
+
+
+def _get_lookup_query(lookup: VariableValueLookup) -> str | None:
+    """Get the query of a lookup without its arguments if it has been resolved."""
+    if not lookup.lookup_query.resolved or not isinstance(lookup.lookup_query.value, str):
+        return None
+    return lookup.handler.parse(lookup.lookup_query.value)[0]
+
+
+def build_hook_steps(
+    hooks: Mapping[str, list[CfnginHookDefinitionModel]],
+    provider: Provider,
+    context: CfnginContext,
+) -> list[Step]:
+    """Build steps for the hooks that are scheduled alongside stacks.
+
+    In addition to the ``requires`` and ``required_by`` of each hook,
+    dependencies are inferred from lookups:
+
+    - stacks referenced by ``output`` or ``cfn`` lookups in hook args are
+      required by the hook
+    - scheduled hooks referenced by ``hook_data`` lookups in hook args are
+      required by the hook
+    - stacks with variables that use a ``hook_data`` lookup for the hook's
+      ``data_key`` require the hook
+
+    Args:
+        hooks: Hooks of each stage (e.g. ``pre_deploy``, ``post_deploy``).
+        provider: Provider instance.
+        context: Context instance.
+
+    Returns:
+        A step for each scheduled hook named ``<stage>.<index>``.
+
+    """
+    scheduled = [
+        (f"{stage}.{index}", stage, hook)
+        for stage, stage_hooks in hooks.items()
+        for index, hook in enumerate(stage_hooks)
+        if is_scheduled_hook(hook)
+    ]
+    data_keys = {hook.data_key: name for name, _, hook in scheduled if hook.data_key}
+    consumers = _get_hook_data_consumers(context, data_keys)
+    return [
+        Step(
+            Stack(
+                CfnginStackDefinitionModel.model_construct(
+                    name=name,
+                    required_by=sorted(
+                        set(hook.required_by or []) | consumers.get(hook.data_key or "", set())
+                    ),
+                    requires=sorted(_get_hook_requires(name, hook, context, data_keys)),
+                ),
+                context,
+            ),
+            fn=_build_hook_step_fn(stage, hook, provider, context),
+        )
+        for name, stage, hook in scheduled
+    ]
+
+
+def _get_hook_data_consumers(
+    context: CfnginContext, data_keys: Mapping[str, str]
+) -> dict[str, set[str]]:
+    """Get the stacks with variables that use ``hook_data`` lookups.
+
+    Returns:
+        Mapping of ``data_key`` to the names of the stacks that use it.
+
+    """
+    consumers: dict[str, set[str]] = {}
+    for stack in context.stacks:
+        for variable in stack.variables:
+            for lookup in variable.lookups:
+                query = _get_lookup_query(lookup)
+                if query is None or not issubclass(lookup.handler, HookDataLookup):
+                    continue
+                data_key = _get_hook_data_key(query, data_keys)
+                if data_key:
+                    consumers.setdefault(data_key, set()).add(stack.name)
+    return consumers
+
+
+def _get_hook_requires(
+    name: str,
+    hook: CfnginHookDefinitionModel,
+    context: CfnginContext,
+    data_keys: Mapping[str, str],
+) -> set[str]:
+    """Get the names of the steps that a scheduled hook requires."""
+    stacks_by_fqn = {stack.fqn: stack.name for stack in context.stacks}
+    requires = set(hook.requires or [])
+    for variable in (Variable(k, v) for k, v in hook.args.items()):
+        requires.update(variable.dependencies)
+        for lookup in variable.lookups:
+            query = _get_lookup_query(lookup)
+            if query is None:
+                continue
+            if issubclass(lookup.handler, CfnLookup):
+                fqn = query.split(".", 1)[0]
+                if fqn in stacks_by_fqn:
+                    requires.add(stacks_by_fqn[fqn])
+            elif issubclass(lookup.handler, HookDataLookup):
+                data_key = _get_hook_data_key(query, data_keys)
+                if data_key and data_keys[data_key] != name:
+                    requires.add(data_keys[data_key])
+    return requires
+
+
+def _build_hook_step_fn(
+    stage: str,
+    hook: CfnginHookDefinitionModel,
+    provider: Provider,
+    context: CfnginContext,
+) -> Callable[..., Status]:
+    """Build the function run by the step of a scheduled hook."""
+
+    def _run_hook(stack: Stack, **_: Any) -> Status:
+        LOGGER.info("%s: executing hook %s", stack.name, hook.path)
+        if run_hook(stage, hook, provider, context):
+            return COMPLETE
+        return FailedStatus(reason="required hook failed")
+
+    return _run_hook
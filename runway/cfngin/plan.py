@@ -11,7 +11,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable, NoReturn, TypeVar, overload
 
 from .._logging import LogLevels, PrefixAdaptor
-from ..utils import merge_dicts
+from ..utils import API_STATS, merge_dicts
 from .dag import DAG, DAGValidationError, walk
 from .exceptions import CancelExecution, GraphError, PersistentGraphLocked, PlanFailed
 from .stack import Stack
@@ -134,7 +134,8 @@ class Step:
         if not self.fn:
             raise TypeError("Step.fn must be type Callable[..., Status] not None")
         try:
-            status = self.fn(self.stack, status=self.status)
+            with API_STATS.scope(self.stack.name):
+                status = self.fn(self.stack, status=self.status)
         except CancelExecution:
             status = SkippedStatus("canceled execution")
         except Exception as err:
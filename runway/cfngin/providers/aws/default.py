@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import contextvars
 import functools
 import json
 import logging
 import operator
+import os
 import sys
 import threading
 import time
@@ -31,7 +33,7 @@ from ...utils import parse_cloudformation_template
 from ..base import BaseProvider
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Iterator
 
     import boto3
     from mypy_boto3_cloudformation.client import CloudFormationClient
@@ -316,6 +318,153 @@ def summarize_params_diff(params_diff: list[DictValue[Any, Any]]) -> str:
     return summary
 
 
+class _PendingChangeSet:
+    """A change set being waited on by :class:`ChangeSetWaiter`."""
+
+    def __init__(
+        self, cfn_client: CloudFormationClient, change_set_id: str, sleep_time: float
+    ) -> None:
+        """Instantiate class."""
+        self.attempts = 0
+        self.cfn_client = cfn_client
+        self.change_set_id = change_set_id
+        # calls are made in the context of the caller (e.g. the scope of API call statistics)
+        self.context = contextvars.copy_context()
+        self.done = threading.Event()
+        self.error: Exception | None = None
+        self.next_poll = time.monotonic()
+        self.response: DescribeChangeSetOutputTypeDef | None = None
+        self.sleep_time = sleep_time
+
+
+class ChangeSetWaiter:
+    """Wait for change sets to reach a complete state from a single poller.
+
+    Rather than each caller polling its own change set, callers register the
+    change set they are waiting for and block until a shared polling thread
+    finds it in a complete state. Each change set is polled with an
+    exponential backoff up to ``max_sleep`` seconds between attempts. The
+    polling thread is started when needed and stops when there is nothing
+    left to wait for. Each change set is described in the context of the
+    thread that is waiting for it.
+
+    """
+
+    def __init__(
+        self, *, try_count: int = 25, sleep_time: float = 0.5, max_sleep: float = 3
+    ) -> None:
+        """Instantiate class.
+
+        Args:
+            try_count: Number of times to describe each change set.
+            sleep_time: Initial time to wait between attempts.
+            max_sleep: Max time to wait between attempts.
+
+        """
+        self.max_sleep = max_sleep
+        self.sleep_time = sleep_time
+        self.try_count = try_count
+        self._reset()
+
+    def _reset(self) -> None:
+        """Reset the state of the waiter.
+
+        Used in the child of a forked process where the polling thread of
+        the parent doesn't exist and its lock could be held.
+
+        """
+        self._lock = threading.Lock()
+        self._pending: dict[str, _PendingChangeSet] = {}
+        self._thread: threading.Thread | None = None
+        self._wakeup = threading.Event()
+
+    def wait(
+        self, cfn_client: CloudFormationClient, change_set_id: str
+    ) -> DescribeChangeSetOutputTypeDef:
+        """Wait for a change set to reach a complete state.
+
+        Args:
+            cfn_client: Used to query CloudFormation.
+            change_set_id: The unique change set id to wait for.
+
+        Returns:
+            The first page of the change set description.
+
+        Raises:
+            ChangesetDidNotStabilize: Change set did not reach a complete state.
+
+        """
+        pending = _PendingChangeSet(cfn_client, change_set_id, self.sleep_time)
+        with self._lock:
+            self._pending[change_set_id] = pending
+            if not self._thread or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=contextvars.copy_context().run,
+                    args=(self._poll,),
+                    name="ChangeSetWaiter",
+                    daemon=True,
+                )
+                self._thread.start()
+        self._wakeup.set()
+        pending.done.wait()
+        if pending.error:
+            raise pending.error
+        return cast("DescribeChangeSetOutputTypeDef", pending.response)
+
+    def _check(self, pending: _PendingChangeSet) -> bool:
+        """Describe a change set, returning whether waiting for it is done."""
+        try:
+            response = pending.context.run(
+                pending.cfn_client.describe_change_set, ChangeSetName=pending.change_set_id
+            )
+        except Exception as exc:  # noqa: BLE001
+            pending.error = exc
+            return True
+        if response["Status"] in ("FAILED", "CREATE_COMPLETE"):
+            pending.response = response
+            return True
+        pending.attempts += 1
+        if pending.attempts >= self.try_count:
+            pending.error = exceptions.ChangesetDidNotStabilize(pending.change_set_id)
+            return True
+        if pending.sleep_time == self.max_sleep:
+            LOGGER.debug(
+                "waiting on changeset %s for another %s seconds",
+                pending.change_set_id,
+                pending.sleep_time,
+            )
+        pending.next_poll = time.monotonic() + pending.sleep_time
+        pending.sleep_time = min(pending.sleep_time * 2, self.max_sleep)
+        return False
+
+    def _poll(self) -> None:
+        """Poll pending change sets until there are none left."""
+        while True:
+            self._wakeup.clear()
+            with self._lock:
+                if not self._pending:
+                    self._thread = None
+                    return
+                now = time.monotonic()
+                due = [pending for pending in self._pending.values() if pending.next_poll <= now]
+            for pending in due:
+                if self._check(pending):
+                    with self._lock:
+                        del self._pending[pending.change_set_id]
+                    pending.done.set()
+            with self._lock:
+                if not self._pending:
+                    continue
+                next_poll = min(pending.next_poll for pending in self._pending.values())
+            self._wakeup.wait(max(0, next_poll - time.monotonic()))
+
+
+CHANGE_SET_WAITER = ChangeSetWaiter()
+
+if hasattr(os, "register_at_fork"):  # not available on Windows
+    os.register_at_fork(after_in_child=CHANGE_SET_WAITER._reset)  # noqa: SLF001
+
+
 def wait_till_change_set_complete(
     cfn_client: CloudFormationClient,
     change_set_id: str,
@@ -332,6 +481,9 @@ def wait_till_change_set_complete(
     changeset is not in a complete state it fails. These default settings will
     wait a little over one minute.
 
+    The shared :data:`CHANGE_SET_WAITER` is used when called with the default
+    settings.
+
     Args:
         cfn_client: Used to query CloudFormation.
         change_set_id: The unique changeset id to wait for.
@@ -340,19 +492,35 @@ def wait_till_change_set_complete(
         max_sleep: Max time to sleep during backoff
 
     """
-    complete = False
-    for _ in range(try_count):
-        response = cfn_client.describe_change_set(ChangeSetName=change_set_id)
-        complete = response["Status"] in ("FAILED", "CREATE_COMPLETE")
-        if complete:
-            return response
-        if sleep_time == max_sleep:
-            LOGGER.debug("waiting on changeset for another %s seconds", sleep_time)
-        time.sleep(sleep_time)
+    waiter = CHANGE_SET_WAITER
+    if (try_count, sleep_time, max_sleep) != (
+        waiter.try_count,
+        waiter.sleep_time,
+        waiter.max_sleep,
+    ):
+        waiter = ChangeSetWaiter(try_count=try_count, sleep_time=sleep_time, max_sleep=max_sleep)
+    return waiter.wait(cfn_client, change_set_id)
 
-        # exponential backoff with max
-        sleep_time = min(sleep_time * 2, max_sleep)
-    raise exceptions.ChangesetDidNotStabilize(change_set_id)
+
+def iter_change_set_changes(
+    cfn_client: CloudFormationClient,
+    change_set_id: str,
+    response: DescribeChangeSetOutputTypeDef,
+) -> Iterator[ChangeTypeDef]:
+    """Iterate over all changes in a change set, following ``NextToken``.
+
+    Args:
+        cfn_client: Used to query CloudFormation.
+        change_set_id: The unique change set id.
+        response: First page of the change set description.
+
+    """
+    yield from response.get("Changes", [])
+    next_token = response.get("NextToken")
+    while next_token:
+        page = cfn_client.describe_change_set(ChangeSetName=change_set_id, NextToken=next_token)
+        yield from page.get("Changes", [])
+        next_token = page.get("NextToken")
 
 
 def create_change_set(
@@ -416,7 +584,7 @@ def create_change_set(
     if execution_status != "AVAILABLE":
         raise exceptions.UnableToExecuteChangeSet(fqn, change_set_id, execution_status)
 
-    changes = response["Changes"]
+    changes = list(iter_change_set_changes(cfn_client, change_set_id, response))
     return changes, change_set_id
 
 
@@ -3,13 +3,14 @@
 from __future__ import annotations
 
 import logging
+from typing import TYPE_CHECKING
 
-import boto3
-
-from ..aws_sso_botocore.session import Session
-from ..constants import BOTO3_CREDENTIAL_CACHE
+from ..utils import API_STATS, RATE_LIMITER, get_credential_cache
 from .ui import ui
 
+if TYPE_CHECKING:
+    import boto3
+
 LOGGER = logging.getLogger(__name__)
 
 DEFAULT_PROFILE = None
@@ -35,6 +36,10 @@ def get_session(
         A thread-safe boto3 session.
 
     """
+    import boto3  # noqa: PLC0415
+
+    from ..aws_sso_botocore.session import Session  # noqa: PLC0415
+
     if profile:
         LOGGER.debug(
             'building session using profile "%s" in region "%s"',
@@ -48,16 +53,19 @@ def get_session(
             region or "default",
         )
 
+    credential_cache = get_credential_cache()
     session = boto3.Session(
         aws_access_key_id=access_key,
         aws_secret_access_key=secret_key,
         aws_session_token=session_token,
-        botocore_session=Session(),
+        botocore_session=Session(credential_cache=credential_cache),
         region_name=region,
         profile_name=profile,
     )
     cred_provider = session._session.get_component("credential_provider")  # type: ignore
     provider = cred_provider.get_provider("assume-role")  # type: ignore
-    provider.cache = BOTO3_CREDENTIAL_CACHE
+    provider.cache = credential_cache
     provider._prompter = ui.getpass  # noqa: SLF001
+    RATE_LIMITER.register(session)
+    API_STATS.register(session)
     return session
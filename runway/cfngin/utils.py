@@ -18,9 +18,8 @@ from collections import OrderedDict
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, ClassVar, cast
 
-import botocore.client
 import botocore.exceptions
-import dateutil
+import dateutil.tz
 import yaml
 from yaml.constructor import ConstructorError
 
@@ -15,7 +15,7 @@ from ..cfngin import exceptions
 from ..cfngin.lookups.registry import register_lookup_handler
 from ..cfngin.utils import SourceProcessor
 from ..exceptions import ConfigNotFound
-from ..utils import merge_dicts
+from ..utils import YAML_CACHE, merge_dicts, yaml_load
 from .components.runway import RunwayDeploymentDefinition, RunwayVariablesDefinition
 from .models.cfngin import (
     CfnginConfigDefinitionModel,
@@ -147,6 +147,9 @@ class CfnginConfig(BaseConfig[CfnginConfigDefinitionModel]):
     cfngin_cache_dir: Path
     """Local directory to use for caching."""
 
+    deploy_fingerprint: bool
+    """Tag stacks with a fingerprint of what was deployed to skip unchanged stacks."""
+
     log_formats: dict[str, str]
     """Custom formatting for log messages."""
 
@@ -222,6 +225,7 @@ class CfnginConfig(BaseConfig[CfnginConfigDefinitionModel]):
             self.cfngin_cache_dir = path.parent / ".runway" / "cache"
         else:
             self.cfngin_cache_dir = Path().cwd() / ".runway" / "cache"
+        self.deploy_fingerprint = self._data.deploy_fingerprint
         self.log_formats = self._data.log_formats
         self.lookups = self._data.lookups
         self.mappings = self._data.mappings
@@ -366,31 +370,38 @@ class CfnginConfig(BaseConfig[CfnginConfigDefinitionModel]):
         if not parameters:
             parameters = {}
         pre_rendered = cls.resolve_raw_data(data, parameters=parameters)
+        config_dict = YAML_CACHE.load(pre_rendered)
         if skip_package_sources:
-            return cls.parse_obj(yaml.safe_load(pre_rendered))
-        config_dict = yaml.safe_load(
-            cls.process_package_sources(pre_rendered, parameters=parameters, work_dir=work_dir)
+            return cls.parse_obj(config_dict)
+        return cls.parse_obj(
+            cls.merge_package_sources(config_dict or {}, parameters=parameters, work_dir=work_dir),
+            path=path,
         )
-        return cls.parse_obj(config_dict, path=path)
 
     @classmethod
-    def process_package_sources(
+    def merge_package_sources(
         cls,
-        raw_data: str,
+        config: dict[str, Any],
         *,
         parameters: MutableMapping[str, Any] | None = None,
         work_dir: Path | None = None,
-    ) -> str:
-        """Process the package sources defined in a rendered config.
+    ) -> dict[str, Any]:
+        """Merge the configs of package sources into a rendered config.
+
+        Each remote config is resolved with the provided parameters and loaded
+        on its own before being merged so the rendered config is never dumped
+        and parsed again.
 
         Args:
-            raw_data: Raw configuration data.
-            cache_dir: Directory to use when caching remote sources.
-            parameters: Values to use when resolving a raw config.
+            config: Rendered configuration data.
+            parameters: Values to use when resolving remote configs.
             work_dir: Explicit working directory.
 
+        Returns:
+            The provided config if there are no remote configs to merge,
+            otherwise a new config with the remote configs merged in.
+
         """
-        config: dict[str, Any] = yaml.safe_load(raw_data) or {}
         processor = SourceProcessor(
             sources=CfnginPackageSourcesDefinitionModel.model_validate(
                 config.get("package_sources", {})
@@ -400,13 +411,36 @@ class CfnginConfig(BaseConfig[CfnginConfigDefinitionModel]):
             ),
         )
         processor.get_package_sources()
-        if processor.configs_to_merge:
-            for i in processor.configs_to_merge:
-                LOGGER.debug("merging in remote config: %s", i)
-                with i.open("rb") as opened_file:
-                    config = merge_dicts(yaml.safe_load(opened_file), config)
-            return cls.resolve_raw_data(yaml.dump(config), parameters=parameters or {})
-        return raw_data
+        for i in processor.configs_to_merge:
+            LOGGER.debug("merging in remote config: %s", i)
+            config = merge_dicts(
+                YAML_CACHE.load(cls.resolve_raw_data(i.read_text(), parameters=parameters or {})),
+                config,
+            )
+        return config
+
+    @classmethod
+    def process_package_sources(
+        cls,
+        raw_data: str,
+        *,
+        parameters: MutableMapping[str, Any] | None = None,
+        work_dir: Path | None = None,
+    ) -> str:
+        """Process the package sources defined in a rendered config.
+
+        Args:
+            raw_data: Raw configuration data.
+            cache_dir: Directory to use when caching remote sources.
+            parameters: Values to use when resolving a raw config.
+            work_dir: Explicit working directory.
+
+        """
+        config: dict[str, Any] = yaml_load(raw_data) or {}
+        merged = cls.merge_package_sources(config, parameters=parameters, work_dir=work_dir)
+        if merged is config:
+            return raw_data
+        return yaml.dump(merged)
 
     @staticmethod
     def resolve_raw_data(
@@ -507,7 +541,7 @@ class RunwayConfig(BaseConfig[RunwayConfigDefinitionModel]):
         if file_path:
             if not file_path.is_file():
                 raise ConfigNotFound(path=file_path)
-            return cls.parse_obj(yaml.safe_load(file_path.read_text()), path=file_path, **kwargs)
+            return cls.parse_obj(YAML_CACHE.load(file_path.read_text()), path=file_path, **kwargs)
         if path:
             return cls.parse_file(file_path=cls.find_config_file(path), **kwargs)
         raise ValueError("must provide path or file_path")
@@ -30,6 +30,7 @@ class RunwayDeploymentDefinition(ConfigComponentDefinition[RunwayDeploymentDefin
     account_alias: str | None
     account_id: str | None
     assume_role: RunwayAssumeRoleDefinitionModel
+    depends_on: list[str]
     environments: RunwayEnvironmentsType
     env_vars: RunwayEnvVarsType
     module_options: dict[str, Any]
@@ -5,10 +5,8 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING, Any, ClassVar, cast
 
-import yaml
-
 from ....exceptions import VariablesFileNotFound
-from ....utils import MutableMap
+from ....utils import MutableMap, yaml_load
 from ...models.runway import RunwayVariablesDefinitionModel
 
 if TYPE_CHECKING:
@@ -38,7 +36,7 @@ class RunwayVariablesDefinition(MutableMap):
         """Load a variables file."""
         if self._file_path:
             if self._file_path.is_file():
-                return yaml.safe_load(self._file_path.read_text())
+                return yaml_load(self._file_path.read_text())
             raise VariablesFileNotFound(self._file_path.absolute())
 
         for name in self.default_names:
@@ -46,7 +44,7 @@ class RunwayVariablesDefinition(MutableMap):
             LOGGER.debug("looking for variables file: %s", test_path)
             if test_path.is_file():
                 LOGGER.verbose("found variables file: %s", test_path)
-                return yaml.safe_load(test_path.read_text())
+                return yaml_load(test_path.read_text())
 
         if not self._has_notified_missing_file:
             LOGGER.info(
@@ -7,10 +7,10 @@ import locale
 from pathlib import Path
 from typing import TYPE_CHECKING, Annotated, Any, cast
 
-import yaml
 from pydantic import ConfigDict, Field, field_validator, model_validator
 from typing_extensions import Literal
 
+from ....utils import yaml_load
 from .. import utils
 from ..base import ConfigProperty
 from ._package_sources import (
@@ -63,6 +63,20 @@ class CfnginHookDefinitionModel(ConfigProperty):
     required: Annotated[
         bool, Field(description="Whether to continue execution if the hook results in an error.")
     ] = True
+    required_by: Annotated[
+        list[str] | None,
+        Field(
+            description="Array of stacks (by name) that require this hook. "
+            "Setting this or requires runs the hook alongside stacks during deploy."
+        ),
+    ] = None
+    requires: Annotated[
+        list[str] | None,
+        Field(
+            description="Array of stacks (by name) that this hook requires. "
+            "Setting this or required_by runs the hook alongside stacks during deploy."
+        ),
+    ] = None
 
 
 @staticmethod
@@ -267,6 +281,13 @@ class CfnginConfigDefinitionModel(ConfigProperty):
             description="Path to a local directory that CFNgin will use for local caching.",
         ),
     ] = None
+    deploy_fingerprint: Annotated[
+        bool,
+        Field(
+            description="Tag stacks with a fingerprint of what was deployed so that "
+            "unchanged stacks can be skipped without calling CloudFormation to update them.",
+        ),
+    ] = False
     log_formats: Annotated[  # TODO (kyle): create model
         dict[str, str], Field(description="Customize log message formatting by log level.")
     ] = {}
@@ -404,7 +425,7 @@ class CfnginConfigDefinitionModel(ConfigProperty):
     ) -> Self:
         """Parse a file."""
         return cls.model_validate(
-            yaml.safe_load(
+            yaml_load(
                 Path(path).read_text(encoding=locale.getpreferredencoding(do_setlocale=False))
             )
         )
@@ -7,7 +7,6 @@ import logging
 from pathlib import Path
 from typing import TYPE_CHECKING, Annotated, Any, TypeVar, cast
 
-import yaml
 from packaging.specifiers import InvalidSpecifier, SpecifierSet
 from pydantic import (
     ConfigDict,
@@ -20,6 +19,7 @@ from pydantic import (
 )
 from pydantic_core import CoreSchema, core_schema
 
+from ....utils import yaml_load
 from ....utils.pydantic_validators import LaxStr
 from .. import utils
 from ..base import ConfigProperty
@@ -83,6 +83,34 @@ def _deployment_json_schema_extra(schema: dict[str, Any]) -> None:
     ]
 
 
+def _find_dependency_cycle(dependencies: dict[str, list[str]]) -> list[str]:
+    """Find a cycle in a mapping of names to the names they depend on.
+
+    Returns:
+        The names that make up the first cycle found or an empty list.
+
+    """
+    visited: set[str] = set()
+
+    def _visit(name: str, path: list[str]) -> list[str]:
+        if name in path:
+            return [*path, name]
+        if name in visited:
+            return []
+        for required in dependencies.get(name, []):
+            cycle = _visit(required, [*path, name])
+            if cycle:
+                return cycle
+        visited.add(name)
+        return []
+
+    for name in dependencies:
+        cycle = _visit(name, [])
+        if cycle:
+            return cycle
+    return []
+
+
 class RunwayDeploymentDefinitionModel(ConfigProperty):
     """Model for a Runway deployment definition."""
 
@@ -130,6 +158,22 @@ class RunwayDeploymentDefinitionModel(ConfigProperty):
     ] = RunwayAssumeRoleDefinitionModel()
     """Assume a role when processing the deployment. (supports lookups)"""
 
+    depends_on: Annotated[
+        list[str],
+        Field(
+            description="Names of other deployments that must be processed before this "
+            "deployment. When any deployment declares dependencies, deployments are "
+            "scheduled as a graph and independent deployments can run concurrently.",
+            examples=[["networking"], ["networking", "iam"]],
+        ),
+    ] = []
+    """Names of other deployments that must be processed before this deployment.
+
+    When any deployment declares dependencies, deployments are scheduled as a
+    graph and independent deployments can run concurrently.
+
+    """
+
     env_vars: Annotated[
         RunwayEnvVarsUnresolvedType,
         Field(
@@ -416,13 +460,39 @@ class RunwayConfigDefinitionModel(ConfigProperty):
         """Serialize ``runway_version`` field when dumping to JSON."""
         return str(runway_version)
 
+    @model_validator(mode="after")
+    def _validate_depends_on(self) -> Self:
+        """Validate that deployment dependencies exist and are not circular."""
+        names = [deployment.name for deployment in self.deployments]
+        dependencies = {
+            deployment.name: deployment.depends_on
+            for deployment in self.deployments
+            if deployment.depends_on
+        }
+        for name, depends_on in dependencies.items():
+            if names.count(name) > 1:
+                raise ValueError(f"deployment {name} uses depends_on but its name is not unique")
+            for required in depends_on:
+                if required not in names:
+                    raise ValueError(
+                        f"deployment {name} depends on {required} which does not exist"
+                    )
+                if names.count(required) > 1:
+                    raise ValueError(
+                        f"deployment {name} depends on {required} which is not a unique name"
+                    )
+        cycle = _find_dependency_cycle(dependencies)
+        if cycle:
+            raise ValueError("deployment depends_on is circular: " + " -> ".join(cycle))
+        return self
+
     @classmethod
     def parse_file(  # pyright: ignore[reportIncompatibleMethodOverride]
         cls: type[Self], path: str | Path
     ) -> Self:
         """Parse a file."""
         return cls.model_validate(
-            yaml.safe_load(
+            yaml_load(
                 Path(path).read_text(encoding=locale.getpreferredencoding(do_setlocale=False))
             )
         )
@@ -9,3 +9,6 @@ BOTO3_CREDENTIAL_CACHE: dict[str, Any] = {}
 This is inherently threadsafe thanks to the GIL.
 (https://docs.python.org/3/glossary.html#term-global-interpreter-lock)
 """
+
+TRUTHY_VALUES = ("y", "yes", "t", "true", "on", "1")
+"""Lowercase string values of environment variables that are considered to be ``True``."""
@@ -11,9 +11,9 @@ import botocore.exceptions
 
 from ..aws_sso_botocore.session import Session
 from ..cfngin.ui import ui
-from ..constants import BOTO3_CREDENTIAL_CACHE
 from ..mixins import DelCachedPropMixin
 from ..type_defs import Boto3CredentialsTypeDef
+from ..utils import API_STATS, RATE_LIMITER, get_credential_cache
 from .sys_info import SystemInfo
 
 if TYPE_CHECKING:
@@ -136,18 +136,21 @@ class BaseContext(DelCachedPropMixin):
                     aws_access_key_id,
                     region or "default",
                 )
+        credential_cache = get_credential_cache(self.env.vars)
         session = boto3.Session(
             aws_access_key_id=aws_access_key_id,
             aws_secret_access_key=aws_secret_access_key,
             aws_session_token=aws_session_token,
-            botocore_session=Session(),
+            botocore_session=Session(credential_cache=credential_cache),
             region_name=region or self.env.aws_region,
             profile_name=profile,
         )
         cred_provider = session._session.get_component("credential_provider")  # type: ignore
         provider = cred_provider.get_provider("assume-role")  # type: ignore
-        provider.cache = BOTO3_CREDENTIAL_CACHE
+        provider.cache = credential_cache
         provider._prompter = ui.getpass  # noqa: SLF001
+        RATE_LIMITER.register(session)
+        API_STATS.register(session)
         return session
 
     # TODO (kyle): remove after IaC tools support AWS SSO
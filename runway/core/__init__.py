@@ -7,6 +7,7 @@ import sys as _sys
 from typing import TYPE_CHECKING, Any, cast
 
 from .. import __version__
+from ..utils import API_STATS
 from . import components, providers, type_defs
 
 if TYPE_CHECKING:
@@ -168,10 +169,11 @@ class Runway:
 
         """
         self.ctx.command = action
-        components.Deployment.run_list(
-            action=action,
-            context=self.ctx,
-            deployments=deployments or [],
-            future=self.future,
-            variables=self.variables,
-        )
+        with API_STATS.collect(self.ctx.env.vars, logger=LOGGER):
+            components.Deployment.run_list(
+                action=action,
+                context=self.ctx,
+                deployments=deployments or [],
+                future=self.future,
+                variables=self.variables,
+            )
@@ -1,16 +1,48 @@
-"""Core Runway components."""
+"""Core Runway components.
 
-from ._deploy_environment import DeployEnvironment
-from ._deployment import Deployment
-from ._module import Module
-from ._module_path import ModulePath
-from ._module_type import RunwayModuleType, RunwayModuleTypeExtensionsTypeDef
+Components are imported when they are first accessed so that using one
+(e.g. :class:`DeployEnvironment`) does not import the dependencies of all.
+
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ._deploy_environment import DeployEnvironment
+    from ._deployment import Deployment
+    from ._module import Module
+    from ._module_path import ModulePath
+    from ._module_type import RunwayModuleType, RunwayModuleTypeExtensionsTypeDef
+    from ._scheduler import DeploymentScheduler
+
+_MODULES = {
+    "DeployEnvironment": "._deploy_environment",
+    "Deployment": "._deployment",
+    "DeploymentScheduler": "._scheduler",
+    "Module": "._module",
+    "ModulePath": "._module_path",
+    "RunwayModuleType": "._module_type",
+    "RunwayModuleTypeExtensionsTypeDef": "._module_type",
+}
 
 __all__ = [
     "DeployEnvironment",
     "Deployment",
+    "DeploymentScheduler",
     "Module",
     "ModulePath",
     "RunwayModuleType",
     "RunwayModuleTypeExtensionsTypeDef",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a component when it is first accessed."""
+    if name in _MODULES:
+        value = getattr(importlib.import_module(_MODULES[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
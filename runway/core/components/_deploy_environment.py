@@ -12,22 +12,35 @@ from typing import TYPE_CHECKING, Any, cast
 import click
 
 from ...compat import cached_property
+from ...constants import TRUTHY_VALUES
 from ...mixins import DelCachedPropMixin
 from ...type_defs import EnvVarsAwsCredentialsTypeDef
 from ...utils import AWS_ENV_VARS
 
-try:  # will raise an import error if git is not in the current path
-    import git
-    from git.exc import InvalidGitRepositoryError
-except ImportError:  # cov: ignore
-    git = object
-    InvalidGitRepositoryError = AttributeError
-
 if TYPE_CHECKING:
     from ..._logging import RunwayLogger
 
 LOGGER = cast("RunwayLogger", logging.getLogger(__name__.replace("._", ".")))
 
+# git is slow to import so it is imported the first time it is needed
+git: Any = None
+InvalidGitRepositoryError: type[Exception] = AttributeError
+
+
+def _import_git() -> None:
+    """Import git if it has not been imported."""
+    global git, InvalidGitRepositoryError  # noqa: PLW0603
+    if git is not None:
+        return
+    try:  # will raise an import error if git is not in the current path
+        import git as _git  # noqa: PLC0415
+        from git.exc import InvalidGitRepositoryError as _InvalidGitRepositoryError  # noqa: PLC0415
+    except ImportError:  # cov: ignore
+        git = object
+        return
+    git = _git
+    InvalidGitRepositoryError = _InvalidGitRepositoryError
+
 
 class DeployEnvironment(DelCachedPropMixin):
     """Runway deploy environment."""
@@ -89,9 +102,25 @@ class DeployEnvironment(DelCachedPropMixin):
         """Set AWS region environment variables."""
         self._update_vars({"AWS_DEFAULT_REGION": region, "AWS_REGION": region})
 
+    @property
+    def buffer_parallel_output(self) -> bool:
+        """Whether to group the output of work processed in parallel.
+
+        This property can be set by exporting ``RUNWAY_BUFFER_PARALLEL_OUTPUT``
+        with a truthy value.
+
+        """
+        return self.vars.get("RUNWAY_BUFFER_PARALLEL_OUTPUT", "").lower() in TRUTHY_VALUES
+
+    @buffer_parallel_output.setter
+    def buffer_parallel_output(self, value: bool) -> None:
+        """Set RUNWAY_BUFFER_PARALLEL_OUTPUT."""
+        self._update_vars({"RUNWAY_BUFFER_PARALLEL_OUTPUT": "1" if value else "0"})
+
     @cached_property
     def branch_name(self) -> str | None:
         """Git branch name."""
+        _import_git()
         if isinstance(git, type):
             LOGGER.debug(
                 "failed to import git; ensure git is your path and "
@@ -190,6 +219,31 @@ class DeployEnvironment(DelCachedPropMixin):
         """Set RUNWAY_MAX_CONCURRENT_CFNGIN_STACKS."""
         self._update_vars({"RUNWAY_MAX_CONCURRENT_CFNGIN_STACKS": str(value)})
 
+    @property
+    def max_concurrent_deployments(self) -> int:
+        """Max number of deployments that can be processed concurrently.
+
+        Only applies when deployments declare ``depends_on``.
+        This property can be set by exporting ``RUNWAY_MAX_CONCURRENT_DEPLOYMENTS``.
+        If no value is specified, ``min(61, os.cpu_count())`` is used.
+
+        On Windows, this must be equal to or lower than ``61``.
+
+        Returns:
+            Value from environment variable or ``min(61, os.cpu_count())``
+
+        """
+        value = self.vars.get("RUNWAY_MAX_CONCURRENT_DEPLOYMENTS")
+
+        if value:
+            return int(value)
+        return min(61, os.cpu_count() or 61)
+
+    @max_concurrent_deployments.setter
+    def max_concurrent_deployments(self, value: int) -> None:
+        """Set RUNWAY_MAX_CONCURRENT_DEPLOYMENTS."""
+        self._update_vars({"RUNWAY_MAX_CONCURRENT_DEPLOYMENTS": str(value)})
+
     @property
     def max_concurrent_modules(self) -> int:
         """Max number of modules that can be deployed to concurrently.
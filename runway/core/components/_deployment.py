@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import concurrent.futures
+import functools
 import logging
 import multiprocessing
 import sys
@@ -19,6 +20,8 @@ from ...exceptions import UnresolvedVariable
 from ...utils import flatten_path_lists, merge_dicts
 from ..providers import aws
 from ._module import Module
+from ._scheduler import DeploymentScheduler
+from ._worker_output import WorkerOutputMultiplexer
 
 if TYPE_CHECKING:
     from ...config.components.runway import RunwayDeploymentDefinition
@@ -242,12 +245,18 @@ class Deployment:
             action: Name of action to run.
 
         """
-        self.logger.info("processing regions in parallel... (output will be interwoven)")
-        with concurrent.futures.ProcessPoolExecutor(
-            max_workers=self.ctx.env.max_concurrent_regions,
-            mp_context=multiprocessing.get_context("fork"),
-        ) as executor:
-            futures = [executor.submit(self.run, action, region) for region in self.regions]
+        with WorkerOutputMultiplexer(
+            buffered=self.ctx.env.buffer_parallel_output, logger=self.logger, unit="region"
+        ) as output:
+            self.logger.info("processing regions in parallel... %s", output.description)
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=self.ctx.env.max_concurrent_regions,
+                mp_context=multiprocessing.get_context("fork"),
+            ) as executor:
+                futures = [
+                    output.submit(executor, region, self.run, action, region)
+                    for region in self.regions
+                ]
         for job in futures:
             job.result()  # raise exceptions / exit as needed
 
@@ -274,6 +283,9 @@ class Deployment:
     ) -> None:
         """Run a list of deployments.
 
+        If any deployment declares ``depends_on``, deployments are processed
+        by a :class:`~runway.core.components.DeploymentScheduler`.
+
         Args:
             action: Name of action to run.
             context: Runway context.
@@ -282,27 +294,64 @@ class Deployment:
             variables: Runway variables for lookup resolution.
 
         """
-        for definition in deployments:
-            definition.resolve(context, variables=variables, pre_process=True)
-            deployment = cls(
-                context=context,
-                definition=definition,
-                future=future,
-                variables=variables,
+        if DeploymentScheduler.has_dependencies(deployments):
+            scheduler = DeploymentScheduler(deployments, reverse=action == "destroy")
+            scheduler.run(
+                functools.partial(
+                    cls.run_definition,
+                    action,
+                    context,
+                    future=future,
+                    variables=variables,
+                ),
+                buffer_output=context.env.buffer_parallel_output,
+                max_workers=context.env.max_concurrent_deployments,
+                use_async=action in ("deploy", "destroy") and context.use_concurrent,
             )
-            LOGGER.info("")
-            LOGGER.info("")
-            deployment.logger.notice("processing deployment (in progress)")
-            if not definition.modules:
-                deployment.logger.warning("skipped; no modules found in definition")
-                continue
-            cls(
-                context=context,
-                definition=definition,
-                future=future,
-                variables=variables,
-            )[action]()
-            deployment.logger.success("processing deployment (complete)")
+            return
+        for definition in deployments:
+            cls.run_definition(action, context, definition, future=future, variables=variables)
+
+    @classmethod
+    def run_definition(
+        cls,
+        action: RunwayActionTypeDef,
+        context: RunwayContext,
+        definition: RunwayDeploymentDefinition,
+        *,
+        future: RunwayFutureDefinitionModel,
+        variables: RunwayVariablesDefinition,
+    ) -> None:
+        """Run a single deployment definition.
+
+        Args:
+            action: Name of action to run.
+            context: Runway context.
+            definition: Deployment definition to run.
+            future: Future definition.
+            variables: Runway variables for lookup resolution.
+
+        """
+        definition.resolve(context, variables=variables, pre_process=True)
+        deployment = cls(
+            context=context,
+            definition=definition,
+            future=future,
+            variables=variables,
+        )
+        LOGGER.info("")
+        LOGGER.info("")
+        deployment.logger.notice("processing deployment (in progress)")
+        if not definition.modules:
+            deployment.logger.warning("skipped; no modules found in definition")
+            return
+        cls(
+            context=context,
+            definition=definition,
+            future=future,
+            variables=variables,
+        )[action]()
+        deployment.logger.success("processing deployment (complete)")
 
     def __getitem__(self, name: str) -> Any:
         """Make the object subscriptable.
@@ -9,8 +9,6 @@ import multiprocessing
 import sys
 from typing import TYPE_CHECKING, Any, cast
 
-import yaml
-
 from ..._logging import PrefixAdaptor
 from ...compat import cached_property
 from ...config.components.runway import RunwayVariablesDefinition
@@ -19,10 +17,11 @@ from ...config.models.runway import (
     RunwayFutureDefinitionModel,
     RunwayVariablesDefinitionModel,
 )
-from ...utils import change_dir, flatten_path_lists, merge_dicts
+from ...utils import API_STATS, change_dir, flatten_path_lists, merge_dicts, yaml_load
 from ..providers import aws
 from ._module_path import ModulePath
 from ._module_type import RunwayModuleType
+from ._worker_output import WorkerOutputMultiplexer
 
 if TYPE_CHECKING:
     from ..._logging import RunwayLogger
@@ -119,7 +118,7 @@ class Module:
         opts_file = self.path.module_root / "runway.module.yml"
         if opts_file.is_file():
             self.logger.verbose("module-level config file found")
-            return yaml.safe_load(opts_file.read_text())
+            return yaml_load(opts_file.read_text())
         return {}
 
     @cached_property
@@ -231,7 +230,7 @@ class Module:
         self.logger.verbose("module payload: %s", json.dumps(self.payload))
         if self.should_skip:
             return
-        with change_dir(self.path.module_root):
+        with API_STATS.scope(self.fqn), change_dir(self.path.module_root):
             # dynamically load the particular module's class, 'get' the method
             # associated with the command, and call the method.
             inst = self.type.module_class(
@@ -251,15 +250,21 @@ class Module:
             action: Name of action to run.
 
         """
-        self.logger.info("processing modules in parallel... (output will be interwoven)")
-        # Can't use threading or ThreadPoolExecutor here because
-        # we need to be able to do things like `cd` which is not
-        # thread safe.
-        with concurrent.futures.ProcessPoolExecutor(
-            max_workers=self.ctx.env.max_concurrent_modules,
-            mp_context=multiprocessing.get_context("fork"),
-        ) as executor:
-            futures = [executor.submit(child.run, action) for child in self.child_modules]
+        with WorkerOutputMultiplexer(
+            buffered=self.ctx.env.buffer_parallel_output, logger=self.logger, unit="module"
+        ) as output:
+            self.logger.info("processing modules in parallel... %s", output.description)
+            # Can't use threading or ThreadPoolExecutor here because
+            # we need to be able to do things like `cd` which is not
+            # thread safe.
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=self.ctx.env.max_concurrent_modules,
+                mp_context=multiprocessing.get_context("fork"),
+            ) as executor:
+                futures = [
+                    output.submit(executor, child.fqn, child.run, action)
+                    for child in self.child_modules
+                ]
         for job in futures:
             job.result()  # raise exceptions / exit as needed
 
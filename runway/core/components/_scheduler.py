@@ -0,0 +1,151 @@
+"""Runway deployment scheduler."""
+
+from __future__ import annotations
+
+import concurrent.futures
+import logging
+import multiprocessing
+from typing import TYPE_CHECKING, Any, Callable, cast
+
+from ._worker_output import WorkerOutputMultiplexer
+
+if TYPE_CHECKING:
+    from ..._logging import RunwayLogger
+    from ...config.components.runway import RunwayDeploymentDefinition
+
+LOGGER = cast("RunwayLogger", logging.getLogger(__name__.replace("._", ".")))
+
+
+class DeploymentScheduler:
+    """Process deployments as a graph built from their ``depends_on``.
+
+    Deployments are started in the order they are defined as soon as all
+    of the deployments they depend on have completed. When run
+    asynchronously, independent deployments are processed concurrently.
+
+    """
+
+    def __init__(
+        self,
+        deployments: list[RunwayDeploymentDefinition],
+        *,
+        reverse: bool = False,
+    ) -> None:
+        """Instantiate class.
+
+        Args:
+            deployments: Deployments to process. Dependencies on deployments
+                that are not in this list are ignored.
+            reverse: Reverse the direction of dependencies (e.g. for destroy)
+                so that a deployment is processed after the deployments that
+                depend on it.
+
+        """
+        self.deployments = deployments
+        self.requires = self._build_requirements(deployments, reverse=reverse)
+
+    @staticmethod
+    def has_dependencies(deployments: list[RunwayDeploymentDefinition]) -> bool:
+        """Whether any of the deployments declare dependencies."""
+        return any(deployment.depends_on for deployment in deployments)
+
+    @staticmethod
+    def _build_requirements(
+        deployments: list[RunwayDeploymentDefinition], *, reverse: bool
+    ) -> dict[str, set[str]]:
+        """Map each deployment to the deployments that must be processed before it."""
+        names = {deployment.name for deployment in deployments}
+        requires: dict[str, set[str]] = {deployment.name: set() for deployment in deployments}
+        for deployment in deployments:
+            for required in deployment.depends_on:
+                if required not in names:
+                    LOGGER.debug(
+                        "%s:ignoring dependency on %s; deployment was not selected",
+                        deployment.name,
+                        required,
+                    )
+                    continue
+                if reverse:
+                    requires[required].add(deployment.name)
+                else:
+                    requires[deployment.name].add(required)
+        return requires
+
+    def _ready(
+        self, pending: list[RunwayDeploymentDefinition], complete: set[str]
+    ) -> list[RunwayDeploymentDefinition]:
+        """Deployments from pending that have all requirements complete."""
+        return [deployment for deployment in pending if self.requires[deployment.name] <= complete]
+
+    def ordered(self) -> list[RunwayDeploymentDefinition]:
+        """Deployments in the order they would be processed sequentially.
+
+        Raises:
+            ValueError: Dependencies are circular.
+
+        """
+        pending = list(self.deployments)
+        complete: set[str] = set()
+        result: list[RunwayDeploymentDefinition] = []
+        while pending:
+            ready = self._ready(pending, complete)
+            if not ready:
+                raise ValueError(
+                    "unable to schedule deployments with circular dependencies: "
+                    + ", ".join(deployment.name for deployment in pending)
+                )
+            result.append(ready[0])
+            pending.remove(ready[0])
+            complete.add(ready[0].name)
+        return result
+
+    def run(
+        self,
+        func: Callable[[RunwayDeploymentDefinition], Any],
+        *,
+        buffer_output: bool = False,
+        max_workers: int = 1,
+        use_async: bool = False,
+    ) -> None:
+        """Process each deployment with the provided function.
+
+        Args:
+            func: Function called with each deployment definition. Must be
+                picklable when ``use_async``.
+            buffer_output: Group the output of each deployment when processing
+                deployments concurrently.
+            max_workers: Max number of deployments to process concurrently.
+            use_async: Process deployments concurrently in forked processes.
+
+        """
+        if not use_async or max_workers < 2:
+            LOGGER.info("processing deployments sequentially based on depends_on...")
+            for deployment in self.ordered():
+                func(deployment)
+            return
+        self.ordered()  # raise before starting anything if circular
+        pending = list(self.deployments)
+        complete: set[str] = set()
+        running: dict[concurrent.futures.Future[Any], str] = {}
+        with WorkerOutputMultiplexer(buffered=buffer_output, unit="deployment") as output:
+            LOGGER.info(
+                "processing deployments in parallel based on depends_on... %s",
+                output.description,
+            )
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("fork"),
+            ) as executor:
+                while pending or running:
+                    for deployment in self._ready(pending, complete):
+                        pending.remove(deployment)
+                        LOGGER.verbose("%s:scheduling deployment", deployment.name)
+                        job = output.submit(executor, deployment.name, func, deployment)
+                        running[job] = deployment.name
+                    done, _ = concurrent.futures.wait(
+                        running, return_when=concurrent.futures.FIRST_COMPLETED
+                    )
+                    for job in done:
+                        name = running.pop(job)
+                        job.result()  # raise exceptions / exit as needed
+                        complete.add(name)
@@ -0,0 +1,206 @@
+"""Buffered output for work processed in parallel by forked workers."""
+
+from __future__ import annotations
+
+import logging
+import os
+import re
+import shutil
+import sys
+import tempfile
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, TypeVar, cast
+
+from ...utils import API_STATS, run_worker
+
+if TYPE_CHECKING:
+    import concurrent.futures
+    from types import TracebackType
+
+    from ..._logging import PrefixAdaptor, RunwayLogger
+    from ...compat import Self
+
+LOGGER = cast("RunwayLogger", logging.getLogger(__name__.replace("._", ".")))
+
+_T = TypeVar("_T")
+
+
+def capture_output(path: Path, func: Callable[..., _T], *args: Any, **kwargs: Any) -> _T:
+    """Run a function with stdout & stderr redirected to a file.
+
+    Redirection is done at the file descriptor level so output of subprocesses
+    is captured along with anything logged by Runway. Intended to be run in a
+    forked worker process.
+
+    Args:
+        path: File where output will be written.
+        func: Function to call.
+        *args: Positional arguments passed to the function.
+        **kwargs: Keyword arguments passed to the function.
+
+    """
+    sys.stdout.flush()
+    sys.stderr.flush()
+    with path.open("ab") as handle:
+        saved_stdout, saved_stderr = os.dup(1), os.dup(2)
+        os.dup2(handle.fileno(), 1)
+        os.dup2(handle.fileno(), 2)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os.dup2(saved_stdout, 1)
+            os.dup2(saved_stderr, 2)
+            os.close(saved_stdout)
+            os.close(saved_stderr)
+
+
+class WorkerOutputMultiplexer:
+    """Keep the output of parallel workers separate.
+
+    When buffering is enabled, the output of each job submitted to an executor
+    is captured in its own file and replayed as a single group once the job
+    completes. While jobs are running, a compact progress summary is logged
+    periodically.
+
+    When buffering is disabled, jobs are submitted to the executor as-is and
+    their output will be interwoven.
+
+    """
+
+    PROGRESS_INTERVAL: float = 30.0
+    """Number of seconds between progress summaries."""
+
+    def __init__(
+        self,
+        *,
+        buffered: bool = False,
+        logger: PrefixAdaptor | RunwayLogger = LOGGER,
+        unit: str = "job",
+    ) -> None:
+        """Instantiate class.
+
+        Args:
+            buffered: Whether to buffer the output of each job.
+            logger: Logger used for progress and group headers.
+            unit: Name of the thing being processed by each job
+                (e.g. region, module) used in messages.
+
+        """
+        self.buffered = buffered
+        self.logger = logger
+        self.unit = unit
+        self._complete: list[str] = []
+        self._jobs: dict[concurrent.futures.Future[Any], tuple[str, Path]] = {}
+        self._lock = threading.Lock()
+        self._output_dir: Path | None = None
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def description(self) -> str:
+        """Describe how output will be displayed."""
+        if self.buffered:
+            return f"(output will be grouped by {self.unit})"
+        return "(output will be interwoven)"
+
+    @property
+    def running(self) -> list[str]:
+        """Names of jobs that have not completed."""
+        with self._lock:
+            return [name for name, _ in self._jobs.values() if name not in self._complete]
+
+    def submit(
+        self,
+        executor: concurrent.futures.Executor,
+        name: str,
+        func: Callable[..., _T],
+        *args: Any,
+        **kwargs: Any,
+    ) -> concurrent.futures.Future[_T]:
+        """Submit a job to an executor.
+
+        Args:
+            executor: Executor to submit the job to.
+            name: Name used to identify the job's output.
+            func: Function to call.
+            *args: Positional arguments passed to the function.
+            **kwargs: Keyword arguments passed to the function.
+
+        """
+        if API_STATS.spool_dir:
+            args = (func, *args)
+            func = run_worker
+        if not self.buffered:
+            return executor.submit(func, *args, **kwargs)
+        if not self._output_dir:
+            self._output_dir = Path(tempfile.mkdtemp(prefix="runway-output-"))
+        with self._lock:
+            safe_name = re.sub(r"[^\w.-]", "_", name)
+            path = self._output_dir / f"{len(self._jobs):03d}-{safe_name}.log"
+        future = executor.submit(capture_output, path, func, *args, **kwargs)
+        with self._lock:
+            self._jobs[future] = (name, path)
+        future.add_done_callback(self._replay)
+        return future
+
+    def log_progress(self) -> None:
+        """Log a compact summary of the progress of submitted jobs."""
+        running = self.running
+        with self._lock:
+            total = len(self._jobs)
+            complete = len(self._complete)
+        self.logger.info(
+            "%s of %s %s(s) complete; in progress: %s",
+            complete,
+            total,
+            self.unit,
+            ", ".join(running) or "none",
+        )
+
+    def _progress_loop(self) -> None:
+        """Periodically log progress until stopped."""
+        while not self._stop.wait(self.PROGRESS_INTERVAL):
+            if self.running:
+                self.log_progress()
+
+    def _replay(self, future: concurrent.futures.Future[Any]) -> None:
+        """Replay the output of a completed job."""
+        with self._lock:
+            name, path = self._jobs[future]
+            status = "failed" if future.cancelled() or future.exception() else "complete"
+            try:
+                content = path.read_bytes()
+            except FileNotFoundError:
+                content = b""
+            sys.stderr.flush()
+            self.logger.info("%s %s (%s); output:", self.unit, name, status)
+            sys.stderr.flush()
+            if content:
+                text = content.decode(errors="replace")
+                sys.stderr.write(text if text.endswith("\n") else text + "\n")
+            sys.stderr.flush()
+            self.logger.info("%s %s; end of output", self.unit, name)
+            self._complete.append(name)
+
+    def __enter__(self) -> Self:
+        """Enter the context manager."""
+        if self.buffered:
+            self._thread = threading.Thread(target=self._progress_loop, daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Exit the context manager."""
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+        if self._output_dir:
+            shutil.rmtree(self._output_dir, ignore_errors=True)
@@ -180,7 +180,7 @@ class Bucket(DelCachedPropMixin):
         follow_symlinks: bool = False,
         include: list[str] | None = None,
         prefix: str | None = None,
-    ) -> None:
+    ) -> list[str]:
         """Sync local directory to the S3 Bucket.
 
         Args:
@@ -192,8 +192,11 @@ class Bucket(DelCachedPropMixin):
             include: List of patterns for files/objects to explicitly include.
             prefix: Optional prefix to append to synced objects.
 
+        Returns:
+            Keys of objects whose content was changed or that were deleted.
+
         """
-        S3SyncHandler(
+        return S3SyncHandler(
             context=self.__ctx,
             delete=delete,
             dest=self.format_bucket_path_uri(prefix=prefix),
@@ -7,7 +7,9 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
+from pathlib import Path
 from queue import Queue
 from typing import TYPE_CHECKING, Any, cast
 
@@ -24,10 +26,14 @@ from .sync_strategy.base import MissingFileSync, NeverSync, SizeAndLastModifiedS
 from .transfer_config import RuntimeConfig
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
     import boto3
     from botocore.session import Session
     from mypy_boto3_s3.client import S3Client
 
+    from .file_generator import FileStats
+    from .file_info import FileInfo
     from .format_path import FormatPathResult
     from .parameters import ParametersDataModel
     from .s3handler import S3TransferHandler
@@ -77,12 +83,29 @@ class ActionArchitecture:
         action: Literal["sync"],
         parameters: ParametersDataModel,
         runtime_config: TransferConfigDict | None = None,
+        *,
+        record_changes: bool = False,
     ) -> None:
-        """Instantiate class."""
+        """Instantiate class.
+
+        Args:
+            session: boto3 Session.
+            botocore_session: botocore Session.
+            action: Name of the action.
+            parameters: Parameters of the action.
+            runtime_config: Transfer config.
+            record_changes: Record the keys of S3 objects that are changed by
+                the action in :attr:`changed_keys`.
+
+        """
         self.botocore_session = botocore_session
+        self.changed_keys: list[str] = []
+        """Keys of S3 objects whose content is changed or that are deleted by the action."""
         self.session = session
         self.action = action
         self.parameters = parameters
+        self.record_changes = record_changes
+        self._dest_etags: dict[str, str] = {}
         self._runtime_config = runtime_config or RuntimeConfig.defaults()
         self._source_client = None
 
@@ -216,6 +239,10 @@ class ActionArchitecture:
         files = command_dict["setup"]
         while self.instructions:
             instruction = self.instructions.pop(0)
+            if self.record_changes and instruction == "comparator":
+                files[1] = self._record_dest_etags(files[1])  # type: ignore
+            elif self.record_changes and instruction == "s3_handler":
+                files[0] = self._record_changed_keys(files[0])  # type: ignore
             file_list = []
             components = command_dict[instruction]
             for index, comp in enumerate(components):
@@ -241,6 +268,50 @@ class ActionArchitecture:
             return_code = 2
         return return_code
 
+    def _record_changed_keys(self, files: Iterable[FileInfo]) -> Iterator[FileInfo]:
+        """Record the key of each S3 object that is changed by the action.
+
+        Uploads of a local file with an MD5 matching the ETag of the existing
+        object are not recorded since the content of the object is unchanged.
+
+        """
+        for file_info in files:
+            if file_info.operation_name == "delete" and file_info.src_type == "s3":
+                self.changed_keys.append(str(file_info.src).split("/", 1)[1])
+            elif (
+                file_info.operation_name in ("copy", "upload")
+                and file_info.dest_type == "s3"
+                and not self._is_unchanged_upload(file_info)
+            ):
+                self.changed_keys.append(str(file_info.dest).split("/", 1)[1])
+            yield file_info
+
+    def _record_dest_etags(self, files: Iterable[FileStats]) -> Iterator[FileStats]:
+        """Record the ETag of each existing object in the destination."""
+        for file_stats in files:
+            if file_stats.compare_key and file_stats.response_data:
+                self._dest_etags[file_stats.compare_key] = file_stats.response_data.get("ETag", "")
+            yield file_stats
+
+    def _is_unchanged_upload(self, file_info: FileInfo) -> bool:
+        """Determine if an upload has the same content as the existing object.
+
+        Objects uploaded in multiple parts or encrypted with KMS do not have an
+        ETag that is the MD5 of their content so they are always considered changed.
+
+        """
+        etag = self._dest_etags.get(file_info.compare_key or "", "").strip('"')
+        if file_info.src_type != "local" or not etag or "-" in etag:
+            return False
+        try:
+            with Path(file_info.src).open("rb") as stream:
+                file_hash = hashlib.md5()  # noqa: S324
+                while chunk := stream.read(1024 * 1024):
+                    file_hash.update(chunk)
+        except OSError:
+            return False
+        return file_hash.hexdigest() == etag
+
     @staticmethod
     def _get_file_generator_request_parameters_skeleton() -> dict[str, dict[str, Any]]:
         return {"HeadObject": {}, "ListObjects": {}, "ListObjectsV2": {}}
@@ -85,13 +85,21 @@ class S3SyncHandler:
             )
         )
 
-    def run(self) -> None:
-        """Run sync."""
+    def run(self) -> list[str]:
+        """Run sync.
+
+        Returns:
+            Keys of S3 objects whose content was changed or that were deleted.
+
+        """
         register_sync_strategies(self._botocore_session)
-        ActionArchitecture(
+        action = ActionArchitecture(
             session=self._session,
             botocore_session=self._botocore_session,
             action="sync",
             parameters=self.parameters.data,
             runtime_config=self.transfer_config,
-        ).run()
+            record_changes=True,
+        )
+        action.run()
+        return action.changed_keys
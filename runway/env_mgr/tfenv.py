@@ -13,7 +13,9 @@ import shutil
 import subprocess
 import sys
 import tempfile
+import time
 import zipfile
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, Final, cast, overload
 from urllib.error import URLError
 from urllib.request import urlretrieve
@@ -24,13 +26,22 @@ import requests
 from packaging.version import InvalidVersion
 
 from ..compat import cached_property
+from ..constants import TRUTHY_VALUES
 from ..exceptions import HclParserError
-from ..utils import FileHash, Version, get_hash_for_filename, merge_dicts
+from ..utils import (
+    FileHash,
+    Version,
+    file_lock,
+    get_cache_dir,
+    get_hash_for_filename,
+    merge_dicts,
+    read_json_file,
+    write_file_atomic,
+)
 from . import EnvManager, handle_bin_download_error
 
 if TYPE_CHECKING:
     from collections.abc import Generator
-    from pathlib import Path
     from types import ModuleType
 
     from .._logging import RunwayLogger
@@ -39,67 +50,184 @@ LOGGER = cast("RunwayLogger", logging.getLogger(__name__))
 TF_VERSION_FILENAME = ".terraform-version"
 
 
-def download_tf_release(
-    version: str,
-    versions_dir: Path,
-    command_suffix: str,
-    tf_platform: str | None = None,
-    arch: str | None = None,
-) -> None:
-    """Download Terraform archive and return path to it."""
-    version_dir = versions_dir / version
+RELEASE_INDEX_TTL = 3600
+"""Seconds a cached copy of the Terraform release index is used before it is fetched again.
+
+This can be overridden by exporting ``RUNWAY_TFENV_INDEX_TTL``.
+
+"""
+
+
+def get_tf_cache_dir() -> Path:
+    """Get the directory where tfenv data is cached between runs."""
+    return get_cache_dir() / "tfenv"
+
+
+def tf_cache_enabled() -> bool:
+    """Whether release archives and the release index are added to the tfenv cache.
+
+    Enabled by setting ``RUNWAY_TFENV_CACHE`` to a truthy value. Releases
+    already in the cache (e.g. added by ``runway tfenv seed``) are used
+    regardless.
+
+    """
+    return os.getenv("RUNWAY_TFENV_CACHE", "").lower() in TRUTHY_VALUES
+
+
+def get_tf_platform(tf_platform: str | None = None, arch: str | None = None) -> str:
+    """Get the ``<os>_<arch>`` of a Terraform release for the current system.
 
+    Args:
+        tf_platform: Override the operating system.
+        arch: Override the architecture. Defaults to ``TFENV_ARCH`` or ``amd64``.
+
+    """
     if arch is None:
         arch = os.getenv("TFENV_ARCH", "amd64")
 
     if tf_platform:
-        tfver_os = tf_platform + "_" + arch
-    elif platform.system().startswith("Darwin"):
-        tfver_os = f"darwin_{arch}"
-    elif platform.system().startswith("Windows") or (
+        return tf_platform + "_" + arch
+    if platform.system().startswith("Darwin"):
+        return f"darwin_{arch}"
+    if platform.system().startswith("Windows") or (
         platform.system().startswith("MINGW64")
         or (platform.system().startswith("MSYS_NT") or platform.system().startswith("CYGWIN_NT"))
     ):
-        tfver_os = f"windows_{arch}"
-    else:
-        tfver_os = f"linux_{arch}"
+        return f"windows_{arch}"
+    return f"linux_{arch}"
+
+
+def get_tf_archive_dir() -> Path:
+    """Get the directory of the local Terraform release archive store."""
+    return get_tf_cache_dir() / "archives"
 
-    download_dir = tempfile.mkdtemp()
-    filename = f"terraform_{version}_{tfver_os}.zip"
+
+def get_tf_release_filename(
+    version: str, tf_platform: str | None = None, arch: str | None = None
+) -> str:
+    """Get the file name of a Terraform release archive."""
+    return f"terraform_{version}_{get_tf_platform(tf_platform, arch)}.zip"
+
+
+def fetch_tf_release(
+    version: str,
+    tf_platform: str | None = None,
+    arch: str | None = None,
+    *,
+    archive_root: Path | None = None,
+) -> Path:
+    """Ensure a verified Terraform release archive is in the local archive store.
+
+    Archives are stored alongside the ``SHA256SUMS`` file of the release in
+    the ``tfenv/archives`` directory of the Runway cache so they can be
+    shared between hosts and pre-seeded for use without network access.
+    The archive is verified against the ``SHA256SUMS`` file each time it is used.
+
+    Args:
+        version: Terraform version.
+        tf_platform: Override the operating system.
+        arch: Override the architecture.
+        archive_root: Use this directory instead of the archive store.
+
+    Returns:
+        Path to the release archive.
+
+    """
+    filename = get_tf_release_filename(version, tf_platform, arch)
     shasums_name = f"terraform_{version}_SHA256SUMS"
-    tf_url = "https://releases.hashicorp.com/terraform/" + version
+    archive_dir = (archive_root or get_tf_archive_dir()) / version
+
+    # held while downloading and verifying so other processes never see a partial archive
+    with file_lock(archive_dir.parent / f"{version}.lock"):
+        if not ((archive_dir / filename).is_file() and (archive_dir / shasums_name).is_file()):
+            tf_url = "https://releases.hashicorp.com/terraform/" + version
+            archive_dir.mkdir(parents=True, exist_ok=True)
+            # same filesystem as the archive store so files can be moved by an atomic rename
+            download_dir = Path(tempfile.mkdtemp(dir=archive_dir.parent, prefix=".download-"))
+            try:
+                LOGGER.verbose("downloading Terraform from %s...", tf_url)
+                for i in [filename, shasums_name]:
+                    urlretrieve(tf_url + "/" + i, download_dir / i)  # noqa: S310
+                # the archive is only used if the checksums are present so it is moved first
+                for i in [filename, shasums_name]:
+                    (download_dir / i).replace(archive_dir / i)
+            except URLError as exc:
+                handle_bin_download_error(exc, "Terraform")
+            finally:
+                shutil.rmtree(download_dir, ignore_errors=True)
+        else:
+            LOGGER.verbose("using Terraform %s from archive store", filename)
+
+        tf_hash = get_hash_for_filename(filename, str(archive_dir / shasums_name))
+        checksum = FileHash(hashlib.sha256(), chunk_size=1024 * 1024)  # 1 MiB
+        checksum.add_file(archive_dir / filename)
+        if tf_hash != checksum.hexdigest:
+            LOGGER.error("downloaded Terraform %s does not match sha256 %s", filename, tf_hash)
+            (archive_dir / filename).unlink(missing_ok=True)
+            sys.exit(1)
+    return archive_dir / filename
 
-    try:
-        LOGGER.verbose("downloading Terraform from %s...", tf_url)
-        for i in [filename, shasums_name]:
-            urlretrieve(tf_url + "/" + i, os.path.join(download_dir, i))  # noqa: PTH118, S310
-    except URLError as exc:
-        handle_bin_download_error(exc, "Terraform")
-
-    tf_hash = get_hash_for_filename(
-        filename,
-        os.path.join(download_dir, shasums_name),  # noqa: PTH118
-    )
-    checksum = FileHash(hashlib.sha256())
-    checksum.add_file(os.path.join(download_dir, filename))  # noqa: PTH118
-    if tf_hash != checksum.hexdigest:
-        LOGGER.error("downloaded Terraform %s does not match sha256 %s", filename, tf_hash)
-        sys.exit(1)
 
-    with zipfile.ZipFile(os.path.join(download_dir, filename)) as tf_zipfile:  # noqa: PTH118
-        version_dir.mkdir(parents=True, exist_ok=True)
-        tf_zipfile.extractall(str(version_dir))
+def download_tf_release(
+    version: str,
+    versions_dir: Path,
+    command_suffix: str,
+    tf_platform: str | None = None,
+    arch: str | None = None,
+) -> None:
+    """Download Terraform archive and extract it.
+
+    The archive is only added to the archive store if :func:`tf_cache_enabled`.
+
+    """
+    version_dir = versions_dir / version
+
+    filename = get_tf_release_filename(version, tf_platform, arch)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        archive_root = None
+        if not (tf_cache_enabled() or (get_tf_archive_dir() / version / filename).is_file()):
+            archive_root = Path(tmp_dir)
+        with zipfile.ZipFile(
+            fetch_tf_release(version, tf_platform, arch, archive_root=archive_root)
+        ) as tf_zipfile:
+            version_dir.mkdir(parents=True, exist_ok=True)
+            tf_zipfile.extractall(str(version_dir))
 
-    shutil.rmtree(download_dir)
     result = version_dir / ("terraform" + command_suffix)
     result.chmod(result.stat().st_mode | 0o0111)  # ensure it is executable
 
 
-def get_available_tf_versions(include_prerelease: bool = False) -> list[str]:
-    """Return available Terraform versions."""
-    tf_releases = json.loads(
-        requests.get("https://releases.hashicorp.com/index.json", timeout=30).text
-    )["terraform"]
+def get_tf_release_versions(*, refresh: bool = False, store: bool | None = None) -> list[str]:
+    """Get all Terraform versions in the HashiCorp release index, newest first.
+
+    The versions are cached in the ``tfenv`` directory of the Runway cache
+    and reused until :data:`RELEASE_INDEX_TTL` has passed. If the index can't
+    be fetched, a cached copy is used regardless of its age.
+
+    Args:
+        refresh: Fetch the index even if the cached copy has not expired.
+        store: Whether to cache the index after it is fetched.
+            If not provided, it is cached if :func:`tf_cache_enabled`.
+
+    """
+    cache_file = get_tf_cache_dir() / "index.json"
+    cached = read_json_file(cache_file)
+    if not isinstance(cached, dict) or not isinstance(cached.get("versions"), list):
+        cached = None
+    ttl = int(os.getenv("RUNWAY_TFENV_INDEX_TTL", str(RELEASE_INDEX_TTL)))
+    if cached and not refresh and time.time() - cached.get("fetched_at", 0) < ttl:
+        LOGGER.debug("using cached Terraform release index: %s", cache_file)
+        return cached["versions"]
+
+    try:
+        tf_releases = json.loads(
+            requests.get("https://releases.hashicorp.com/index.json", timeout=30).text
+        )["terraform"]
+    except (KeyError, requests.RequestException, ValueError) as exc:
+        if not cached:
+            raise
+        LOGGER.warning("unable to fetch Terraform release index; using cached copy: %s", exc)
+        return cached["versions"]
 
     # Remove versions that don't align with
     # PEP440 (https://peps.python.org/pep-0440/)
@@ -115,7 +243,19 @@ def get_available_tf_versions(include_prerelease: bool = False) -> list[str]:
         key=Version,
         reverse=True,
     )
+    if tf_cache_enabled() if store is None else store:
+        try:
+            write_file_atomic(
+                cache_file, json.dumps({"fetched_at": time.time(), "versions": tf_versions})
+            )
+        except OSError as exc:
+            LOGGER.debug("unable to cache Terraform release index: %s", exc)
+    return tf_versions
 
+
+def get_available_tf_versions(include_prerelease: bool = False) -> list[str]:
+    """Return available Terraform versions."""
+    tf_versions = get_tf_release_versions()
     if include_prerelease:
         return [i for i in tf_versions if i]
     return [i for i in tf_versions if i and "-" not in i]
@@ -126,20 +266,54 @@ def get_latest_tf_version(include_prerelease: bool = False) -> str:
     return get_available_tf_versions(include_prerelease)[0]
 
 
-def load_terraform_module(parser: ModuleType, path: Path) -> dict[str, Any]:
+def _load_terraform_block(parser: ModuleType, content: str, block: str) -> dict[str, Any]:
+    """Load blocks of one type from the content of a Terraform file.
+
+    The result is cached in the ``tfenv`` directory of the Runway cache,
+    keyed on the parser, the type of block, and a hash of the content.
+
+    """
+    digest = hashlib.sha256(
+        f"{parser.__name__}\0{getattr(parser, '__version__', '')}\0{block}\0{content}".encode()
+    ).hexdigest()
+    cache_file = get_tf_cache_dir() / "blocks" / f"{digest}.json"
+    cached = read_json_file(cache_file)
+    if isinstance(cached, dict):
+        return cast("dict[str, Any]", cached)
+    tf_config = cast("dict[str, Any]", parser.loads(content))
+    result = {block: tf_config[block]} if block in tf_config else {}
+    try:
+        write_file_atomic(cache_file, json.dumps(result))
+    except (OSError, TypeError, ValueError) as exc:
+        LOGGER.debug("unable to cache parsed Terraform file: %s", exc)
+    return result
+
+
+def load_terraform_module(
+    parser: ModuleType, path: Path, *, block: str | None = None
+) -> dict[str, Any]:
     """Load all Terraform files in a module into one dict.
 
     Args:
         parser: Parser to use when loading files.
         path: Terraform module path. All Terraform files in the
             path will be loaded.
+        block: Only load blocks of this type (e.g. ``terraform``).
+            Files that don't contain one are not parsed and the result of
+            parsing each file is cached between runs.
 
     """
     result: dict[str, Any] = {}
+    block_regex = re.compile(rf"^\s*{re.escape(block)}\s*{{", re.MULTILINE) if block else None
     LOGGER.debug("using %s parser to load module: %s", parser.__name__.upper(), path)
     for tf_file in path.glob("*.tf"):
         try:
-            tf_config = parser.loads(tf_file.read_text())
+            content = tf_file.read_text()
+            if block_regex and not block_regex.search(content):
+                continue
+            tf_config = (
+                _load_terraform_block(parser, content, block) if block else parser.loads(content)
+            )
             result = merge_dicts(result, cast("dict[str, Any]", tf_config))
         except Exception as exc:  # noqa: BLE001
             raise HclParserError(exc, tf_file, parser) from None
@@ -215,13 +389,13 @@ class TFEnvManager(EnvManager):
 
         try:
             result: dict[str, Any] | list[dict[str, Any]] = load_terraform_module(
-                hcl2, self.path
+                hcl2, self.path, block="terraform"
             ).get("terraform", cast("dict[str, Any]", {}))
         except HclParserError as exc:
             LOGGER.warning(exc)
             LOGGER.warning("failed to parse as HCL2; trying HCL...")
             try:
-                result = load_terraform_module(hcl, self.path).get(
+                result = load_terraform_module(hcl, self.path, block="terraform").get(
                     "terraform", cast("dict[str, Any]", {})
                 )
             except HclParserError as exc2:
@@ -8,7 +8,6 @@ from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any, ClassVar, Generic, TypedDict, TypeVar, cast, overload
 
 import yaml
-from troposphere import BaseAWSObject
 from typing_extensions import Literal
 
 from ...cfngin.utils import read_value_from_path
@@ -242,6 +241,8 @@ class LookupHandler(ABC, Generic[ContextTypeVar]):
             value: Troposphere resource to convert to a MutableMap for parsing.
 
         """
+        from troposphere import BaseAWSObject  # noqa: PLC0415
+
         if not isinstance(value, BaseAWSObject):
             raise TypeError(
                 'value of type "%s" must of type "troposphere.'
@@ -6,9 +6,11 @@ import logging
 import subprocess
 from typing import TYPE_CHECKING, Any, Generic, TypeVar, cast
 
+from ..compat import cached_property
+from ..constants import TRUTHY_VALUES
 from ..exceptions import NpmNotFound
-from ..utils import which
-from .utils import NPM_BIN, format_npm_command_for_logging, use_npm_ci
+from ..utils import get_cache_dir, which
+from .utils import NPM_BIN, NodeModulesCache, format_npm_command_for_logging, use_npm_ci
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -154,6 +156,22 @@ class RunwayModuleNpm(RunwayModule[_ModuleOptionsTypeVar]):
         self.check_for_npm(logger=self.logger)  # fail fast
         self.warn_on_boto_env_vars(self.ctx.env.vars, logger=logger)
 
+    @cached_property
+    def node_modules_cache(self) -> NodeModulesCache | None:
+        """Cache of ``node_modules`` used in lieu of running ``npm ci``.
+
+        ``None`` unless ``RUNWAY_NPM_CACHE`` is set to a truthy value.
+
+        """
+        if self.ctx.env.vars.get("RUNWAY_NPM_CACHE", "").lower() not in TRUTHY_VALUES:
+            return None
+        return NodeModulesCache(
+            self.path,
+            cache_dir=get_cache_dir(self.ctx.env.vars) / "node_modules",
+            environ=self.ctx.env.vars,
+            logger=self.logger,
+        )
+
     def log_npm_command(self, command: list[str]) -> None:
         """Log an npm command that is going to be run.
 
@@ -172,12 +190,20 @@ class RunwayModuleNpm(RunwayModule[_ModuleOptionsTypeVar]):
         if self.ctx.no_color:
             cmd.append("--no-color")
         if self.ctx.is_noninteractive and use_npm_ci(self.path):
+            if self.node_modules_cache and self.node_modules_cache.restore():
+                self.logger.info("skipped npm ci")
+                for script in self.node_modules_cache.lifecycle_scripts:
+                    self.logger.info("running npm run %s...", script)
+                    subprocess.check_call([NPM_BIN, "run", script, *cmd[2:]])
+                return
             self.logger.info("running npm ci...")
             cmd[1] = "ci"
         else:
             self.logger.info("running npm install...")
             cmd[1] = "install"
         subprocess.check_call(cmd)
+        if cmd[1] == "ci" and self.node_modules_cache:
+            self.node_modules_cache.save()
 
     def package_json_missing(self) -> bool:
         """Check for the existence for a package.json file in the module.
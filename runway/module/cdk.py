@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import concurrent.futures
 import logging
 import platform
 import subprocess
 import sys
+import tempfile
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
 
 from typing_extensions import Literal
@@ -18,8 +21,6 @@ from .base import ModuleOptions, RunwayModuleNpm
 from .utils import generate_node_command, run_module_command
 
 if TYPE_CHECKING:
-    from pathlib import Path
-
     from .._logging import RunwayLogger
     from ..context import RunwayContext
 
@@ -210,16 +211,92 @@ class CloudDevelopmentKit(RunwayModuleNpm[CloudDevelopmentKitOptions]):
             sys.exit(exc.returncode)
         self.logger.info("plan (complete)")
 
-    def cdk_list(self) -> list[str]:
-        """Execute ``cdk list`` command."""
+    def cdk_diff_stacks(self, stack_names: list[str], *, app: Path) -> None:
+        """Execute ``cdk diff`` for each stack in a cloud assembly concurrently.
+
+        The output of each diff is captured and written once the diff is
+        complete, in the order the stacks were provided, so the output of
+        one stack is never interleaved with another.
+
+        Args:
+            stack_names: Names of the stacks to diff.
+            app: Path to a synthesized cloud assembly.
+
+        """
+        self.logger.info("plan (in progress)")
+        cmds = {
+            stack_name: self.gen_cmd("diff", args_list=["--app", str(app), stack_name])
+            for stack_name in stack_names
+        }
+        failed: list[tuple[str, int]] = []
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(len(cmds), self.ctx.env.max_concurrent_modules) or None
+        ) as executor:
+            results = executor.map(
+                lambda cmd: subprocess.run(
+                    cmd,
+                    check=False,
+                    env=self.ctx.env.vars,
+                    stderr=subprocess.STDOUT,
+                    stdout=subprocess.PIPE,
+                ),
+                cmds.values(),
+            )
+            for stack_name, result in zip(cmds, results):
+                self.logger.info("stack %s:", stack_name)
+                sys.stderr.write(result.stdout.decode(errors="replace"))
+                sys.stderr.flush()
+                if result.returncode:
+                    failed.append((stack_name, result.returncode))
+        if failed:
+            for stack_name, returncode in failed:
+                self.logger.error(
+                    "CDK returned %s when running diff for stack %s", returncode, stack_name
+                )
+            self.logger.error(
+                "this can be the result of a runtime error or the stack "
+                "differing from what has been deployed if aws-cdk:enableDiffNoFail "
+                "is not enabled"
+            )
+            # TODO (kyle): raise error instead of sys.exit() when refactoring cli error handling
+            sys.exit(failed[0][1])
+        self.logger.info("plan (complete)")
+
+    def cdk_list(self, *, app: Path | None = None) -> list[str]:
+        """Execute ``cdk list`` command.
+
+        Args:
+            app: Path to a synthesized cloud assembly to list the stacks of
+                rather than synthesizing the app.
+
+        """
         result = subprocess.check_output(
-            self.gen_cmd("list", include_context=True),
+            self.gen_cmd("list", args_list=["--app", str(app)])
+            if app
+            else self.gen_cmd("list", include_context=True),
             env=self.ctx.env.vars,
         ).decode()
         result = result.strip().split("\n")
         LOGGER.debug("found stacks: %s", result)
         return result
 
+    def cdk_synth(self, output_dir: Path) -> None:
+        """Execute ``cdk synthesize`` command.
+
+        Args:
+            output_dir: Directory where the cloud assembly will be written.
+
+        """
+        self.logger.info("synth (in progress)")
+        run_module_command(
+            cmd_list=self.gen_cmd(
+                "synthesize", ["--output", str(output_dir), "--quiet"], include_context=True
+            ),
+            env_vars=self.ctx.env.vars,
+            logger=self.logger,
+        )
+        self.logger.info("synth (complete)")
+
     def deploy(self) -> None:
         """Run cdk deploy."""
         if self.skip:
@@ -284,13 +361,22 @@ class CloudDevelopmentKit(RunwayModuleNpm[CloudDevelopmentKitOptions]):
         self.cdk_bootstrap()
 
     def plan(self) -> None:
-        """Run cdk diff."""
+        """Run cdk diff.
+
+        The app is synthesized once. The resulting cloud assembly is used to
+        list the stacks and to diff each of them.
+
+        """
         if self.skip:
             return
         self.npm_install()
         self.run_build_steps()
-        for stack_name in self.cdk_list():
-            self.cdk_diff(stack_name)
+        with tempfile.TemporaryDirectory(prefix="runway-cdk-") as tmp_dir:
+            app = Path(tmp_dir) / "cdk.out"
+            self.cdk_synth(app)
+            stack_names = [name for name in self.cdk_list(app=app) if name]
+            if stack_names:
+                self.cdk_diff_stacks(stack_names, app=app)
 
     def run_build_steps(self) -> None:
         """Run build steps."""
@@ -3,6 +3,10 @@
 from __future__ import annotations
 
 import argparse
+import concurrent.futures
+import functools
+import hashlib
+import json
 import logging
 import os
 import re
@@ -14,24 +18,54 @@ from pathlib import Path
 from typing import IO, TYPE_CHECKING, Any, Callable, cast
 
 import yaml
+from botocore.exceptions import ClientError
 
 from .._logging import PrefixAdaptor
-from ..cfngin.hooks.staticsite.utils import get_hash_of_files
+from ..cfngin.hooks.staticsite.utils import calculate_hash_of_files, get_files_to_hash
 from ..compat import cached_property
 from ..config.models.runway.options.serverless import (
     RunwayServerlessModuleOptionsDataModel,
 )
-from ..s3_utils import does_s3_object_exist, download, upload
-from ..utils import YamlDumper, merge_dicts
+from ..constants import TRUTHY_VALUES
+from ..utils import YamlDumper, get_cache_dir, merge_dicts, read_json_file, write_file_atomic
 from .base import ModuleOptions, RunwayModuleNpm
 from .utils import generate_node_command, run_module_command
 
 if TYPE_CHECKING:
+    from mypy_boto3_s3.client import S3Client
+
     from .._logging import RunwayLogger
     from ..context import RunwayContext
     from ..type_defs import AnyPath, AnyPathConstrained
 
 LOGGER = cast("RunwayLogger", logging.getLogger(__name__))
+ARTIFACT_LIST_MAX_PAGES = 2
+"""Max number of pages listed from the root of a promotezip bucket.
+
+Packages not found once this many pages have been listed are checked
+individually so the cost of listing doesn't grow with the bucket.
+
+"""
+ARTIFACT_SYNC_MAX_WORKERS = 10
+"""Max number of Serverless artifacts transferred to/from S3 at once."""
+SOURCE_HASH_CACHE: dict[str, str] = {}
+"""Hash of source code keyed on the path, size, and modification time of its files.
+
+Used to avoid reading the same files more than once in the current process.
+
+"""
+SLS_PRINT_ENV_REGEX = re.compile(r"\$\{env:([\w.-]+)")
+"""Environment variables referenced by a Serverless config."""
+SLS_PRINT_FILE_REGEX = re.compile(r"\$\{file\(\s*['\"]?([^)'\"]+)")
+"""Paths of files referenced by a Serverless config."""
+SLS_PRINT_UNCACHEABLE_REGEX = re.compile(
+    r"\$\{(?:aws|cf|param|s3|ssm)[(.:]|\$\{file\([^)]+\.[cm]?[jt]s\)"
+)
+"""Variable sources resolved remotely or by running code.
+
+The value of these can change without any change to the local project.
+
+"""
 
 
 def gen_sls_config_files(stage: str, region: str) -> list[str]:
@@ -344,13 +378,24 @@ class Serverless(RunwayModuleNpm[ServerlessOptions]):
         args = ["--format", "yaml"]
         if item_path:
             args.extend(["--path", item_path])
+        cmd = self.gen_cmd("print", args_list=args)
+        cache_file = self._get_sls_print_cache_file(cmd)
+        cached = read_json_file(cache_file) if cache_file else None
+        if cached is not None:
+            self.logger.verbose("using cached result of sls print: %s", cache_file)
+            return cached
         result = yaml.safe_load(
             subprocess.check_output(
-                self.gen_cmd("print", args_list=args),
+                cmd,
                 # disable all deprecation messages to ensure the output is "clean"
                 env={"SLS_DEPRECATION_DISABLE": "*", **self.ctx.env.vars},
             )
         )
+        if cache_file:
+            try:
+                write_file_atomic(cache_file, json.dumps(result))
+            except (OSError, TypeError, ValueError) as exc:
+                self.logger.debug("unable to cache result of sls print: %s", exc)
         # this could be expensive so only dump if needed
         if self.logger.getEffectiveLevel() == logging.DEBUG:
             self.logger.debug(  # cov: ignore
@@ -358,6 +403,93 @@ class Serverless(RunwayModuleNpm[ServerlessOptions]):
             )
         return result
 
+    def _is_hashed_sls_file_ref(self, directory: Path, ref: str) -> bool:
+        """Determine if a file referenced with ``${file(...)}`` is hashed.
+
+        Files are hashed if they are in the module, excluding ``node_modules``
+        and hidden directories. A path that is absolute or where an entire
+        directory is a variable (e.g. ``${self:custom.dir}/config.yml``) could
+        resolve to anywhere so it is never considered hashed.
+
+        Args:
+            directory: Directory of the file containing the reference.
+            ref: Path of the referenced file.
+
+        """
+        if not ref or ref.startswith(("~", "$")) or os.path.isabs(ref):  # noqa: PTH117
+            return False
+        parts = Path(
+            os.path.normpath(os.path.join(os.path.relpath(directory, self.path), ref))  # noqa: PTH118
+        ).parts
+        return bool(parts) and not any(
+            part == "node_modules" or part.startswith(".") or re.fullmatch(r"\$\{.*\}", part)
+            for part in parts
+        )
+
+    def _get_sls_print_cache_file(self, cmd: list[str]) -> Path | None:
+        """Get the file where the result of ``sls print`` is cached for a command.
+
+        The name of the file is a hash of everything the result depends on:
+        the command, the files of the project (excluding ``node_modules`` and
+        hidden directories), and the environment variables referenced in
+        JSON/YAML files or used by Serverless.
+
+        Args:
+            cmd: The ``sls print`` command.
+
+        Returns:
+            ``None`` unless ``RUNWAY_SLS_PRINT_CACHE`` is set to a truthy value
+            or if the project can't be cached because it uses variable sources
+            that are resolved remotely or by running code or references files
+            that are not hashed (see :meth:`_is_hashed_sls_file_ref`).
+
+        """
+        if self.ctx.env.vars.get("RUNWAY_SLS_PRINT_CACHE", "").lower() not in TRUTHY_VALUES:
+            return None
+        digest = hashlib.sha256()
+        env_names = {name for name in self.ctx.env.vars if name.startswith(("SERVERLESS_", "SLS_"))}
+        for root, dirs, files in os.walk(self.path):
+            dirs[:] = sorted(i for i in dirs if not i.startswith(".") and i != "node_modules")
+            for name in sorted(files):
+                file_path = Path(root) / name
+                if name.startswith("serverless.") and file_path.suffix in (".js", ".ts"):
+                    self.logger.debug("sls print not cached; config is %s", name)
+                    return None
+                content = file_path.read_bytes()
+                if file_path.suffix in (".json", ".yaml", ".yml"):
+                    text = content.decode(errors="replace")
+                    if SLS_PRINT_UNCACHEABLE_REGEX.search(text):
+                        self.logger.debug(
+                            "sls print not cached; %s uses variables resolved remotely", file_path
+                        )
+                        return None
+                    for ref in SLS_PRINT_FILE_REGEX.findall(text):
+                        if not self._is_hashed_sls_file_ref(Path(root), ref.strip()):
+                            self.logger.debug(
+                                "sls print not cached; %s references a file that is not part "
+                                "of the module: %s",
+                                file_path,
+                                ref,
+                            )
+                            return None
+                    env_names.update(SLS_PRINT_ENV_REGEX.findall(text))
+                if name.endswith(".tmp.serverless.yml"):
+                    continue  # hashed as part of the command
+                digest.update(str(file_path.relative_to(self.path)).encode() + b"\0")
+                digest.update(hashlib.sha256(content).digest())
+        digest.update(
+            json.dumps(
+                [
+                    hashlib.sha256((self.path / i).read_bytes()).hexdigest()
+                    if i.endswith(".tmp.serverless.yml")
+                    else i
+                    for i in cmd
+                ]
+            ).encode()
+        )
+        digest.update(json.dumps({i: self.ctx.env.vars.get(i) for i in sorted(env_names)}).encode())
+        return get_cache_dir(self.ctx.env.vars) / "serverless" / f"{digest.hexdigest()}.json"
+
     def sls_remove(self, *, skip_install: bool = False) -> None:
         """Execute ``sls remove`` command.
 
@@ -469,7 +601,7 @@ class ServerlessArtifact:
         """File hash(es) of each service's source code."""
         if self.config.get("package", {"": ""}).get("individually"):
             return {
-                name: get_hash_of_files(
+                name: self.get_hash_of_files(
                     self.path / os.path.dirname(detail.get("handler"))  # noqa: PTH120
                 )
                 for name, detail in self.config.get("functions", {}).items()
@@ -481,41 +613,166 @@ class ServerlessArtifact:
                 directories.append(func_path)
         if isinstance(self.config["service"], dict):
             # handle sls<3.0.0 potential service property object notation
-            return {self.config["service"]["name"]: get_hash_of_files(self.path, directories)}
-        return {self.config["service"]: get_hash_of_files(self.path, directories)}
+            return {self.config["service"]["name"]: self.get_hash_of_files(self.path, directories)}
+        return {self.config["service"]: self.get_hash_of_files(self.path, directories)}
+
+    def get_hash_of_files(
+        self,
+        root_path: Path,
+        directories: list[dict[str, list[str] | str | None]] | None = None,
+    ) -> str:
+        """Generate md5 hash of files, reusing the result if they have not changed.
+
+        Files are considered unchanged if their path, size, and modification
+        time are the same. Results are kept for the current process and, if
+        ``RUNWAY_SLS_HASH_CACHE`` is set to a truthy value, in the
+        ``serverless/hash`` directory of the cache directory for later runs.
+
+        Args:
+            root_path: Base directory where all paths will be relative to.
+            directories: List of mappings that describe the paths to hash and
+                files to exclude.
+
+        """
+        files = sorted(get_files_to_hash(root_path, directories))
+        fingerprint = hashlib.sha256(f"{root_path.resolve()}\0".encode())
+        for file_path in files:
+            stat = file_path.stat()
+            fingerprint.update(f"{file_path}\0{stat.st_size}\0{stat.st_mtime_ns}\0".encode())
+        key = fingerprint.hexdigest()
+        if key in SOURCE_HASH_CACHE:
+            return SOURCE_HASH_CACHE[key]
+        cache_file = (
+            get_cache_dir(self.ctx.env.vars) / "serverless" / "hash" / f"{key}.json"
+            if self.ctx.env.vars.get("RUNWAY_SLS_HASH_CACHE", "").lower() in TRUTHY_VALUES
+            else None
+        )
+        cached = read_json_file(cache_file) if cache_file else None
+        if isinstance(cached, str):
+            self.logger.debug("using cached hash of unchanged files in %s", root_path)
+            SOURCE_HASH_CACHE[key] = cached
+            return cached
+        result = SOURCE_HASH_CACHE[key] = calculate_hash_of_files(files, root_path)
+        if cache_file:
+            try:
+                write_file_atomic(cache_file, json.dumps(result))
+            except OSError as exc:
+                self.logger.debug("unable to cache hash of files: %s", exc)
+        return result
 
     def sync_with_s3(self, bucket_name: str) -> None:
         """Sync local archive files with S3 bucket.
 
+        Existing archives are found with a single listing of the bucket.
+        Archives are then downloaded or uploaded concurrently.
+
         Args:
             bucket_name: Name of S3 bucket to upload files to.
 
         """
-        session = self.ctx.get_session()
-        for name, file_hash in self.source_hash.items():
-            file_path = self.package_path / f"{name}.zip"
-            obj_key = f"{file_hash}.zip"
-            if does_s3_object_exist(
-                bucket_name,
-                obj_key,
-                session=session,
-                region=self.ctx.env.aws_region,
-            ):
+        s3_client = self.ctx.get_session().client("s3")
+        artifacts = {
+            name: (self.package_path / f"{name}.zip", f"{file_hash}.zip")
+            for name, file_hash in self.source_hash.items()
+        }
+        existing_keys = self._get_existing_keys(
+            s3_client, bucket_name, {obj_key for _, obj_key in artifacts.values()}
+        )
+        transfers: list[Callable[[], None]] = []
+        uploads: set[str] = set()
+        for name, (file_path, obj_key) in artifacts.items():
+            if obj_key in existing_keys:
                 self.logger.info("found existing package for %s", name)
-                download(
-                    bucket=bucket_name,
-                    key=obj_key,
-                    file_path=str(file_path),
-                    session=session,
+                self.logger.info("downloading s3://%s/%s to %s...", bucket_name, obj_key, file_path)
+                transfers.append(
+                    functools.partial(
+                        s3_client.download_file,
+                        Bucket=bucket_name,
+                        Key=obj_key,
+                        Filename=str(file_path),
+                    )
+                )
+                continue
+            self.logger.info("no existing package found for %s", name)
+            if not file_path.is_file():
+                self.logger.info("local file not found for %s", name)
+                continue
+            if obj_key in uploads:  # functions with the same source share a package
+                continue
+            uploads.add(obj_key)
+            self.logger.info("uploading %s to s3://%s/%s...", file_path, bucket_name, obj_key)
+            transfers.append(
+                functools.partial(
+                    s3_client.upload_file,
+                    Filename=str(file_path),
+                    Bucket=bucket_name,
+                    Key=obj_key,
                 )
-            else:
-                self.logger.info("no existing package found for %s", name)
-                if not file_path.is_file():
-                    self.logger.info("local file not found for %s", name)
-                    continue
-                upload(
-                    bucket=bucket_name,
-                    key=obj_key,
-                    filename=str(file_path),
-                    session=session,
+            )
+        if not transfers:
+            return
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(len(transfers), ARTIFACT_SYNC_MAX_WORKERS)
+        ) as executor:
+            for future in concurrent.futures.as_completed(
+                executor.submit(transfer) for transfer in transfers
+            ):
+                future.result()
+
+    def _get_existing_keys(self, s3_client: S3Client, bucket_name: str, keys: set[str]) -> set[str]:
+        """Determine which keys exist at the root of an S3 bucket.
+
+        Up to :data:`ARTIFACT_LIST_MAX_PAGES` pages of the bucket are listed.
+        Keys that are not found in them, or all keys if the bucket can't be
+        listed, are checked individually.
+
+        Args:
+            s3_client: Boto3 S3 client.
+            bucket_name: Name of S3 bucket.
+            keys: Object keys to check for.
+
+        """
+        existing: set[str] = set()
+        try:
+            for page_number, page in enumerate(
+                s3_client.get_paginator("list_objects_v2").paginate(
+                    Bucket=bucket_name, Delimiter="/"
+                ),
+                start=1,
+            ):
+                existing.update(
+                    obj["Key"] for obj in page.get("Contents", []) if obj.get("Key") in keys
                 )
+                if not page.get("IsTruncated") or existing == keys:
+                    return existing
+                if page_number >= ARTIFACT_LIST_MAX_PAGES:
+                    self.logger.debug(
+                        "s3://%s has too many objects to list; checking remaining packages instead",
+                        bucket_name,
+                    )
+                    break
+        except ClientError as exc:
+            if exc.response.get("Error", {}).get("Code") != "AccessDenied":
+                raise
+            self.logger.debug("unable to list s3://%s; checking each package instead", bucket_name)
+
+        def _exists(key: str) -> bool:
+            try:
+                s3_client.head_object(Bucket=bucket_name, Key=key)
+            except ClientError as exc:
+                if exc.response.get("Error", {}).get("Code") in ("404", "NoSuchKey"):
+                    return False
+                raise
+            return True
+
+        ordered_keys = sorted(keys - existing)
+        if not ordered_keys:
+            return existing
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(len(ordered_keys), ARTIFACT_SYNC_MAX_WORKERS)
+        ) as executor:
+            return existing | {
+                key
+                for key, exists in zip(ordered_keys, executor.map(_exists, ordered_keys))
+                if exists
+            }
@@ -330,6 +330,7 @@ class StaticSite(RunwayModule[StaticSiteOptions]):
                     "distribution_id": f"${{cfn ${{namespace}}-{self.sanitized_name}"
                     ".CFDistributionId::default=undefined}",
                     "extra_files": [i.model_dump() for i in self.options.extra_files],
+                    "rewrite_directory_index": self.parameters.rewrite_directory_index,
                     "website_url": f"${{cfn ${{namespace}}-{self.sanitized_name}"
                     ".BucketWebsiteURL::default=undefined}",
                 },
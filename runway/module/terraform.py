@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import re
@@ -20,9 +21,10 @@ from ..config.models.runway.options.terraform import (
     RunwayTerraformBackendConfigDataModel,
     RunwayTerraformModuleOptionsDataModel,
 )
+from ..constants import TRUTHY_VALUES
 from ..env_mgr.tfenv import TFEnvManager
 from ..mixins import DelCachedPropMixin
-from ..utils import DOC_SITE, Version, which
+from ..utils import DOC_SITE, Version, file_lock, get_cache_dir, which
 from .base import ModuleOptions, RunwayModule
 from .utils import run_module_command
 
@@ -344,6 +346,42 @@ class Terraform(RunwayModule[TerraformOptions], DelCachedPropMixin):
                 break  # stop looking if one is found
         return result
 
+    @property
+    def init_state(self) -> str:
+        """Hash of the inputs and outputs of ``terraform init`` for the module.
+
+        Includes the dependency lock file, the backend state written to
+        ``.terraform``, and the arguments passed to ``terraform init``.
+        If this is unchanged, the module does not need to be initialized again.
+
+        """
+        digest = hashlib.sha256()
+        for file_path in (
+            self.path / ".terraform.lock.hcl",
+            self.path / ".terraform" / "terraform.tfstate",
+        ):
+            digest.update(file_path.read_bytes() if file_path.is_file() else b"")
+            digest.update(b"\0")
+        digest.update(
+            json.dumps([*self.options.backend_config.init_args, *self.options.args.init]).encode()
+        )
+        return digest.hexdigest()
+
+    @cached_property
+    def plugin_cache_dir(self) -> Path | None:
+        """Directory shared by all modules where Terraform caches providers.
+
+        ``None`` unless ``RUNWAY_TF_PLUGIN_CACHE`` is set to a truthy value or
+        if ``TF_PLUGIN_CACHE_DIR`` is already set.
+
+        """
+        if (
+            self.ctx.env.vars.get("RUNWAY_TF_PLUGIN_CACHE", "").lower() not in TRUTHY_VALUES
+            or "TF_PLUGIN_CACHE_DIR" in self.ctx.env.vars
+        ):
+            return None
+        return get_cache_dir(self.ctx.env.vars) / "terraform" / "plugins"
+
     @property
     def skip(self) -> bool:
         """Determine if the module should be skipped."""
@@ -392,13 +430,13 @@ class Terraform(RunwayModule[TerraformOptions], DelCachedPropMixin):
         raise ValueError(f"unable to retrieve version from {self.tf_bin}")
 
     def cleanup_dot_terraform(self) -> None:
-        """Remove .terraform excluding the plugins directly.
+        """Remove .terraform excluding the plugins/providers directories.
 
         This step is crucial for allowing Runway to deploy to multiple regions
         or deploy environments without prompting the user for input.
 
-        The plugins directory is retained to improve performance when they
-        are used by subsequent runs.
+        The plugins (Terraform <0.13) and providers directories are retained to
+        improve performance when they are used by subsequent runs.
 
         """
         dot_terraform = self.path / ".terraform"
@@ -410,7 +448,7 @@ class Terraform(RunwayModule[TerraformOptions], DelCachedPropMixin):
             ".terraform directory exists from a previous run; removing some of its contents"
         )
         for child in dot_terraform.iterdir():
-            if child.name == "plugins" and child.is_dir():
+            if child.name in ("plugins", "providers") and child.is_dir():
                 self.logger.debug("directory retained: %s", child)
                 continue
             self.logger.debug("removing: %s", child)
@@ -610,12 +648,26 @@ class Terraform(RunwayModule[TerraformOptions], DelCachedPropMixin):
             ["-reconfigure", *self.options.backend_config.init_args, *self.options.args.init],
         )
         try:
-            run_module_command(
-                cmd,
-                env_vars=self.ctx.env.vars,
-                exit_on_error=False,
-                logger=self.logger,
-            )
+            if not self.plugin_cache_dir:
+                run_module_command(
+                    cmd,
+                    env_vars=self.ctx.env.vars,
+                    exit_on_error=False,
+                    logger=self.logger,
+                )
+                return
+            self.plugin_cache_dir.mkdir(parents=True, exist_ok=True)
+            # the plugin cache is not safe for concurrent use
+            with file_lock(self.plugin_cache_dir.parent / "plugins.lock"):
+                run_module_command(
+                    cmd,
+                    env_vars={
+                        **self.ctx.env.vars,
+                        "TF_PLUGIN_CACHE_DIR": str(self.plugin_cache_dir),
+                    },
+                    exit_on_error=False,
+                    logger=self.logger,
+                )
         except subprocess.CalledProcessError as shelloutexc:
             # cleaner output by not letting the exception raise
             sys.exit(shelloutexc.returncode)
@@ -715,14 +767,20 @@ class Terraform(RunwayModule[TerraformOptions], DelCachedPropMixin):
             self.logger.info("init (in progress)")
             self.terraform_init()
             if self.current_workspace != self.required_workspace:
+                init_state = self.init_state
                 if re.compile(f"^[*\\s]\\s{self.required_workspace}$", re.MULTILINE).search(
                     self.terraform_workspace_list()
                 ):
                     self.terraform_workspace_select(self.required_workspace)
                 else:
                     self.terraform_workspace_new(self.required_workspace)
-                self.logger.verbose("re-running init after workspace change...")
-                self.terraform_init()
+                if self.init_state != init_state:
+                    self.logger.verbose("re-running init after workspace change...")
+                    self.terraform_init()
+                else:
+                    self.logger.debug(
+                        "lock file and backend unchanged by workspace change; skipped re-running init"
+                    )
             self.terraform_get()
             self.logger.info("init (complete)")
             if action != "init":
@@ -2,17 +2,24 @@
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import json
 import logging
 import os
 import platform
+import shutil
 import subprocess
 import sys
+import tempfile
+from pathlib import Path
 from typing import TYPE_CHECKING, cast
 
+from ..compat import cached_property
 from ..utils import which
 
 if TYPE_CHECKING:
-    from pathlib import Path
+    from collections.abc import Mapping
     from typing import Any
 
     from .._logging import RunwayLogger
@@ -20,6 +27,18 @@ if TYPE_CHECKING:
 LOGGER = cast("RunwayLogger", logging.getLogger(__name__))
 NPM_BIN = "npm.cmd" if platform.system().lower() == "windows" else "npm"
 NPX_BIN = "npx.cmd" if platform.system().lower() == "windows" else "npx"
+NPM_LOCKFILES = ("npm-shrinkwrap.json", "package-lock.json")
+"""Lockfiles used by ``npm ci`` in order of precedence."""
+NPM_CI_LIFECYCLE_SCRIPTS = (
+    "preinstall",
+    "install",
+    "postinstall",
+    "prepublish",
+    "preprepare",
+    "prepare",
+    "postprepare",
+)
+"""Lifecycle scripts of the root package run by ``npm ci`` in the order they are run."""
 
 
 def format_npm_command_for_logging(command: list[str]) -> str:
@@ -105,7 +124,172 @@ def use_npm_ci(path: Path) -> bool:
     # https://docs.npmjs.com/cli/ci#description
     with open(os.devnull, "w", encoding="utf-8") as fnull:  # noqa: PTH123
         if (
-            (path / "package-lock.json").is_file() or (path / "npm-shrinkwrap.json").is_file()
-        ) and subprocess.call([NPM_BIN, "ci", "-h"], stdout=fnull, stderr=subprocess.STDOUT) == 0:
+            any((path / name).is_file() for name in NPM_LOCKFILES)
+            and subprocess.call([NPM_BIN, "ci", "-h"], stdout=fnull, stderr=subprocess.STDOUT) == 0
+        ):
             return True
     return False
+
+
+@functools.cache
+def get_node_versions() -> tuple[str, str]:
+    """Get the versions of node and npm found in the current path.
+
+    The result is cached for the life of the process.
+
+    """
+    return (
+        subprocess.check_output(["node", "--version"], text=True).strip(),
+        subprocess.check_output([NPM_BIN, "--version"], text=True).strip(),
+    )
+
+
+class NodeModulesCache:
+    """Content-addressed cache of ``node_modules`` directories.
+
+    Entries are keyed on a hash of the module's lockfile & ``.npmrc``, the
+    npm configuration set by environment variables, the versions of node &
+    npm, and the platform so they are only restored into a module that
+    ``npm ci`` would produce the same ``node_modules`` for.
+
+    Restoring an entry does not run the lifecycle scripts of the module
+    itself (see :attr:`lifecycle_scripts`).
+
+    """
+
+    MARKER = ".runway-npm-cache"
+    """File written to ``node_modules`` containing the key it was created from."""
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        cache_dir: Path,
+        environ: Mapping[str, str] | None = None,
+        logger: logging.Logger | logging.LoggerAdapter[Any] = LOGGER,
+    ) -> None:
+        """Instantiate class.
+
+        Args:
+            path: Root directory of the module containing the lockfile.
+            cache_dir: Directory where cache entries are stored.
+            environ: Environment variables npm is run with.
+                If not provided, ``os.environ`` is used.
+            logger: Used to write logs.
+
+        """
+        self.cache_dir = cache_dir
+        self.environ = os.environ if environ is None else environ
+        self.logger = logger
+        self.node_modules = path / "node_modules"
+        self.path = path
+
+    @cached_property
+    def key(self) -> str | None:
+        """Key of the cache entry for the module.
+
+        ``None`` if the module does not have a lockfile or the versions of
+        node & npm could not be determined.
+
+        """
+        lockfile = next(
+            (self.path / name for name in NPM_LOCKFILES if (self.path / name).is_file()), None
+        )
+        if not lockfile:
+            return None
+        try:
+            node_version, npm_version = get_node_versions()
+        except (OSError, subprocess.CalledProcessError) as exc:
+            self.logger.debug("unable to determine node/npm version: %s", exc)
+            return None
+        digest = hashlib.sha256(lockfile.read_bytes())
+        npmrc = self.path / ".npmrc"
+        digest.update(b"\0" + (npmrc.read_bytes() if npmrc.is_file() else b""))
+        npm_config = sorted(
+            f"{name.lower()}={value}"
+            for name, value in self.environ.items()
+            if name == "NODE_ENV" or name.lower().startswith("npm_config_")
+        )
+        for value in (
+            *npm_config,
+            node_version,
+            npm_version,
+            platform.system(),
+            platform.machine(),
+        ):
+            digest.update(b"\0" + value.encode())
+        return digest.hexdigest()
+
+    @cached_property
+    def lifecycle_scripts(self) -> list[str]:
+        """Lifecycle scripts of the module that ``npm ci`` would run.
+
+        These are not run when ``node_modules`` is restored from the cache
+        and need to be run separately.
+
+        """
+        try:
+            scripts = json.loads((self.path / "package.json").read_text()).get("scripts") or {}
+        except (OSError, ValueError, AttributeError):
+            return []
+        return [name for name in NPM_CI_LIFECYCLE_SCRIPTS if name in scripts]
+
+    @property
+    def entry(self) -> Path | None:
+        """Directory containing the cached ``node_modules`` of the module."""
+        return self.cache_dir / self.key if self.key else None
+
+    def is_current(self) -> bool:
+        """Whether the ``node_modules`` of the module were created from the current key."""
+        if not self.key:
+            return False
+        try:
+            return (self.node_modules / self.MARKER).read_text().strip() == self.key
+        except OSError:
+            return False
+
+    def restore(self) -> bool:
+        """Restore ``node_modules`` from the cache.
+
+        Returns:
+            Whether the module has an up to date ``node_modules`` directory.
+
+        """
+        if self.is_current():
+            self.logger.info("node_modules is up to date with lockfile")
+            return True
+        if not self.entry or not self.entry.is_dir():
+            return False
+        self.logger.info("restoring node_modules from cache...")
+        shutil.rmtree(self.node_modules, ignore_errors=True)
+        try:
+            shutil.copytree(self.entry, self.node_modules, symlinks=True)
+        except (OSError, shutil.Error) as exc:
+            self.logger.warning("unable to restore node_modules from cache: %s", exc)
+            shutil.rmtree(self.node_modules, ignore_errors=True)
+            return False
+        return True
+
+    def save(self) -> None:
+        """Add the ``node_modules`` of the module to the cache.
+
+        The copy is made in a temporary directory that is then moved into
+        place so other processes never restore a partial entry.
+
+        """
+        if not self.entry or not self.node_modules.is_dir():
+            return
+        (self.node_modules / self.MARKER).write_text(self.key or "")
+        if self.entry.is_dir():
+            return
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_dir = Path(tempfile.mkdtemp(dir=self.cache_dir, prefix=f".{self.key}."))
+        try:
+            shutil.copytree(self.node_modules, tmp_dir / "node_modules", symlinks=True)
+            (tmp_dir / "node_modules").replace(self.entry)
+            self.logger.debug("saved node_modules to cache: %s", self.entry)
+        except (OSError, shutil.Error) as exc:
+            # another process may have added the entry first
+            self.logger.debug("unable to save node_modules to cache: %s", exc)
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
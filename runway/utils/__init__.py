@@ -24,9 +24,19 @@ from pydantic import BaseModel as _BaseModel
 # make this importable without defining __all__ yet.
 # more things need to be moved of this file before starting an explicit __all__.
 from . import pydantic_validators  # noqa: F401
+from ._api_stats import API_STATS, ApiCallRecorder, run_worker  # noqa: F401
+from ._cache import (  # noqa: F401
+    file_lock,
+    get_cache_dir,
+    read_json_file,
+    write_file_atomic,
+)
+from ._credential_cache import FileCredentialCache, get_credential_cache  # noqa: F401
 from ._file_hash import FileHash  # noqa: F401
 from ._json_encoder import JsonEncoder  # noqa: F401
+from ._rate_limiter import RATE_LIMITER, AdaptiveRateLimiter  # noqa: F401
 from ._version import Version  # noqa: F401
+from ._yaml import YAML_CACHE, YamlCache, YamlLoader, yaml_load  # noqa: F401
 
 if TYPE_CHECKING:
     from types import TracebackType
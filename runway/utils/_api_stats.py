@@ -0,0 +1,417 @@
+"""Accounting of the AWS API calls made by Runway."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple, TypeVar
+
+from ..constants import TRUTHY_VALUES
+from ._cache import read_json_file, write_file_atomic
+from ._rate_limiter import THROTTLING_ERROR_CODES
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
+
+    import boto3
+    from botocore.awsrequest import AWSResponse
+    from botocore.model import OperationModel
+
+LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+LATENCY_BUCKETS = (50, 100, 250, 500, 1000, 2500, 5000, 10000)
+"""Upper bounds (in milliseconds) of the buckets of the latency histogram.
+
+Calls taking longer than the last bound are counted in an additional bucket.
+
+"""
+
+_SCOPE: ContextVar[tuple[str, ...]] = ContextVar("runway_api_stats_scope", default=())
+
+
+class ApiCallKey(NamedTuple):
+    """What an API call was made for."""
+
+    scope: str
+    region: str
+    service: str
+    operation: str
+
+
+class ApiCallStats:
+    """Statistics of the API calls made for an :class:`ApiCallKey`."""
+
+    __slots__ = ("calls", "errors", "histogram", "latency", "max_latency", "retries", "throttles")
+
+    def __init__(self) -> None:
+        """Instantiate class."""
+        self.calls = 0
+        self.errors = 0
+        self.histogram = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.latency = 0.0
+        self.max_latency = 0.0
+        self.retries = 0
+        self.throttles = 0
+
+    def add_call(self, latency: float, *, error: bool = False, retries: int = 0) -> None:
+        """Record a call.
+
+        Args:
+            latency: Milliseconds taken by the call, including retries.
+            error: Whether the call ultimately failed.
+            retries: Number of times the call was retried.
+
+        """
+        self.calls += 1
+        self.errors += int(error)
+        self.latency += latency
+        self.max_latency = max(self.max_latency, latency)
+        self.retries += retries
+        self.histogram[
+            next(
+                (index for index, bound in enumerate(LATENCY_BUCKETS) if latency <= bound),
+                len(LATENCY_BUCKETS),
+            )
+        ] += 1
+
+    def merge(self, other: ApiCallStats) -> None:
+        """Merge the statistics of another object into this one."""
+        self.calls += other.calls
+        self.errors += other.errors
+        self.histogram = [a + b for a, b in zip(self.histogram, other.histogram)]
+        self.latency += other.latency
+        self.max_latency = max(self.max_latency, other.max_latency)
+        self.retries += other.retries
+        self.throttles += other.throttles
+
+    def percentile(self, percent: float) -> str:
+        """Approximate latency percentile, as the upper bound of its histogram bucket."""
+        target = self.calls * percent / 100
+        count = 0
+        for index, bucket in enumerate(self.histogram):
+            count += bucket
+            if bucket and count >= target:
+                if index < len(LATENCY_BUCKETS):
+                    return f"<={LATENCY_BUCKETS[index]}"
+                return f">{LATENCY_BUCKETS[-1]}"
+        return "-"
+
+    @classmethod
+    def parse_obj(cls, obj: Mapping[str, Any]) -> ApiCallStats:
+        """Create an object from the output of :meth:`to_dict`."""
+        result = cls()
+        for name in cls.__slots__:
+            setattr(result, name, obj[name])
+        return result
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON serializable dict."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class ApiCallRecorder:
+    """Record the AWS API calls made from any session in the process.
+
+    Calls are counted for each combination of scope (e.g. the module and
+    stack being processed), region, service and operation.
+
+    """
+
+    REPORT_ENV_VAR = "RUNWAY_API_STATS_REPORT"
+    """Environment variable containing the path where a JSON report is written."""
+
+    SUMMARY_ENV_VAR = "RUNWAY_API_STATS"
+    """Environment variable used to enable logging of a summary."""
+
+    def __init__(self) -> None:
+        """Instantiate class."""
+        self.spool_dir: Path | None = None
+        self._lock = threading.Lock()
+        self._stats: dict[ApiCallKey, ApiCallStats] = {}
+
+    @staticmethod
+    def current_scope() -> str:
+        """Scope that calls made by the current thread are recorded in."""
+        return " > ".join(_SCOPE.get()) or "runway"
+
+    @staticmethod
+    @contextmanager
+    def scope(name: str) -> Iterator[None]:
+        """Record calls made within the context in a nested scope.
+
+        Args:
+            name: Name of the scope (e.g. name of a module or stack).
+
+        """
+        token = _SCOPE.set((*_SCOPE.get(), name))
+        try:
+            yield
+        finally:
+            _SCOPE.reset(token)
+
+    def _get(self, key: ApiCallKey) -> ApiCallStats:
+        """Get the statistics of a key. Must be called while holding the lock."""
+        if key not in self._stats:
+            self._stats[key] = ApiCallStats()
+        return self._stats[key]
+
+    def record(
+        self,
+        key: ApiCallKey,
+        latency: float,
+        *,
+        error: bool = False,
+        retries: int = 0,
+    ) -> None:
+        """Record a call.
+
+        Args:
+            key: What the call was made for.
+            latency: Milliseconds taken by the call, including retries.
+            error: Whether the call ultimately failed.
+            retries: Number of times the call was retried.
+
+        """
+        with self._lock:
+            self._get(key).add_call(latency, error=error, retries=retries)
+
+    def record_throttle(self, key: ApiCallKey) -> None:
+        """Record an attempt of a call that was throttled.
+
+        Args:
+            key: What the call was made for.
+
+        """
+        with self._lock:
+            self._get(key).throttles += 1
+
+    def register(self, session: boto3.Session) -> None:
+        """Record calls made by clients created from a session.
+
+        Must be called before clients are created from the session.
+
+        Args:
+            session: boto3 session.
+
+        """
+
+        def before_call(model: OperationModel, context: dict[str, Any], **_: Any) -> None:
+            context["runway_api_stats"] = (
+                ApiCallKey(
+                    self.current_scope(),
+                    context.get("client_region") or "global",
+                    model.service_model.service_name,
+                    model.name,
+                ),
+                time.perf_counter(),
+            )
+
+        def needs_retry(
+            request_dict: dict[str, Any],
+            response: tuple[AWSResponse, dict[str, Any]] | None = None,
+            **_: Any,
+        ) -> None:
+            call = request_dict.get("context", {}).get("runway_api_stats")
+            if (
+                call
+                and response
+                and response[1].get("Error", {}).get("Code") in THROTTLING_ERROR_CODES
+            ):
+                self.record_throttle(call[0])
+
+        def after_call(
+            http_response: AWSResponse,
+            parsed: dict[str, Any],
+            context: dict[str, Any],
+            **_: Any,
+        ) -> None:
+            call = context.get("runway_api_stats")
+            if call:
+                self.record(
+                    call[0],
+                    (time.perf_counter() - call[1]) * 1000,
+                    error=http_response.status_code >= 300,
+                    retries=parsed.get("ResponseMetadata", {}).get("RetryAttempts", 0),
+                )
+
+        def after_call_error(context: dict[str, Any], **_: Any) -> None:
+            call = context.get("runway_api_stats")
+            if call:
+                self.record(call[0], (time.perf_counter() - call[1]) * 1000, error=True)
+
+        session.events.register("before-call", before_call)
+        session.events.register("needs-retry", needs_retry)
+        session.events.register("after-call", after_call)
+        session.events.register("after-call-error", after_call_error)
+
+    def merge(self, stats: Mapping[ApiCallKey, ApiCallStats]) -> None:
+        """Merge statistics recorded elsewhere (e.g. another process)."""
+        with self._lock:
+            for key, value in stats.items():
+                self._get(key).merge(value)
+
+    def reset(self) -> None:
+        """Remove all recorded statistics."""
+        with self._lock:
+            self._stats.clear()
+
+    def stats(self) -> dict[ApiCallKey, ApiCallStats]:
+        """Statistics recorded for each key."""
+        with self._lock:
+            return dict(self._stats)
+
+    def by_operation(self) -> dict[tuple[str, str], ApiCallStats]:
+        """Statistics of each service and operation across all scopes and regions."""
+        result: dict[tuple[str, str], ApiCallStats] = {}
+        for key, value in self.stats().items():
+            result.setdefault((key.service, key.operation), ApiCallStats()).merge(value)
+        return result
+
+    def format_summary(self) -> str:
+        """Format a table summarizing calls made to each operation."""
+        header = ("service", "operation", "calls", "errors", "retries", "throttles")
+        header += ("avg ms", "p50 ms", "p90 ms", "max ms")
+        rows = [header]
+        totals = ApiCallStats()
+        for (service, operation), value in sorted(
+            self.by_operation().items(), key=lambda item: (-item[1].calls, item[0])
+        ):
+            totals.merge(value)
+            rows.append(self._format_row(service, operation, value))
+        rows.append(self._format_row("total", "", totals))
+        widths = [max(len(row[index]) for row in rows) for index in range(len(header))]
+        return "\n".join(
+            "  ".join(
+                cell.ljust(width) if index < 2 else cell.rjust(width)
+                for index, (cell, width) in enumerate(zip(row, widths))
+            ).rstrip()
+            for row in rows
+        )
+
+    @staticmethod
+    def _format_row(service: str, operation: str, value: ApiCallStats) -> tuple[str, ...]:
+        """Format a row of the summary table."""
+        return (
+            service,
+            operation,
+            str(value.calls),
+            str(value.errors),
+            str(value.retries),
+            str(value.throttles),
+            f"{value.latency / value.calls:.0f}" if value.calls else "-",
+            value.percentile(50),
+            value.percentile(90),
+            f"{value.max_latency:.0f}",
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON serializable dict."""
+        return {
+            "calls": [
+                {
+                    "scope": key.scope,
+                    "region": key.region,
+                    "service": key.service,
+                    "operation": key.operation,
+                    **value.to_dict(),
+                }
+                for key, value in sorted(self.stats().items())
+            ],
+            "latency_buckets": list(LATENCY_BUCKETS),
+        }
+
+    @classmethod
+    def parse_dict(cls, data: Mapping[str, Any]) -> dict[ApiCallKey, ApiCallStats]:
+        """Parse the output of :meth:`to_dict`."""
+        return {
+            ApiCallKey(
+                call["scope"], call["region"], call["service"], call["operation"]
+            ): ApiCallStats.parse_obj(call)
+            for call in data.get("calls", [])
+        }
+
+    def spool(self) -> None:
+        """Write statistics recorded by a worker process to the spool directory."""
+        if self.spool_dir:
+            write_file_atomic(
+                self.spool_dir / f"{os.getpid()}-{uuid.uuid4().hex}.json",
+                json.dumps(self.to_dict()),
+            )
+
+    def _merge_spool(self) -> None:
+        """Merge statistics written to the spool directory by worker processes."""
+        if not self.spool_dir:
+            return
+        for path in sorted(self.spool_dir.glob("*.json")):
+            data = read_json_file(path)
+            if data:
+                self.merge(self.parse_dict(data))
+
+    @contextmanager
+    def collect(self, environ: Mapping[str, str], *, logger: Any = LOGGER) -> Iterator[None]:
+        """Collect statistics for the duration of the context and report them on exit.
+
+        When enabled by :attr:`SUMMARY_ENV_VAR`, a summary table is logged.
+        When :attr:`REPORT_ENV_VAR` is set, a JSON report is written to the path
+        it contains. Statistics of calls made by forked worker processes are
+        included when they are run with :func:`run_worker`.
+
+        Args:
+            environ: Environment variables.
+            logger: Logger used for the summary.
+
+        """
+        report_path = environ.get(self.REPORT_ENV_VAR)
+        summary = environ.get(self.SUMMARY_ENV_VAR, "").lower() in TRUTHY_VALUES
+        if not (report_path or summary):
+            yield
+            return
+        self.reset()
+        self.spool_dir = Path(tempfile.mkdtemp(prefix="runway-api-stats-"))
+        try:
+            yield
+        finally:
+            self._merge_spool()
+            shutil.rmtree(self.spool_dir, ignore_errors=True)
+            self.spool_dir = None
+            if summary:
+                logger.info("AWS API calls:\n%s", self.format_summary())
+            if report_path:
+                path = Path(report_path).expanduser()
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_text(json.dumps(self.to_dict(), indent=2) + "\n")
+                logger.info("AWS API call report written to %s", path)
+
+
+API_STATS = ApiCallRecorder()
+"""Records calls made from all sessions created by Runway."""
+
+
+def run_worker(func: Callable[..., _T], *args: Any, **kwargs: Any) -> _T:
+    """Run a function in a forked worker, spooling the API calls it makes.
+
+    Statistics inherited from the parent process are discarded before the
+    function is called so calls are only counted once.
+
+    Args:
+        func: Function to call.
+        *args: Positional arguments passed to the function.
+        **kwargs: Keyword arguments passed to the function.
+
+    """
+    API_STATS.reset()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        API_STATS.spool()
@@ -0,0 +1,120 @@
+"""Utilities for Runway's persistent, on-disk cache."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import platform
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
+
+LOGGER = logging.getLogger(__name__)
+
+try:  # posix
+    import fcntl
+except ImportError:  # cov: ignore
+    fcntl = None
+
+try:  # windows
+    import msvcrt
+except ImportError:
+    msvcrt = None
+
+
+def get_cache_dir(environ: Mapping[str, str] | None = None) -> Path:
+    """Get the directory where Runway stores cached data between runs.
+
+    The location can be overridden by exporting ``RUNWAY_CACHE_DIR``.
+
+    Args:
+        environ: Environment variables. If not provided, ``os.environ`` is used.
+
+    """
+    environ = os.environ if environ is None else environ
+    if environ.get("RUNWAY_CACHE_DIR"):
+        return Path(environ["RUNWAY_CACHE_DIR"]).expanduser().resolve()
+    if platform.system() == "Windows":
+        if "LOCALAPPDATA" in environ:
+            return Path(environ["LOCALAPPDATA"]) / "runway" / "cache"
+        return Path.home() / "AppData" / "Local" / "runway" / "cache"
+    if environ.get("XDG_CACHE_HOME"):
+        return Path(environ["XDG_CACHE_HOME"]) / "runway"
+    return Path.home() / ".cache" / "runway"
+
+
+def _lock_file(handle: IO[Any], *, shared: bool) -> None:
+    """Acquire an OS level lock on an open file."""
+    if fcntl:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+    elif msvcrt:  # cov: ignore
+        handle.seek(0)
+        msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+
+
+def _unlock_file(handle: IO[Any]) -> None:
+    """Release an OS level lock on an open file."""
+    if fcntl:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+    elif msvcrt:  # cov: ignore
+        handle.seek(0)
+        msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+@contextmanager
+def file_lock(path: Path, *, shared: bool = False) -> Iterator[None]:
+    """Hold an advisory, cross-process lock for the duration of the context.
+
+    The lock is held on a separate file so the data file itself can be
+    atomically replaced while the lock is held.
+
+    Args:
+        path: Path to the lock file. It will be created if it does not exist.
+        shared: Acquire a shared (read) lock instead of an exclusive one.
+
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a+") as handle:
+        _lock_file(handle, shared=shared)
+        try:
+            yield
+        finally:
+            _unlock_file(handle)
+
+
+def write_file_atomic(path: Path, content: str, *, mode: int | None = None) -> None:
+    """Write to a file by replacing it so readers never see a partial write.
+
+    Args:
+        path: Path of the file to write.
+        content: Content to write to the file.
+        mode: Optional file permissions to apply before the file is moved into place.
+
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as handle:
+            handle.write(content)
+        if mode is not None:
+            Path(tmp_name).chmod(mode)
+        Path(tmp_name).replace(path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def read_json_file(path: Path) -> Any:
+    """Read a JSON file, returning ``None`` if it is missing or unreadable."""
+    try:
+        return json.loads(path.read_text())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as exc:
+        LOGGER.debug("unable to read cache file %s: %s", path, exc)
+        return None
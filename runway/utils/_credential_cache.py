@@ -0,0 +1,157 @@
+"""Cross-process credential cache for assumed roles and AWS SSO."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from collections.abc import MutableMapping
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any
+
+from ..constants import BOTO3_CREDENTIAL_CACHE, TRUTHY_VALUES
+from ._cache import file_lock, get_cache_dir, read_json_file, write_file_atomic
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
+    from pathlib import Path
+
+LOGGER = logging.getLogger(__name__)
+
+_FILE_CACHES: dict[Path, FileCredentialCache] = {}
+_FILE_CACHES_LOCK = threading.Lock()
+
+
+def _serialize(obj: Any) -> str:
+    """Serialize values that are not natively supported by JSON."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    return str(obj)
+
+
+class FileCredentialCache(MutableMapping[str, Any]):
+    """JSON file backed credential cache that can be shared between processes.
+
+    Implements the same interface as :class:`botocore.credentials.JSONFileCache`
+    so it can be used as the ``cache`` of any botocore credential fetcher.
+    Values are also kept in memory so a process only reads each file once
+    while the credentials it contains are valid.
+
+    Each entry is stored in its own file. Reads and writes are protected by an
+    advisory lock so forked workers and concurrent Runway invocations can
+    safely share credentials. Entries that have expired are treated as missing.
+
+    """
+
+    def __init__(self, cache_dir: Path, *, memory: dict[str, Any] | None = None) -> None:
+        """Instantiate class.
+
+        Args:
+            cache_dir: Directory where credentials will be stored.
+            memory: In-memory cache to read through.
+
+        """
+        self.cache_dir = cache_dir
+        self._memory = {} if memory is None else memory
+
+    @property
+    def _lock_path(self) -> Path:
+        """Path to the lock file protecting the cache directory."""
+        return self.cache_dir / ".lock"
+
+    def _path(self, key: str) -> Path:
+        """Path to the file used to store the value of a key."""
+        return self.cache_dir / f"{key}.json"
+
+    @staticmethod
+    def _is_expired(value: Any) -> bool:
+        """Determine if a cached value contains credentials that have expired."""
+        if not isinstance(value, dict):
+            return False
+        expires_at = value.get("Credentials", {}).get("Expiration")  # type: ignore
+        if isinstance(expires_at, str):
+            try:
+                expires_at = datetime.fromisoformat(expires_at.replace("Z", "+00:00"))
+            except ValueError:
+                return False
+        if not isinstance(expires_at, datetime):
+            return False
+        if not expires_at.tzinfo:
+            expires_at = expires_at.replace(tzinfo=timezone.utc)
+        return expires_at <= datetime.now(timezone.utc)
+
+    def __contains__(self, key: object) -> bool:
+        """Check if a key is in the cache and has not expired."""
+        try:
+            self[str(key)]
+        except KeyError:
+            return False
+        return True
+
+    def __getitem__(self, key: str) -> Any:
+        """Get a value from the cache."""
+        value = self._memory.get(key)
+        if value is None or self._is_expired(value):
+            with file_lock(self._lock_path, shared=True):
+                value = read_json_file(self._path(key))
+            if value is None or self._is_expired(value):
+                self._memory.pop(key, None)
+                raise KeyError(key)
+            self._memory[key] = value
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        """Store a value in the cache."""
+        try:
+            content = json.dumps(value, default=_serialize)
+        except (TypeError, ValueError) as exc:
+            raise ValueError(f"value of {key} can't be cached as JSON") from exc
+        self._memory[key] = value
+        with file_lock(self._lock_path):
+            write_file_atomic(self._path(key), content, mode=0o600)
+
+    def __delitem__(self, key: str) -> None:
+        """Remove a value from the cache."""
+        self._memory.pop(key, None)
+        with file_lock(self._lock_path):
+            try:
+                self._path(key).unlink()
+            except FileNotFoundError:
+                raise KeyError(key) from None
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the keys in the cache."""
+        if not self.cache_dir.is_dir():
+            return iter([])
+        return iter(sorted(path.stem for path in self.cache_dir.glob("*.json")))
+
+    def __len__(self) -> int:
+        """Number of items in the cache."""
+        return len(list(iter(self)))
+
+
+def get_credential_cache(
+    environ: Mapping[str, str] | None = None,
+) -> MutableMapping[str, Any]:
+    """Get the credential cache to use for boto3 sessions.
+
+    When ``RUNWAY_CREDENTIAL_CACHE`` is set to a truthy value, a
+    :class:`FileCredentialCache` stored in the ``credentials`` directory of the
+    Runway cache directory is returned so credentials obtained by assuming a
+    role or from AWS SSO can be reused by other processes.
+    Otherwise, the in-memory :data:`~runway.constants.BOTO3_CREDENTIAL_CACHE` is used.
+
+    Args:
+        environ: Environment variables. If not provided, ``os.environ`` is used.
+
+    """
+    environ = os.environ if environ is None else environ
+    if environ.get("RUNWAY_CREDENTIAL_CACHE", "").lower() not in TRUTHY_VALUES:
+        return BOTO3_CREDENTIAL_CACHE
+    cache_dir = get_cache_dir(environ) / "credentials"
+    with _FILE_CACHES_LOCK:
+        if cache_dir not in _FILE_CACHES:
+            LOGGER.debug("using file credential cache: %s", cache_dir)
+            _FILE_CACHES[cache_dir] = FileCredentialCache(cache_dir, memory=BOTO3_CREDENTIAL_CACHE)
+        return _FILE_CACHES[cache_dir]
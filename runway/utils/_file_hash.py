@@ -77,7 +77,6 @@ class FileHash:
         with Path.open(Path(file_path), "rb") as stream:
             while chunk := stream.read(self.chunk_size):
                 self._hash.update(chunk)
-                chunk = stream.read(self.chunk_size)  # read in new chunk
 
     def add_file_name(
         self,
@@ -0,0 +1,340 @@
+"""Process-wide, adaptive rate limiting of AWS API calls."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+if TYPE_CHECKING:
+    import boto3
+    from botocore.awsrequest import AWSRequest, AWSResponse
+    from botocore.model import OperationModel
+
+LOGGER = logging.getLogger(__name__)
+
+THROTTLING_ERROR_CODES = frozenset(
+    {
+        "BandwidthLimitExceeded",
+        "EC2ThrottledException",
+        "LimitExceededException",
+        "PriorRequestNotComplete",
+        "ProvisionedThroughputExceededException",
+        "RequestLimitExceeded",
+        "RequestThrottled",
+        "RequestThrottledException",
+        "SlowDown",
+        "ThrottledException",
+        "Throttling",
+        "ThrottlingException",
+        "TooManyRequestsException",
+        "TransactionInProgressException",
+    }
+)
+"""Error codes returned by AWS when a request is throttled."""
+
+UNLIMITED_SERVICES = frozenset({"sso", "sso-oidc", "sts"})
+"""Services that are not rate limited as they are called to refresh credentials."""
+
+
+class RateLimitKey(NamedTuple):
+    """Scope that a rate limit applies to."""
+
+    account: str
+    region: str
+    service: str
+
+    def __str__(self) -> str:
+        """Format for use in log messages."""
+        return f"{self.service} ({self.account}, {self.region})"
+
+
+class RateLimitStats(NamedTuple):
+    """Statistics of the calls made within the scope of a rate limit."""
+
+    calls: int
+    throttles: int
+    waited: float
+    rate: float | None
+
+
+class _Bucket:
+    """Token bucket whose rate is adjusted by additive increase, multiplicative decrease.
+
+    The bucket starts without a rate, allowing calls as fast as they are made.
+    A rate is only applied after a call is throttled.
+
+    """
+
+    def __init__(self, limiter: AdaptiveRateLimiter) -> None:
+        self.calls = 0
+        self.history: deque[float] = deque(maxlen=100)
+        self.last_decrease = 0.0
+        self.last_refill = time.monotonic()
+        self.limiter = limiter
+        self.lock = threading.Lock()
+        self.rate: float | None = None
+        self.throttles = 0
+        self.tokens = 0.0
+        self.waited = 0.0
+
+    def acquire(self) -> None:
+        """Wait until a call can be made."""
+        with self.lock:
+            now = time.monotonic()
+            self.calls += 1
+            self.history.append(now)
+            if self.rate is None:
+                return
+            self.tokens = min(
+                self.limiter.burst, self.tokens + (now - self.last_refill) * self.rate
+            )
+            self.last_refill = now
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+            self.waited += wait
+        if wait:
+            time.sleep(wait)
+
+    def measured_rate(self, now: float) -> float:
+        """Rate that calls have recently been made."""
+        if len(self.history) < 2 or now <= self.history[0]:
+            return self.limiter.min_rate
+        return len(self.history) / (now - self.history[0])
+
+    def on_success(self) -> None:
+        """Additively increase the rate after a successful call."""
+        with self.lock:
+            if self.rate is None:
+                return
+            self.rate += self.limiter.increase / max(self.rate, 1.0)
+            if self.rate >= self.limiter.max_rate:
+                self.rate = None
+
+    def on_throttle(self) -> None:
+        """Multiplicatively decrease the rate after a call is throttled."""
+        with self.lock:
+            now = time.monotonic()
+            self.throttles += 1
+            # a burst of throttled calls is the result of a single overload
+            if now - self.last_decrease < self.limiter.cooldown:
+                return
+            current = self.measured_rate(now) if self.rate is None else self.rate
+            self.rate = max(self.limiter.min_rate, current * self.limiter.decrease)
+            self.tokens = min(self.tokens, 0.0)
+            self.last_decrease = now
+            self.last_refill = now
+
+    def stats(self) -> RateLimitStats:
+        """Statistics of calls made."""
+        with self.lock:
+            return RateLimitStats(self.calls, self.throttles, self.waited, self.rate)
+
+
+class AdaptiveRateLimiter:
+    """Rate limit AWS API calls made from any session in the process.
+
+    A separate limit is kept for each combination of account, region and
+    service so that concurrent threads share a limit rather than each
+    independently retrying throttled calls. The limit adapts to throttling
+    errors and is lifted again once calls succeed at a high enough rate.
+
+    """
+
+    def __init__(
+        self,
+        *,
+        burst: float = 5.0,
+        cooldown: float = 1.0,
+        decrease: float = 0.5,
+        increase: float = 0.5,
+        max_rate: float = 50.0,
+        min_rate: float = 0.5,
+    ) -> None:
+        """Instantiate class.
+
+        Args:
+            burst: Max number of calls that can be made at once while limited.
+            cooldown: Seconds after decreasing the rate before it can be decreased again.
+            decrease: Factor applied to the rate when a call is throttled.
+            increase: Calls per second added to the rate (per second at the
+                current rate) as calls succeed.
+            max_rate: Calls per second at which the limit is lifted.
+            min_rate: Min calls per second.
+
+        """
+        self.burst = burst
+        self.cooldown = cooldown
+        self.decrease = decrease
+        self.increase = increase
+        self.max_rate = max_rate
+        self.min_rate = min_rate
+        self._buckets: dict[RateLimitKey, _Bucket] = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, key: RateLimitKey) -> _Bucket:
+        """Get the bucket for a key."""
+        with self._lock:
+            if key not in self._buckets:
+                self._buckets[key] = _Bucket(self)
+            return self._buckets[key]
+
+    def acquire(self, key: RateLimitKey) -> None:
+        """Wait until a call can be made.
+
+        Args:
+            key: Scope of the call.
+
+        """
+        self._bucket(key).acquire()
+
+    def on_success(self, key: RateLimitKey) -> None:
+        """Record a successful call.
+
+        Args:
+            key: Scope of the call.
+
+        """
+        self._bucket(key).on_success()
+
+    def on_throttle(self, key: RateLimitKey) -> None:
+        """Record a throttled call.
+
+        Args:
+            key: Scope of the call.
+
+        """
+        self._bucket(key).on_throttle()
+
+    def register(self, session: boto3.Session) -> None:  # noqa: C901
+        """Rate limit calls made by clients created from a session.
+
+        Must be called before clients are created from the session.
+        The account that calls are made to is identified when the first call is
+        made so registering doesn't resolve credentials. Retries of a call wait
+        on the rate limit the same as the initial attempt.
+
+        Args:
+            session: boto3 session.
+
+        """
+        account: str | None = None
+        account_lock = threading.Lock()
+
+        def get_account() -> str:
+            nonlocal account
+            with account_lock:
+                if account is None:
+                    account = self._get_account(session)
+                return account
+
+        def before_call(model: OperationModel, context: dict[str, Any], **_: Any) -> None:
+            service = model.service_model.service_name
+            if service in UNLIMITED_SERVICES:
+                return
+            key = RateLimitKey(get_account(), context.get("client_region") or "global", service)
+            context["runway_rate_limit_key"] = key
+            self.acquire(key)
+
+        def request_created(request: AWSRequest, **_: Any) -> None:
+            # before-call is only emitted once per call, not for each retry
+            context: dict[str, Any] = getattr(request, "context", {})
+            key = context.get("runway_rate_limit_key")
+            if key and context.get("retries", {}).get("attempt", 1) > 1:
+                self.acquire(key)
+
+        def needs_retry(
+            request_dict: dict[str, Any],
+            response: tuple[AWSResponse, dict[str, Any]] | None = None,
+            **_: Any,
+        ) -> None:
+            key = request_dict.get("context", {}).get("runway_rate_limit_key")
+            if (
+                key
+                and response
+                and response[1].get("Error", {}).get("Code") in (THROTTLING_ERROR_CODES)
+            ):
+                LOGGER.debug("%s:call was throttled", key)
+                self.on_throttle(key)
+
+        def after_call(http_response: AWSResponse, context: dict[str, Any], **_: Any) -> None:
+            key = context.get("runway_rate_limit_key")
+            if key and http_response.status_code < 400:
+                self.on_success(key)
+
+        session.events.register("before-call", before_call)
+        session.events.register("request-created", request_created)
+        session.events.register("needs-retry", needs_retry)
+        session.events.register("after-call", after_call)
+
+    @staticmethod
+    def _get_account(session: boto3.Session) -> str:
+        """Get an identifier for the account a session makes calls to.
+
+        Credentials are resolved once, when the first rate limited call is made,
+        and are never refreshed to get the identifier. Refreshing credentials
+        makes calls with the session which would otherwise run the hooks from
+        within a refresh.
+
+        Args:
+            session: boto3 session.
+
+        """
+        from botocore.credentials import RefreshableCredentials  # noqa: PLC0415
+
+        try:
+            credentials = session.get_credentials()
+        except Exception:  # noqa: BLE001
+            LOGGER.debug("unable to resolve credentials to rate limit calls", exc_info=True)
+            credentials = None
+        if isinstance(credentials, RefreshableCredentials):
+            # accessing the keys of refreshable credentials can result in a refresh
+            return f"profile:{session.profile_name}"
+        if credentials is None:
+            return "anonymous"
+        return hashlib.sha256(str(credentials.access_key).encode()).hexdigest()[:12]
+
+    def reset_stats(self) -> None:
+        """Reset statistics. Current rate limits are kept."""
+        with self._lock:
+            buckets = list(self._buckets.values())
+        for bucket in buckets:
+            with bucket.lock:
+                bucket.calls = bucket.throttles = 0
+                bucket.waited = 0.0
+
+    def stats(self) -> dict[RateLimitKey, RateLimitStats]:
+        """Statistics for each scope that calls have been made in."""
+        with self._lock:
+            buckets = dict(self._buckets)
+        return {key: bucket.stats() for key, bucket in buckets.items()}
+
+    def log_stats(self, logger: logging.Logger | logging.LoggerAdapter[Any] = LOGGER) -> None:
+        """Log statistics.
+
+        Scopes where calls were throttled or delayed are logged at INFO level,
+        others at DEBUG level.
+
+        Args:
+            logger: Logger to use.
+
+        """
+        for key, stats in sorted(self.stats().items()):
+            if not stats.calls:
+                continue
+            logger.log(
+                logging.INFO if stats.throttles or stats.waited else logging.DEBUG,
+                "%s: %s call(s); %s throttled; %.1fs waiting on rate limit; current limit: %s",
+                key,
+                stats.calls,
+                stats.throttles,
+                stats.waited,
+                "none" if stats.rate is None else f"{stats.rate:.1f}/s",
+            )
+
+
+RATE_LIMITER = AdaptiveRateLimiter()
+"""Rate limiter shared by all sessions created by Runway."""
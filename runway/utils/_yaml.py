@@ -0,0 +1,99 @@
+"""Load YAML using libyaml when it is available."""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import IO, Any
+
+import yaml
+
+LOGGER = logging.getLogger(__name__)
+
+try:
+    YamlLoader: type[yaml.SafeLoader] = yaml.CSafeLoader  # type: ignore[assignment]
+except AttributeError:  # cov: ignore
+    YamlLoader = yaml.SafeLoader
+"""Safe loader backed by libyaml when PyYAML was built with it.
+
+Falls back to the pure-Python :class:`yaml.SafeLoader`.
+
+"""
+
+
+def yaml_load(stream: bytes | str | IO[Any], *, loader: type[yaml.SafeLoader] = YamlLoader) -> Any:
+    """Load a YAML document using a safe loader.
+
+    Args:
+        stream: YAML document to load.
+        loader: PyYAML loader class. Must be a subclass of a safe loader.
+
+    """
+    return yaml.load(stream, Loader=loader)  # noqa: S506
+
+
+class YamlCache:
+    """Parsed YAML documents keyed by a hash of their content.
+
+    Parsing is skipped when a document with identical content has already
+    been loaded in the current process (e.g. the same CFNgin config deployed
+    to multiple regions or a package source merged into multiple configs).
+    A copy of the cached object is returned so callers are free to modify it.
+
+    """
+
+    def __init__(self, max_size: int = 128) -> None:
+        """Instantiate class.
+
+        Args:
+            max_size: Max number of parsed documents to keep. The least
+                recently used document is removed once exceeded.
+
+        """
+        self.hits = 0
+        self.max_size = max_size
+        self.misses = 0
+        self._data: OrderedDict[tuple[str, str], Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Number of cached documents."""
+        return len(self._data)
+
+    def clear(self) -> None:
+        """Remove all cached documents."""
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+    def load(self, content: bytes | str, *, loader: type[yaml.SafeLoader] = YamlLoader) -> Any:
+        """Load a YAML document, using the cached result if available.
+
+        Args:
+            content: YAML document to load.
+            loader: PyYAML loader class. Must be a subclass of a safe loader.
+
+        """
+        digest = hashlib.sha256(
+            content.encode("utf-8") if isinstance(content, str) else content
+        ).hexdigest()
+        key = (f"{loader.__module__}.{loader.__qualname__}", digest)
+        with self._lock:
+            if key in self._data:
+                self.hits += 1
+                self._data.move_to_end(key)
+                return copy.deepcopy(self._data[key])
+            self.misses += 1
+        result = yaml_load(content, loader=loader)
+        with self._lock:
+            self._data[key] = result
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+        return copy.deepcopy(result)
+
+
+YAML_CACHE = YamlCache()
+"""Parsed YAML documents shared by everything in the current process."""
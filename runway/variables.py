@@ -69,6 +69,11 @@ class Variable:
         """
         return self._value.dependencies
 
+    @property
+    def lookups(self) -> list[VariableValueLookup]:
+        """Lookups used in this variable, including nested lookups."""
+        return self._value.lookups
+
     @property
     def resolved(self) -> bool:
         """Boolean for whether the Variable has been resolved.
@@ -162,6 +167,11 @@ class VariableValue:
         """Stack names that this variable depends on."""
         return set()
 
+    @property
+    def lookups(self) -> list[VariableValueLookup]:
+        """Lookups used in this variable value, including nested lookups."""
+        return []
+
     @property
     def resolved(self) -> bool:
         """Use to check if the variable value has been resolved.
@@ -355,6 +365,11 @@ class VariableValueDict(VariableValue, MutableMapping[str, VariableValue]):
             deps.update(item.dependencies)
         return deps
 
+    @property
+    def lookups(self) -> list[VariableValueLookup]:
+        """Lookups used in this variable value, including nested lookups."""
+        return [lookup for item in self.values() for lookup in item.lookups]
+
     @property
     def resolved(self) -> bool:
         """Use to check if the variable value has been resolved."""
@@ -450,6 +465,11 @@ class VariableValueList(VariableValue, MutableSequence[VariableValue]):
             deps.update(item.dependencies)
         return deps
 
+    @property
+    def lookups(self) -> list[VariableValueLookup]:
+        """Lookups used in this variable value, including nested lookups."""
+        return [lookup for item in self for lookup in item.lookups]
+
     @property
     def resolved(self) -> bool:
         """Use to check if the variable value has been resolved."""
@@ -609,6 +629,11 @@ class VariableValueConcatenation(Generic[_VariableValue], VariableValue):
             deps.update(item.dependencies)
         return deps
 
+    @property
+    def lookups(self) -> list[VariableValueLookup]:
+        """Lookups used in this variable value, including nested lookups."""
+        return [lookup for item in self for lookup in item.lookups]
+
     @property
     def resolved(self) -> bool:
         """Use to check if the variable value has been resolved."""
@@ -786,6 +811,11 @@ class VariableValueLookup(VariableValue):
             return self.handler.dependencies(self.lookup_query)
         return set()
 
+    @property
+    def lookups(self) -> list[VariableValueLookup]:
+        """This lookup and any lookups nested in its query."""
+        return [self, *self.lookup_query.lookups]
+
     @property
     def resolved(self) -> bool:
         """Use to check if the variable value has been resolved."""
@@ -889,6 +919,11 @@ class VariableValuePydanticModel(Generic[_PydanticModelTypeVar], VariableValue):
             deps.update(value.dependencies)
         return deps
 
+    @property
+    def lookups(self) -> list[VariableValueLookup]:
+        """Lookups used in this variable value, including nested lookups."""
+        return [lookup for value in self._data.values() for lookup in value.lookups]
+
     @property
     def resolved(self) -> bool:
         """Use to check if the variable value has been resolved."""
@@ -0,0 +1 @@
+"""Empty module for python import traversal."""
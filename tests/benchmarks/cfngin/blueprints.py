@@ -0,0 +1,32 @@
+"""Blueprints used by benchmarks."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, ClassVar
+
+from troposphere import Ref
+from troposphere.cloudformation import WaitConditionHandle
+
+from runway.cfngin.blueprints.base import Blueprint
+
+if TYPE_CHECKING:
+    from runway.cfngin.blueprints.type_defs import BlueprintVariableTypeDef
+
+
+class Echo(Blueprint):
+    """Stack with an output containing the value of a variable.
+
+    The value of the variable is usually the outputs of other stacks so
+    output lookups are resolved for each dependency.
+
+    """
+
+    VARIABLES: ClassVar[dict[str, BlueprintVariableTypeDef]] = {
+        "Value": {"type": str, "default": "root"},
+    }
+
+    def create_template(self) -> None:
+        """Create template."""
+        self.template.add_resource(WaitConditionHandle("Handle"))
+        self.add_output("Upstream", self.variables["Value"])
+        self.add_output("Value", Ref("AWS::StackName"))
@@ -0,0 +1,40 @@
+"""Pytest configuration, fixtures, and plugins."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import boto3
+import pytest
+from moto.core.decorator import mock_aws
+
+from runway.cfngin.actions import deploy, destroy
+
+from .factories import AWS_ENVIRON, NAMESPACE
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+@pytest.fixture
+def aws_stand_in(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    """Serve AWS API calls made by any thread from a local, in-memory stand-in.
+
+    The ``cfngin_bucket`` of generated configs is created.
+
+    Stacks reach a complete status as soon as they are created so the time
+    between polls of stack status is removed.
+
+    """
+    try:
+        import moto.cloudformation  # noqa: F401, PLC0415
+    except ImportError as exc:
+        # fail rather than skip so the benchmarks can't pass without running
+        pytest.fail(f"moto[cloudformation] is required to stand in for AWS: {exc}", pytrace=False)
+    for name, value in AWS_ENVIRON.items():
+        monkeypatch.setenv(name, value)
+    monkeypatch.setattr(deploy, "STACK_POLL_TIME", 0)
+    monkeypatch.setattr(destroy, "STACK_POLL_TIME", 0)
+    with mock_aws():
+        boto3.client("s3").create_bucket(Bucket=f"{NAMESPACE}-cfngin-bucket")
+        yield
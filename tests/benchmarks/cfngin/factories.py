@@ -0,0 +1,93 @@
+"""Generate CFNgin configs used by benchmarks."""
+
+from __future__ import annotations
+
+import math
+from typing import Any
+
+AWS_ENVIRON = {
+    "AWS_ACCESS_KEY_ID": "testing",
+    "AWS_DEFAULT_REGION": "us-east-1",
+    "AWS_REGION": "us-east-1",
+    "AWS_SECRET_ACCESS_KEY": "testing",
+    "AWS_SESSION_TOKEN": "testing",
+}
+"""Environment used when running CFNgin against the local stand-in for AWS."""
+
+NAMESPACE = "benchmark"
+"""CFNgin namespace of generated configs."""
+
+SHAPES = ("chain", "flat", "layered", "tree")
+"""Shapes of the dependency graph of generated stacks.
+
+- ``chain``: Each stack depends on the one before it.
+- ``flat``: Stacks have no dependencies.
+- ``layered``: Stacks are split into ``sqrt(count)`` layers; each stack
+  depends on every stack in the layer before it.
+- ``tree``: Stacks form a binary tree; each stack depends on its parent.
+
+"""
+
+
+def stack_name(index: int) -> str:
+    """Name of a generated stack."""
+    return f"stack-{index:04d}"
+
+
+def build_dependencies(shape: str, count: int) -> dict[int, list[int]]:
+    """Build the dependencies of each stack for a shape.
+
+    Args:
+        shape: Shape of the dependency graph.
+        count: Number of stacks.
+
+    Returns:
+        Mapping of stack index to the indexes of the stacks it depends on.
+
+    """
+    if shape == "chain":
+        return {index: [index - 1] if index else [] for index in range(count)}
+    if shape == "flat":
+        return {index: [] for index in range(count)}
+    if shape == "layered":
+        width = max(1, math.isqrt(count))
+        return {
+            index: list(range(index // width * width - width, index // width * width))
+            if index >= width
+            else []
+            for index in range(count)
+        }
+    if shape == "tree":
+        return {index: [(index - 1) // 2] if index else [] for index in range(count)}
+    raise ValueError(f"unsupported shape: {shape}")
+
+
+def generate_config(shape: str, count: int, *, namespace: str = NAMESPACE) -> dict[str, Any]:
+    """Generate a CFNgin config.
+
+    Each dependency is expressed as an output lookup so that resolving the
+    variables of a stack requires the outputs of the stacks it depends on.
+
+    Args:
+        shape: Shape of the dependency graph.
+        count: Number of stacks.
+        namespace: CFNgin namespace.
+
+    """
+    return {
+        "namespace": namespace,
+        "cfngin_bucket": f"{namespace}-cfngin-bucket",
+        "stacks": [
+            {
+                "name": stack_name(index),
+                "class_path": "tests.benchmarks.cfngin.blueprints.Echo",
+                "variables": {
+                    "Value": ",".join(
+                        f"${{output {stack_name(required)}.Value}}" for required in requires
+                    )
+                    or "root"
+                },
+            }
+            for index, requires in build_dependencies(shape, count).items()
+        ],
+    }
@@ -0,0 +1,92 @@
+"""Benchmark CFNgin actions."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from runway.cfngin.actions import deploy, destroy, diff
+from runway.cfngin.actions.base import BaseAction
+from runway.cfngin.blueprints.base import Blueprint
+from runway.cfngin.plan import Plan
+from runway.cfngin.providers.aws.default import ProviderBuilder
+from runway.cfngin.stack import Stack
+from runway.config import CfnginConfig
+from runway.context import CfnginContext
+from runway.core.components import DeployEnvironment
+
+from ..measure import Measurement
+from .factories import AWS_ENVIRON, SHAPES, generate_config
+
+if TYPE_CHECKING:
+    from ..measure import BenchmarkResults
+
+API_CALL_BUDGET = {"deploy": 20, "destroy": 20, "plan": 20}
+"""Max number of AWS API calls per stack for each action.
+
+These are intentionally generous. They catch changes that make the number of
+calls grow faster than the number of stacks (e.g. describing every stack
+while processing each stack). Use ``--benchmark-compare`` to catch smaller
+regressions.
+
+"""
+
+
+def build_context(config: dict[str, Any]) -> CfnginContext:
+    """Build a CFNgin context for a generated config."""
+    return CfnginContext(
+        config=CfnginConfig.parse_obj(config),
+        deploy_environment=DeployEnvironment(environ=dict(AWS_ENVIRON), explicit_name="benchmark"),
+        parameters={},
+    )
+
+
+def run_action(action: str, context: CfnginContext) -> None:
+    """Run a CFNgin action the way ``runway deploy/plan/destroy`` does."""
+    provider_builder = ProviderBuilder(region=context.env.aws_region)
+    if action == "deploy":
+        deploy.Action(context=context, provider_builder=provider_builder).execute(concurrency=0)
+    elif action == "destroy":
+        destroy.Action(context=context, provider_builder=provider_builder).execute(
+            concurrency=0, force=True
+        )
+    else:
+        diff.Action(context=context, provider_builder=provider_builder).execute()
+
+
+@pytest.mark.usefixtures("aws_stand_in")
+@pytest.mark.parametrize("shape", SHAPES)
+@pytest.mark.parametrize("action", ["deploy", "plan", "destroy"])
+def test_action(
+    action: str,
+    benchmark_results: BenchmarkResults,
+    benchmark_stacks: int,
+    monkeypatch: pytest.MonkeyPatch,
+    shape: str,
+) -> None:
+    """Benchmark a CFNgin action.
+
+    Stacks are deployed before benchmarking actions that operate on
+    existing stacks.
+
+    """
+    config = generate_config(shape, benchmark_stacks)
+    if action != "deploy":
+        run_action("deploy", build_context(config))
+
+    measurement = Measurement(f"cfngin.{action}[{shape}-{benchmark_stacks}]")
+    measurement.time_phase(monkeypatch, "dag", BaseAction, "_generate_plan")
+    measurement.time_phase(monkeypatch, "resolve", Stack, "resolve")
+    measurement.time_phase(monkeypatch, "render", Blueprint, "render_template")
+    measurement.time_phase(monkeypatch, "walk", Plan, "execute")
+    context = build_context(config)
+    with measurement.measure():
+        run_action(action, context)
+
+    regressions = benchmark_results.record(measurement)
+    assert not regressions, f"{measurement.name} regressed: " + "; ".join(regressions)
+    assert measurement.total_api_calls <= API_CALL_BUDGET[action] * benchmark_stacks, (
+        f"{measurement.name} made {measurement.total_api_calls} AWS API calls: "
+        f"{measurement.api_calls}"
+    )
@@ -0,0 +1,55 @@
+"""Pytest configuration, fixtures, and plugins."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from .measure import BenchmarkResults
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+def pytest_ignore_collect(path: Any, config: pytest.Config) -> bool:  # noqa: ARG001
+    """Determine if this directory should have its tests collected."""
+    return not config.option.benchmark
+
+
+@pytest.fixture(scope="session")
+def benchmark_results(
+    pytestconfig: pytest.Config, tmp_path_factory: pytest.TempPathFactory
+) -> Iterator[BenchmarkResults]:
+    """Results of all benchmarks run in the session.
+
+    A summary is written to the terminal once all benchmarks have run, along
+    with a JSON report when ``--benchmark-report`` is provided.
+
+    """
+    compare_path = pytestconfig.option.benchmark_compare
+    results = BenchmarkResults(
+        baseline=json.loads(Path(compare_path).read_text()) if compare_path else None,
+        tolerance=pytestconfig.option.benchmark_tolerance,
+    )
+    yield results
+    if not results.results:
+        return
+    report_path = Path(
+        pytestconfig.option.benchmark_report
+        or tmp_path_factory.getbasetemp() / "benchmark-report.json"
+    )
+    report_path.write_text(json.dumps(results.to_dict(), indent=2) + "\n")
+    terminal = pytestconfig.pluginmanager.get_plugin("terminalreporter")
+    if terminal:
+        terminal.write_line("")
+        terminal.write_line(results.format_summary())
+        terminal.write_line(f"benchmark report written to {report_path}")
+
+
+@pytest.fixture(scope="session")
+def benchmark_stacks(pytestconfig: pytest.Config) -> int:
+    """Number of stacks in generated CFNgin configs."""
+    return pytestconfig.option.benchmark_stacks
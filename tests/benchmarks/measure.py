@@ -0,0 +1,208 @@
+"""Measure the resources used by the code being benchmarked."""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from runway.utils import API_STATS
+
+try:
+    import resource
+except ImportError:  # cov: ignore
+    resource = None
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    import pytest
+
+PROC_STATM = Path("/proc/self/statm")
+
+
+def get_rss() -> int:
+    """Get the resident set size of the current process in bytes.
+
+    Falls back to the peak resident set size of the process where the
+    current value is not available.
+
+    """
+    if not resource:  # cov: ignore
+        return 0
+    if PROC_STATM.exists():
+        return int(PROC_STATM.read_text().split()[1]) * resource.getpagesize()
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return usage if sys.platform == "darwin" else usage * 1024
+
+
+class Measurement:
+    """Resources used while running a benchmark."""
+
+    SAMPLE_INTERVAL = 0.01
+    """Seconds between samples of memory and thread count."""
+
+    def __init__(self, name: str) -> None:
+        """Instantiate class.
+
+        Args:
+            name: Name of the benchmark.
+
+        """
+        self.name = name
+        self.api_calls: dict[str, int] = {}
+        self.peak_rss = 0
+        self.peak_threads = 0
+        self.phases: dict[str, dict[str, float]] = {}
+        self.wall_time = 0.0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+
+    @property
+    def total_api_calls(self) -> int:
+        """Total number of AWS API calls made."""
+        return sum(self.api_calls.values())
+
+    def _sample(self) -> None:
+        """Sample memory and thread count until stopped."""
+        while True:
+            self.peak_rss = max(self.peak_rss, get_rss())
+            self.peak_threads = max(self.peak_threads, threading.active_count())
+            if self._stop.wait(self.SAMPLE_INTERVAL):
+                return
+
+    @contextmanager
+    def measure(self) -> Iterator[None]:
+        """Measure resources used within the context."""
+        API_STATS.reset()
+        self._stop.clear()
+        sampler = threading.Thread(target=self._sample, daemon=True)
+        sampler.start()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.wall_time = time.perf_counter() - start
+            self._stop.set()
+            sampler.join()
+            for (service, operation), stats in API_STATS.by_operation().items():
+                self.api_calls[f"{service}.{operation}"] = stats.calls
+
+    def time_phase(self, monkeypatch: pytest.MonkeyPatch, phase: str, obj: Any, attr: str) -> None:
+        """Record the time spent in a callable as a phase of the benchmark.
+
+        Time is accumulated across all calls, including calls made
+        concurrently from multiple threads.
+
+        Args:
+            monkeypatch: Used to replace the callable with a timed wrapper.
+            phase: Name of the phase.
+            obj: Object that the callable is an attribute of.
+            attr: Name of the attribute.
+
+        """
+        func: Callable[..., Any] = getattr(obj, attr)
+        stats = self.phases.setdefault(phase, {"calls": 0, "time": 0.0})
+
+        @wraps(func)
+        def _wrapper(*args: Any, **kwargs: Any) -> Any:
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                with self._lock:
+                    stats["calls"] += 1
+                    stats["time"] += time.perf_counter() - start
+
+        monkeypatch.setattr(obj, attr, _wrapper)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON serializable dict."""
+        return {
+            "api_calls": dict(sorted(self.api_calls.items())),
+            "peak_rss": self.peak_rss,
+            "peak_threads": self.peak_threads,
+            "phases": self.phases,
+            "total_api_calls": self.total_api_calls,
+            "wall_time": self.wall_time,
+        }
+
+
+class BenchmarkResults:
+    """Results of all benchmarks run in a session."""
+
+    def __init__(self, *, baseline: dict[str, Any] | None = None, tolerance: float = 1.5) -> None:
+        """Instantiate class.
+
+        Args:
+            baseline: Report of a previous run to compare results against.
+            tolerance: Max ratio of wall time to the baseline.
+
+        """
+        self.baseline = baseline.get("benchmarks", {}) if baseline else {}
+        self.results: dict[str, dict[str, Any]] = {}
+        self.tolerance = tolerance
+
+    def compare(self, measurement: Measurement) -> list[str]:
+        """Compare a measurement to the baseline.
+
+        Returns:
+            Descriptions of regressions.
+
+        """
+        baseline = self.baseline.get(measurement.name)
+        if not baseline:
+            return []
+        regressions: list[str] = []
+        if measurement.total_api_calls > baseline["total_api_calls"]:
+            regressions.append(
+                f"AWS API calls increased from {baseline['total_api_calls']} "
+                f"to {measurement.total_api_calls}"
+            )
+        if measurement.wall_time > baseline["wall_time"] * self.tolerance:
+            regressions.append(
+                f"wall time increased from {baseline['wall_time']:.2f}s "
+                f"to {measurement.wall_time:.2f}s"
+            )
+        return regressions
+
+    def record(self, measurement: Measurement) -> list[str]:
+        """Record a measurement.
+
+        Returns:
+            Descriptions of regressions compared to the baseline.
+
+        """
+        self.results[measurement.name] = measurement.to_dict()
+        return self.compare(measurement)
+
+    def format_summary(self) -> str:
+        """Format a table summarizing results."""
+        rows = [("benchmark", "wall s", "api calls", "peak rss MiB", "peak threads")]
+        rows.extend(
+            (
+                name,
+                f"{result['wall_time']:.2f}",
+                str(result["total_api_calls"]),
+                f"{result['peak_rss'] / 1024 / 1024:.0f}",
+                str(result["peak_threads"]),
+            )
+            for name, result in sorted(self.results.items())
+        )
+        widths = [max(len(row[index]) for row in rows) for index in range(len(rows[0]))]
+        return "\n".join(
+            "  ".join(
+                cell.ljust(width) if not index else cell.rjust(width)
+                for index, (cell, width) in enumerate(zip(row, widths))
+            )
+            for row in rows
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON serializable dict."""
+        return {"benchmarks": dict(sorted(self.results.items()))}
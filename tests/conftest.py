@@ -27,6 +27,34 @@ def pytest_configure(config: pytest.Config) -> None:
 
 def pytest_addoption(parser: pytest.Parser) -> None:
     """Add pytest CLI options."""
+    parser.addoption(
+        "--benchmark",
+        action="store_true",
+        default=False,
+        help="run only benchmarks",
+    )
+    parser.addoption(
+        "--benchmark-compare",
+        default=None,
+        help="path to a benchmark report to compare results against",
+    )
+    parser.addoption(
+        "--benchmark-report",
+        default=None,
+        help="path where a JSON report of benchmark results will be written",
+    )
+    parser.addoption(
+        "--benchmark-stacks",
+        default=25,
+        type=int,
+        help="number of stacks in generated CFNgin configs used by benchmarks",
+    )
+    parser.addoption(
+        "--benchmark-tolerance",
+        default=1.5,
+        type=float,
+        help="max ratio of wall time to the compared report before a benchmark fails",
+    )
     parser.addoption(
         "--functional",
         action="store_true",
@@ -20,5 +20,6 @@ def versions_dir(cd_tmp_path: Path, mocker: MockFixture) -> Path:
     mocker.patch("runway._cli.commands._tfenv._install.TFEnvManager.versions_dir", path)
     mocker.patch("runway._cli.commands._tfenv._list.TFEnvManager.versions_dir", path)
     mocker.patch("runway._cli.commands._tfenv._run.TFEnvManager.versions_dir", path)
+    mocker.patch("runway._cli.commands._tfenv._seed.TFEnvManager.versions_dir", path)
     mocker.patch("runway._cli.commands._tfenv._uninstall.TFEnvManager.versions_dir", path)
     return path
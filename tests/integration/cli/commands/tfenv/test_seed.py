@@ -0,0 +1,80 @@
+"""Test ``runway tfenv seed`` command."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from runway._cli import cli
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pytest
+    from click.testing import CliRunner
+    from pytest_mock import MockerFixture
+
+MODULE = "runway._cli.commands._tfenv._seed"
+
+
+def test_tfenv_seed(
+    caplog: pytest.LogCaptureFixture,
+    cd_tmp_path: Path,
+    cli_runner: CliRunner,
+    mocker: MockerFixture,
+) -> None:
+    """Test ``runway tfenv seed`` reading version from a file."""
+    caplog.set_level(logging.INFO, logger="runway.cli.commands.tfenv")
+    mock_get_tf_release_versions = mocker.patch(
+        f"{MODULE}.get_tf_release_versions", return_value=["1.5.0"]
+    )
+    mocker.patch("runway.env_mgr.tfenv.get_tf_release_versions", return_value=["1.5.0"])
+    mock_fetch_tf_release = mocker.patch(
+        f"{MODULE}.fetch_tf_release", return_value=cd_tmp_path / "terraform.zip"
+    )
+    mock_install = mocker.patch(f"{MODULE}.TFEnvManager.install", return_value="terraform")
+    (cd_tmp_path / ".terraform-version").write_text("1.5.0")
+    assert cli_runner.invoke(cli, ["tfenv", "seed"]).exit_code == 0
+    mock_get_tf_release_versions.assert_called_once_with(refresh=True, store=True)
+    mock_fetch_tf_release.assert_called_once_with("1.5.0", None, None)
+    mock_install.assert_called_once_with()
+    assert f"cached Terraform 1.5.0: {cd_tmp_path / 'terraform.zip'}" in caplog.messages
+
+
+def test_tfenv_seed_platform(
+    cd_tmp_path: Path, cli_runner: CliRunner, mocker: MockerFixture
+) -> None:
+    """Test ``runway tfenv seed <version>... --platform <platform> --arch <arch>``."""
+    mocker.patch(f"{MODULE}.get_tf_release_versions", return_value=["1.6.0", "1.5.0"])
+    mocker.patch("runway.env_mgr.tfenv.get_tf_release_versions", return_value=["1.6.0", "1.5.0"])
+    mock_fetch_tf_release = mocker.patch(
+        f"{MODULE}.fetch_tf_release", return_value=cd_tmp_path / "terraform.zip"
+    )
+    mock_install = mocker.patch(f"{MODULE}.TFEnvManager.install")
+    assert (
+        cli_runner.invoke(
+            cli, ["tfenv", "seed", "1.5.0", "latest", "--platform", "linux", "--arch", "arm64"]
+        ).exit_code
+        == 0
+    )
+    assert [i.args for i in mock_fetch_tf_release.call_args_list] == [
+        ("1.5.0", "linux", "arm64"),
+        ("1.6.0", "linux", "arm64"),
+    ]
+    mock_install.assert_not_called()
+
+
+def test_tfenv_seed_no_version(
+    caplog: pytest.LogCaptureFixture,
+    cd_tmp_path: Path,  # noqa: ARG001
+    cli_runner: CliRunner,
+    mocker: MockerFixture,
+) -> None:
+    """Test ``runway tfenv seed`` without a version or version file."""
+    caplog.set_level(logging.ERROR, logger="runway")
+    mock_get_tf_release_versions = mocker.patch(f"{MODULE}.get_tf_release_versions")
+    mock_fetch_tf_release = mocker.patch(f"{MODULE}.fetch_tf_release")
+    assert cli_runner.invoke(cli, ["tfenv", "seed"]).exit_code == 1
+    assert "unable to find a .terraform-version file" in caplog.messages
+    mock_get_tf_release_versions.assert_not_called()
+    mock_fetch_tf_release.assert_not_called()
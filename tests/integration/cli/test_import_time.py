@@ -0,0 +1,82 @@
+"""Test the modules imported when running lightweight ``runway`` commands."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+import yaml
+
+ROOT_DIR = Path(__file__).parents[3]
+
+HEAVY_MODULES = (
+    "awacs",
+    "boto3",
+    "botocore.client",
+    "docker",
+    "hcl",
+    "hcl2",
+    "runway.cfngin.actions",
+    "runway.cfngin.blueprints",
+    "troposphere",
+)
+"""Modules that must only be imported by the commands that use them."""
+
+def import_time(*args: str, cwd: Path) -> dict[str, int]:
+    """Run the CLI with ``python -X importtime``.
+
+    Args:
+        *args: Arguments passed to the CLI.
+        cwd: Working directory of the subprocess.
+
+    Returns:
+        Mapping of each imported module to its cumulative import time in
+        microseconds.
+
+    """
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            "import sys; from runway._cli.main import cli; cli(sys.argv[1:])",
+            *args,
+        ],
+        capture_output=True,
+        check=False,
+        cwd=cwd,
+        env={
+            **os.environ,
+            "PYTHONPATH": os.pathsep.join(filter(None, [str(ROOT_DIR), os.getenv("PYTHONPATH")])),
+        },
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
+    modules: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _self, cumulative, name = line.removeprefix("import time:").split("|")
+        if cumulative.strip().isdigit():
+            modules[name.strip()] = int(cumulative)
+    return modules
+
+
+@pytest.mark.parametrize("args", [["--version"], ["whichenv"]])
+def test_lightweight_commands(args: list[str], tmp_path: Path) -> None:
+    """Test lightweight commands do not import heavy dependencies."""
+    (tmp_path / "runway.yml").write_text(
+        yaml.safe_dump({"deployments": [], "ignore_git_branch": True})
+    )
+    modules = import_time(*args, cwd=tmp_path)
+    assert "runway._cli.main" in modules
+    assert not set(HEAVY_MODULES).intersection(modules)
+
+
+def test_version_does_not_import_git(tmp_path: Path) -> None:
+    """Test ``runway --version`` does not import git."""
+    assert "git" not in import_time("--version", cwd=tmp_path)
@@ -15,7 +15,7 @@ CpConfigTypeDef = Callable[[str, Path], Path]
 
 def pytest_ignore_collect(path: Any, config: pytest.Config) -> bool:  # noqa: ARG001
     """Determine if this directory should have its tests collected."""
-    if config.option.functional:
+    if config.option.functional or config.option.benchmark:
         return True
     if config.option.markexpr and "wip" in config.option.markexpr:
         return False  # collect when looking for markers
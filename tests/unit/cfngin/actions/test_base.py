@@ -1,10 +1,16 @@
 """Tests for runway.cfngin.actions.base."""
 
+from __future__ import annotations
+
+import json
+import time
 import unittest
+from typing import TYPE_CHECKING
 from unittest.mock import MagicMock, PropertyMock, patch
 
 import botocore.exceptions
 import pytest
+from botocore.stub import Stubber
 
 from runway.cfngin.actions.base import BaseAction
 from runway.cfngin.blueprints.base import Blueprint
@@ -12,9 +18,13 @@ from runway.cfngin.exceptions import CfnginBucketNotFound
 from runway.cfngin.plan import Graph, Plan, Step
 from runway.cfngin.providers.aws.default import Provider
 from runway.cfngin.session_cache import get_session
+from runway.core.components import DeployEnvironment
 
 from ..factories import MockProviderBuilder, mock_context
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
 MOCK_VERSION = "01234abcdef"
 
 
@@ -264,3 +274,172 @@ class TestBaseAction(unittest.TestCase):
                 == f"{endpoint}/cfngin-{context.namespace}-{region}/stack_templates/"
                 f"{context.namespace}-{blueprint.name}/{blueprint.name}-{MOCK_VERSION}.json"
             )
+
+
+def _template_index_action(environ: dict[str, str] | None = None) -> BaseAction:
+    """Create an action with two stacks to test the template index."""
+    context = mock_context(
+        "mynamespace",
+        extra_config_args={
+            "stacks": [
+                {"name": "stack1", "template_path": "."},
+                {"name": "stack2", "template_path": "."},
+            ]
+        },
+        deploy_environment=DeployEnvironment(environ=environ or {"NONE": "none"}),
+    )
+    return BaseAction(context=context)
+
+
+def _template_key(name: str) -> str:
+    """Key of a MockBlueprint template."""
+    return f"stack_templates/mynamespace-{name}/{name}-{MOCK_VERSION}.json"
+
+
+class TestBaseActionTemplateIndex:
+    """Test BaseAction template index."""
+
+    def test_build_template_index(self) -> None:
+        """Test build_template_index."""
+        action = _template_index_action()
+        stubber = Stubber(action.s3_conn)
+        stubber.add_response(
+            "list_objects_v2",
+            {
+                "Contents": [{"Key": _template_key("stack1")}],
+                "IsTruncated": True,
+                "NextContinuationToken": "token",
+            },
+            {"Bucket": action.bucket_name, "Prefix": "stack_templates/mynamespace-stack1/"},
+        )
+        stubber.add_response(
+            "list_objects_v2",
+            {"Contents": [{"Key": "stack_templates/mynamespace-stack1/old.json"}]},
+            {
+                "Bucket": action.bucket_name,
+                "ContinuationToken": "token",
+                "Prefix": "stack_templates/mynamespace-stack1/",
+            },
+        )
+        stubber.add_response(
+            "list_objects_v2",
+            {"Contents": [{"Key": _template_key("stack2")}], "IsTruncated": False},
+            {"Bucket": action.bucket_name, "Prefix": "stack_templates/mynamespace-stack2/"},
+        )
+        with stubber:
+            action.build_template_index(action.context.stacks)
+        stubber.assert_no_pending_responses()
+        assert action.template_index == {
+            _template_key("stack1"),
+            "stack_templates/mynamespace-stack1/old.json",
+            _template_key("stack2"),
+        }
+
+    def test_build_template_index_client_error(self) -> None:
+        """Test build_template_index ClientError."""
+        action = _template_index_action()
+        stubber = Stubber(action.s3_conn)
+        stubber.add_client_error("list_objects_v2", service_error_code="AccessDenied")
+        with stubber:
+            action.build_template_index(action.context.stacks)
+        assert action.template_index is None
+
+    def test_build_template_index_persisted(self, tmp_path: Path) -> None:
+        """Test build_template_index uses the persisted index."""
+        environ = {"RUNWAY_CACHE_DIR": str(tmp_path), "RUNWAY_CFNGIN_TEMPLATE_INDEX": "true"}
+        action = _template_index_action(environ)
+        action.template_index = {_template_key("stack1"), _template_key("stack2")}
+        action.save_template_index()
+        index_file = tmp_path / "cfngin_templates" / f"{action.bucket_name}.json"
+        assert set(json.loads(index_file.read_text())["keys"]) == action.template_index
+
+        new_action = _template_index_action(environ)
+        with Stubber(new_action.s3_conn):  # any API call raises an error
+            new_action.build_template_index(new_action.context.stacks)
+        assert new_action.template_index == action.template_index
+
+    def test_build_template_index_persisted_expired(self, tmp_path: Path) -> None:
+        """Test build_template_index persisted index entries expire."""
+        environ = {"RUNWAY_CACHE_DIR": str(tmp_path), "RUNWAY_CFNGIN_TEMPLATE_INDEX": "true"}
+        index_file = tmp_path / "cfngin_templates" / "cfngin-mynamespace-us-east-1.json"
+        index_file.parent.mkdir(parents=True)
+        index_file.write_text(
+            json.dumps(
+                {
+                    "keys": {
+                        _template_key("stack1"): time.time(),
+                        _template_key("stack2"): time.time() - BaseAction.TEMPLATE_INDEX_TTL,
+                    }
+                }
+            )
+        )
+        action = _template_index_action({**environ, "AWS_REGION": "us-east-1"})
+        assert action.bucket_name == "cfngin-mynamespace-us-east-1"
+        stubber = Stubber(action.s3_conn)
+        stubber.add_response("list_objects_v2", {"IsTruncated": False})
+        stubber.add_response(
+            "list_objects_v2",
+            {"Contents": [{"Key": _template_key("stack2")}], "IsTruncated": False},
+        )
+        with stubber:
+            action.build_template_index(action.context.stacks)
+        stubber.assert_no_pending_responses()
+        assert action.template_index == {_template_key("stack2")}
+
+    def test_s3_stack_push_index(self) -> None:
+        """Test s3_stack_push using the template index."""
+        action = _template_index_action()
+        stubber = Stubber(action.s3_conn)
+        stubber.add_response(
+            "list_objects_v2",
+            {"Contents": [{"Key": _template_key("stack1")}], "IsTruncated": False},
+        )
+        stubber.add_response("list_objects_v2", {"IsTruncated": False})
+        stubber.add_response(
+            "put_object",
+            {},
+            {
+                "ACL": "bucket-owner-full-control",
+                "Body": MockBlueprint(name="stack2", context=action.context).rendered.encode(),
+                "Bucket": action.bucket_name,
+                "Key": _template_key("stack2"),
+                "ServerSideEncryption": "AES256",
+            },
+        )
+        with stubber:
+            action.s3_stack_push(MockBlueprint(name="stack1", context=action.context))
+            action.s3_stack_push(MockBlueprint(name="stack2", context=action.context))
+            action.s3_stack_push(MockBlueprint(name="stack2", context=action.context))
+        stubber.assert_no_pending_responses()
+        assert action.template_index == {_template_key("stack1"), _template_key("stack2")}
+
+    def test_s3_stack_push_persisted_index(self, tmp_path: Path) -> None:
+        """Test s3_stack_push trusts templates from the persisted index."""
+        environ = {"RUNWAY_CACHE_DIR": str(tmp_path), "RUNWAY_CFNGIN_TEMPLATE_INDEX": "true"}
+        action = _template_index_action(environ)
+        action.template_index = {_template_key("stack1"), _template_key("stack2")}
+        action.save_template_index()
+
+        new_action = _template_index_action(environ)
+        with Stubber(new_action.s3_conn):  # any API call raises an error
+            for name in ["stack1", "stack2"]:
+                new_action.s3_stack_push(MockBlueprint(name=name, context=new_action.context))
+        assert new_action.template_index == action.template_index
+
+    def test_s3_stack_push_no_index(self) -> None:
+        """Test s3_stack_push when the bucket can't be listed."""
+        action = _template_index_action()
+        stubber = Stubber(action.s3_conn)
+        stubber.add_client_error("list_objects_v2", service_error_code="AccessDenied")
+        stubber.add_response(
+            "head_object",
+            {"ContentLength": 1},
+            {"Bucket": action.bucket_name, "Key": _template_key("stack1")},
+        )
+        stubber.add_client_error("head_object", service_error_code="404")
+        stubber.add_response("put_object", {})
+        with stubber:
+            action.s3_stack_push(MockBlueprint(name="stack1", context=action.context))
+            action.s3_stack_push(MockBlueprint(name="stack2", context=action.context))
+        stubber.assert_no_pending_responses()
+        assert action.template_index is None
@@ -294,6 +294,50 @@ class TestBuildAction(unittest.TestCase):  # TODO (kyle): refactor tests into th
             "vpc": set(),
         }
 
+    def test_schedule_hooks(self) -> None:
+        """Test _schedule_hooks."""
+        context = self._get_context(
+            extra_config_args={
+                "pre_deploy": [
+                    {"path": "hook.serial"},
+                    {"path": "hook.scheduled", "required_by": ["bastion"]},
+                ],
+                "post_deploy": [
+                    {"path": "hook.scheduled", "args": {"id": "${output db.Id}"}, "requires": []}
+                ],
+            }
+        )
+        deploy_action = deploy.Action(
+            context,
+            provider_builder=MockProviderBuilder(provider=MockProvider()),  # type: ignore
+            cancel=MockThreadingEvent(),  # type: ignore
+        )
+        plan = cast("Plan", deploy_action._Action__generate_plan())  # type: ignore
+        deploy_action._schedule_hooks(plan)
+        assert plan.graph.to_dict() == {
+            "db": {"bastion", "vpc"},
+            "bastion": {"pre_deploy.1", "vpc"},
+            "other": set(),
+            "vpc": set(),
+            "pre_deploy.1": set(),
+            "post_deploy.0": {"db"},
+        }
+        assert [hook.path for hook in deploy_action._serial_hooks(context.config.pre_deploy)] == [
+            "hook.serial"
+        ]
+
+    def test_schedule_hooks_stack_names(self) -> None:
+        """Test _schedule_hooks does nothing when targeting specific stacks."""
+        context = self._get_context(
+            extra_config_args={"pre_deploy": [{"path": "hook.scheduled", "requires": []}]},
+            stack_names=["vpc"],
+        )
+        deploy_action = deploy.Action(context, cancel=MockThreadingEvent())  # type: ignore
+        plan = cast("Plan", deploy_action._Action__generate_plan())  # type: ignore
+        deploy_action._schedule_hooks(plan)
+        assert "pre_deploy.0" not in plan.graph.to_dict()
+        assert deploy_action._serial_hooks(context.config.pre_deploy) == context.config.pre_deploy
+
     def test_does_not_execute_plan_when_outline_specified(self) -> None:
         """Test does not execute plan when outline specified."""
         context = self._get_context()
@@ -406,6 +450,7 @@ class TestLaunchStack(TestBuildAction):  # TODO (kyle): refactor tests to be pyt
         self.stack.blueprint.rendered = "{}"
         self.stack.locked = False
         self.stack_status = None
+        self.stack_tags: list[dict[str, str]] = []
 
         plan = cast("Plan", self.deploy_action._Action__generate_plan())  # type: ignore
         self.step = plan.steps[0]
@@ -424,7 +469,7 @@ class TestLaunchStack(TestBuildAction):  # TODO (kyle): refactor tests to be pyt
                 "StackName": self.stack.name,
                 "StackStatus": self.stack_status,
                 "Outputs": [],
-                "Tags": [],
+                "Tags": self.stack_tags,
             }
 
         def get_events(*_args: Any, **_kwargs: Any) -> list[dict[str, Any]]:
@@ -528,6 +573,36 @@ class TestLaunchStack(TestBuildAction):  # TODO (kyle): refactor tests to be pyt
         self.provider.update_stack.side_effect = StackDidNotChange  # type: ignore
         self._advance("CREATE_COMPLETE", SKIPPED, "nochange")
 
+    def test_launch_stack_update_fingerprint_matches(self) -> None:
+        """Test launch stack update skipped when the fingerprint matches."""
+        self.context.config.deploy_fingerprint = True
+        self.stack.parameter_values = {}
+        self.stack.stack_policy = None
+        self.stack.tags = {}
+        self.stack.termination_protection = False
+        self.stack_tags = [
+            {
+                "Key": deploy.FINGERPRINT_TAG,
+                "Value": deploy.build_stack_fingerprint(self.stack),
+            }
+        ]
+        self._advance("UPDATE_COMPLETE", SKIPPED, "nochange")
+        self.provider.update_stack.assert_not_called()  # type: ignore
+        self.deploy_action.s3_stack_push.assert_not_called()  # type: ignore
+
+    def test_launch_stack_update_fingerprint_changed(self) -> None:
+        """Test launch stack update when the fingerprint does not match."""
+        self.context.config.deploy_fingerprint = True
+        self.stack.parameter_values = {}
+        self.stack.stack_policy = None
+        self.stack.tags = {}
+        self.stack.termination_protection = False
+        self.stack_tags = [{"Key": deploy.FINGERPRINT_TAG, "Value": "old"}]
+        self._advance("UPDATE_COMPLETE", SUBMITTED, "updating existing stack")
+        assert self.provider.update_stack.call_args.args[4] == [  # type: ignore
+            {"Key": deploy.FINGERPRINT_TAG, "Value": deploy.build_stack_fingerprint(self.stack)}
+        ]
+
     def test_launch_stack_update_rollback(self) -> None:
         """Test launch stack update rollback."""
         # initial status should be PENDING
@@ -560,6 +635,34 @@ class TestLaunchStack(TestBuildAction):  # TODO (kyle): refactor tests to be pyt
         self._advance("UPDATE_COMPLETE", COMPLETE, "updating existing stack")
 
 
+def test_build_stack_fingerprint() -> None:
+    """Test build_stack_fingerprint."""
+    stack = MagicMock(
+        parameter_values={"a": "Apple"},
+        stack_policy=None,
+        tags={"key": "val"},
+        termination_protection=False,
+    )
+    stack.blueprint.parameter_definitions = {"a": {"type": CFNString}}
+    stack.blueprint.rendered = "{}"
+    fingerprint = deploy.build_stack_fingerprint(stack)
+    assert len(fingerprint) == 64
+    assert deploy.build_stack_fingerprint(stack) == fingerprint
+    assert deploy.build_stack_fingerprint(stack, service_role="role") != fingerprint
+    stack.parameter_values = {"a": "Avocado"}
+    assert deploy.build_stack_fingerprint(stack) != fingerprint
+
+
+def test_build_stack_tags() -> None:
+    """Test build_stack_tags."""
+    stack = MagicMock(tags={"key": "val"})
+    assert deploy.build_stack_tags(stack) == [{"Key": "key", "Value": "val"}]
+    assert deploy.build_stack_tags(stack, "abc") == [
+        {"Key": "key", "Value": "val"},
+        {"Key": deploy.FINGERPRINT_TAG, "Value": "abc"},
+    ]
+
+
 class TestFunctions(unittest.TestCase):  # TODO (kyle): refactor tests to be pytest tests
     """Tests for runway.cfngin.actions.deploy module level functions."""
 
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import concurrent.futures
+import json
 import logging
 import unittest
 from operator import attrgetter
@@ -16,10 +18,11 @@ from runway.cfngin.actions.diff import (
     DictValue,
     diff_dictionaries,
     diff_parameters,
+    diff_templates,
 )
 from runway.cfngin.exceptions import StackDoesNotExist
 from runway.cfngin.providers.aws.default import Provider
-from runway.cfngin.status import SkippedStatus
+from runway.cfngin.status import COMPLETE, SkippedStatus
 
 from ..factories import MockProviderBuilder, MockThreadingEvent
 
@@ -133,6 +136,140 @@ class TestAction:
         mock_get_stack_changes.assert_called_once()
         assert result == expected
 
+    def test__diff_stack_local_diff_no_changes(
+        self,
+        cfngin_context: MockCfnginContext,
+        mocker: MockerFixture,
+        provider_get_stack: MagicMock,
+    ) -> None:
+        """Test _diff_stack when the stack matches the deployed stack."""
+        cfngin_context.add_stubber("cloudformation")
+        mocker.patch.object(Action, "build_parameters", return_value=[])
+        mock_matches = mocker.patch.object(Action, "_matches_deployed_stack", return_value=True)
+        mock_get_stack_changes = mocker.patch.object(Provider, "get_stack_changes")
+        mock_get_outputs = mocker.patch.object(Provider, "get_outputs", return_value={"key": "val"})
+        provider = Provider(cfngin_context.get_session())  # type: ignore
+        stack = MagicMock(fqn="test-stack", locked=False, status=None)
+
+        assert (
+            Action(
+                context=cfngin_context,
+                provider_builder=MockProviderBuilder(provider=provider),
+                cancel=MockThreadingEvent(),  # type: ignore
+            )._diff_stack(stack)
+            == COMPLETE
+        )
+        mock_matches.assert_called_once_with(stack, [], [])
+        mock_get_stack_changes.assert_not_called()
+        mock_get_outputs.assert_called_once_with("test-stack")
+        stack.set_outputs.assert_called_once_with({"key": "val"})
+        provider_get_stack.assert_called_once_with("test-stack")
+
+    def test__fetch_deployed_stack(
+        self, cfngin_context: MockCfnginContext, mocker: MockerFixture
+    ) -> None:
+        """Test _fetch_deployed_stack."""
+        cfngin_context.add_stubber("cloudformation")
+        provider = Provider(cfngin_context.get_session())  # type: ignore
+        provider_stack = {"StackName": "test-stack", "StackStatus": "UPDATE_COMPLETE"}
+        mocker.patch.object(provider, "get_stack", return_value=provider_stack)
+        mocker.patch.object(
+            provider,
+            "get_stack_info",
+            return_value=('{"Resources": {}}', {"Param": "val"}),
+        )
+        action = Action(
+            context=cfngin_context, provider_builder=MockProviderBuilder(provider=provider)
+        )
+        assert action._fetch_deployed_stack("test-stack") == (
+            provider_stack,
+            {"Resources": {}},
+            {"Param": "val"},
+        )
+        provider_stack["StackStatus"] = "REVIEW_IN_PROGRESS"
+        assert not action._fetch_deployed_stack("test-stack")
+        provider.get_stack.side_effect = StackDoesNotExist("test-stack")  # type: ignore
+        assert not action._fetch_deployed_stack("test-stack")
+
+    @pytest.mark.parametrize(
+        "template, parameters, tags, expected",
+        [
+            ({"Resources": {"B": {}, "A": {}}}, [], [{"Key": "k", "Value": "v"}], True),
+            ({"Resources": {"A": {}}}, [], [{"Key": "k", "Value": "v"}], False),
+            (
+                {"Resources": {"A": {}, "B": {}}},
+                [{"ParameterKey": "Param", "UsePreviousValue": True}],
+                [{"Key": "k", "Value": "v"}],
+                True,
+            ),
+            (
+                {"Resources": {"A": {}, "B": {}}},
+                [{"ParameterKey": "Param", "ParameterValue": "new"}],
+                [{"Key": "k", "Value": "v"}],
+                False,
+            ),
+            ({"Resources": {"A": {}, "B": {}}}, [], [], False),
+        ],
+    )
+    def test__matches_deployed_stack(
+        self,
+        cfngin_context: MockCfnginContext,
+        expected: bool,
+        parameters: list[dict[str, str]],
+        tags: list[dict[str, str]],
+        template: dict[str, dict[str, str]],
+    ) -> None:
+        """Test _matches_deployed_stack."""
+        future: concurrent.futures.Future[object] = concurrent.futures.Future()
+        future.set_result(
+            (
+                {"Tags": [{"Key": "k", "Value": "v"}]},
+                {"Resources": {"A": {}, "B": {}}},
+                {"Param": "old"} if parameters else {},
+            )
+        )
+        action = Action(context=cfngin_context)
+        action._deployed_stacks["test-stack"] = future  # type: ignore
+        stack = MagicMock(blueprint=Mock(rendered=json.dumps(template)), fqn="test-stack")
+        assert action._matches_deployed_stack(stack, parameters, tags) is expected  # type: ignore
+
+    def test__matches_deployed_stack_not_available(self, cfngin_context: MockCfnginContext) -> None:
+        """Test _matches_deployed_stack deployed stack not available."""
+        action = Action(context=cfngin_context)
+        stack = MagicMock(blueprint=Mock(rendered="{}"), fqn="test-stack")
+        assert not action._matches_deployed_stack(stack, [], [])
+
+        does_not_exist: concurrent.futures.Future[object] = concurrent.futures.Future()
+        does_not_exist.set_result(None)
+        action._deployed_stacks["test-stack"] = does_not_exist  # type: ignore
+        assert not action._matches_deployed_stack(stack, [], [])
+
+        error: concurrent.futures.Future[object] = concurrent.futures.Future()
+        error.set_exception(ClientError({"Error": {"Code": "Throttling"}}, "get_template"))
+        action._deployed_stacks["test-stack"] = error  # type: ignore
+        assert not action._matches_deployed_stack(stack, [], [])
+
+    @pytest.mark.parametrize("local_diff", [False, True])
+    def test_run(
+        self, cfngin_context: MockCfnginContext, local_diff: bool, mocker: MockerFixture
+    ) -> None:
+        """Test run."""
+        if local_diff:
+            cfngin_context.env.vars["RUNWAY_CFNGIN_LOCAL_DIFF"] = "true"
+        mock_plan = mocker.patch.object(Action, "_generate_plan").return_value
+        mock_fetch = mocker.patch.object(Action, "_fetch_deployed_stack", return_value=None)
+        mocker.patch.object(cfngin_context, "stacks", [Mock(fqn="stack1"), Mock(fqn="stack2")])
+        action = Action(context=cfngin_context)
+        assert action.local_diff is local_diff
+        action.run()
+        mock_plan.execute.assert_called_once()
+        if local_diff:
+            assert sorted(action._deployed_stacks) == ["stack1", "stack2"]
+            assert mock_fetch.call_count == 2
+        else:
+            assert not action._deployed_stacks
+            mock_fetch.assert_not_called()
+
 
 class TestDictValueFormat(unittest.TestCase):
     """Tests for runway.cfngin.actions.diff.DictValue."""
@@ -209,3 +346,14 @@ class TestDiffParameters(unittest.TestCase):
 
         param_diffs = diff_parameters(old_params, new_params)
         assert param_diffs == []
+
+
+def test_diff_templates() -> None:
+    """Test diff_templates."""
+    old = {"Outputs": {"A": {"Value": "a"}}, "Resources": {"A": {"Type": "a", "Properties": {}}}}
+    assert not diff_templates(
+        old, {"Resources": {"A": {"Properties": {}, "Type": "a"}}, "Outputs": {"A": {"Value": "a"}}}
+    )
+    diff = diff_templates(old, {"Resources": {"A": {"Type": "b"}}})
+    assert [value.key for value in diff] == ["Outputs", "Resources"]
+    assert [value.status() for value in diff] == [DictValue.REMOVED, DictValue.MODIFIED]
@@ -8,9 +8,12 @@ from typing import TYPE_CHECKING, cast
 from unittest.mock import MagicMock, Mock
 
 import pytest
+from jinja2 import Environment
 
 from runway.cfngin.blueprints.raw import (
     RawTemplateBlueprint,
+    get_jinja_bytecode_cache_dir,
+    get_jinja_environment,
     get_template_path,
     resolve_variable,
 )
@@ -267,6 +270,23 @@ class TestRawTemplateBlueprint:
         )
         assert expected_json == blueprint.to_json()
 
+    def test_rendered_j2_shared_environment(
+        self, cfngin_context: CfnginContext, mocker: MockerFixture, tmp_path: Path
+    ) -> None:
+        """Test rendered compiles a jinja2 template once for all stacks that use it."""
+        cfngin_context.env.vars["RUNWAY_CACHE_DIR"] = str(tmp_path / "cache")
+        cfngin_context.env.vars["RUNWAY_JINJA_BYTECODE_CACHE"] = "true"
+        template_path = tmp_path / "templates" / "template.yml.j2"
+        template_path.parent.mkdir()
+        template_path.write_text("Description: {{ name }}")
+        spy_compile = mocker.spy(Environment, "compile")
+        assert [
+            RawTemplateBlueprint(name, cfngin_context, raw_template_path=template_path).rendered
+            for name in ["stack0", "stack1"]
+        ] == ["Description: stack0", "Description: stack1"]
+        spy_compile.assert_called_once()
+        assert list((tmp_path / "cache" / "jinja2").iterdir())
+
     def test_render_template(
         self, cfngin_context: CfnginContext, mocker: MockerFixture, tmp_path: Path
     ) -> None:
@@ -299,6 +319,48 @@ class TestRawTemplateBlueprint:
         )
 
 
+def test_get_jinja_bytecode_cache_dir(tmp_path: Path) -> None:
+    """Test get_jinja_bytecode_cache_dir."""
+    assert get_jinja_bytecode_cache_dir(
+        {"RUNWAY_CACHE_DIR": str(tmp_path), "RUNWAY_JINJA_BYTECODE_CACHE": "true"}
+    ) == (tmp_path / "jinja2")
+    assert not (tmp_path / "jinja2").exists()
+
+
+@pytest.mark.parametrize("value", [None, "", "false"])
+def test_get_jinja_bytecode_cache_dir_disabled(tmp_path: Path, value: str | None) -> None:
+    """Test get_jinja_bytecode_cache_dir not enabled."""
+    environ = {"RUNWAY_CACHE_DIR": str(tmp_path)}
+    if value is not None:
+        environ["RUNWAY_JINJA_BYTECODE_CACHE"] = value
+    assert not get_jinja_bytecode_cache_dir(environ)
+
+
+def test_get_jinja_environment(tmp_path: Path) -> None:
+    """Test get_jinja_environment."""
+    environment = get_jinja_environment(tmp_path / "templates")
+    assert not environment.bytecode_cache
+    assert get_jinja_environment(tmp_path / "templates" / ".." / "templates") is environment
+    cached_environment = get_jinja_environment(
+        tmp_path / "templates", bytecode_cache_dir=tmp_path / "cache"
+    )
+    assert cached_environment is not environment
+    assert cached_environment.bytecode_cache
+    assert (
+        get_jinja_environment(tmp_path / "templates", bytecode_cache_dir=tmp_path / "cache")
+        is cached_environment
+    )
+    assert (tmp_path / "cache").is_dir()
+
+
+def test_get_jinja_environment_bytecode_cache_dir_error(tmp_path: Path) -> None:
+    """Test get_jinja_environment bytecode cache directory can't be created."""
+    (tmp_path / "file").touch()
+    assert not get_jinja_environment(
+        tmp_path / "templates", bytecode_cache_dir=tmp_path / "file" / "cache"
+    ).bytecode_cache
+
+
 def test_get_template_path_local_file(tmp_path: Path) -> None:
     """Verify get_template_path finding a file relative to CWD."""
     template_path = Path("cfn_template.json")
@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import json
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
+from unittest.mock import ANY as MOCK_ANY
 
 import pytest
 import yaml
@@ -14,13 +15,20 @@ from runway.cfngin.hooks.staticsite.upload_staticsite import (
     calculate_hash_of_extra_files,
     get_content,
     get_content_type,
+    get_invalidation_paths,
+    invalidate_distribution,
+    sync,
     sync_extra_files,
 )
 from runway.module.staticsite.options import RunwayStaticSiteExtraFileDataModel
 
 if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
     from ....factories import MockCfnginContext
 
+MODULE = "runway.cfngin.hooks.staticsite.upload_staticsite"
+
 
 @pytest.mark.parametrize(
     "provided, expected",
@@ -322,3 +330,178 @@ def test_sync_extra_files_hash_updated(cfngin_context: MockCfnginContext) -> Non
         ) == ["test"]
         s3_stub.assert_no_pending_responses()
         ssm_stub.assert_no_pending_responses()
+
+
+@pytest.mark.parametrize(
+    "keys, max_paths, expected",
+    [
+        ([], 10, []),
+        (
+            ["index.html", "static/main.js", "docs/index.html", "a b.html"],
+            10,
+            ["/", "/a%20b.html", "/docs/index.html", "/index.html", "/static/main.js"],
+        ),
+        (
+            ["index.html", "static/js/0.js", "static/js/1.js", "static/css/0.css"],
+            4,
+            ["/", "/index.html", "/static/css/*", "/static/js/*"],
+        ),
+        (
+            ["index.html", "static/js/0.js", "static/js/1.js", "static/css/0.css"],
+            3,
+            ["/", "/index.html", "/static/*"],
+        ),
+        (["a/0.js", "b/0.js", "c/0.js"], 2, ["/*"]),
+    ],
+)
+def test_get_invalidation_paths(keys: list[str], max_paths: int, expected: list[str]) -> None:
+    """Test get_invalidation_paths."""
+    assert get_invalidation_paths(keys, max_paths=max_paths) == expected
+
+
+@pytest.mark.parametrize(
+    "index_document, expected",
+    [
+        (
+            "index.html",
+            ["/", "/docs/", "/docs/default.htm", "/docs/index.html", "/index.html"],
+        ),
+        (
+            "default.htm",
+            ["/", "/docs/", "/docs/default.htm", "/docs/index.html", "/index.html"],
+        ),
+        ("other.html", ["/", "/docs/default.htm", "/docs/index.html", "/index.html"]),
+    ],
+)
+def test_get_invalidation_paths_index_document(index_document: str, expected: list[str]) -> None:
+    """Test get_invalidation_paths with an index document."""
+    assert (
+        get_invalidation_paths(
+            ["index.html", "docs/index.html", "docs/default.htm"], index_document=index_document
+        )
+        == expected
+    )
+
+
+def test_get_invalidation_paths_max_wildcards() -> None:
+    """Test get_invalidation_paths collapses wildcards."""
+    keys = [f"{i}/{j}/file.js" for i in range(2) for j in range(3)]
+    assert get_invalidation_paths(keys, max_paths=5, max_wildcards=6) == ["/0/*", "/1/*"]
+    assert get_invalidation_paths(keys, max_paths=5, max_wildcards=1) == ["/*"]
+
+
+@pytest.mark.parametrize(
+    "kwargs, expected",
+    [
+        ({}, ["/*"]),
+        ({"path": "/foo/*"}, ["/foo/*"]),
+        ({"paths": ["/", "/index.html"]}, ["/", "/index.html"]),
+    ],
+)
+def test_invalidate_distribution(
+    cfngin_context: MockCfnginContext, expected: list[str], kwargs: dict[str, Any]
+) -> None:
+    """Test invalidate_distribution."""
+    stubber = cfngin_context.add_stubber("cloudfront")
+    stubber.add_response(
+        "create_invalidation",
+        {},
+        {
+            "DistributionId": "test-id",
+            "InvalidationBatch": {
+                "Paths": {"Quantity": len(expected), "Items": expected},
+                "CallerReference": ANY,
+            },
+        },
+    )
+    with stubber:
+        assert invalidate_distribution(cfngin_context.get_session(), identifier="test-id", **kwargs)
+    stubber.assert_no_pending_responses()
+
+
+@pytest.mark.parametrize(
+    "deploy_is_current, extra_files, synced, expected",
+    [
+        (False, [], ["index.html", "main.js"], ["/", "/index.html", "/main.js"]),
+        (False, ["config.json"], ["main.js"], ["/config.json", "/main.js"]),
+        (False, [], [], None),
+        (True, ["config.json"], [], ["/config.json"]),
+        (True, [], [], None),
+    ],
+)
+def test_sync(
+    cfngin_context: MockCfnginContext,
+    deploy_is_current: bool,
+    expected: list[str] | None,
+    extra_files: list[str],
+    mocker: MockerFixture,
+    synced: list[str],
+) -> None:
+    """Test sync."""
+    cfngin_context.hook_data["staticsite"] = {
+        "app_directory": "./dist",
+        "deploy_is_current": deploy_is_current,
+    }
+    mock_bucket = mocker.patch(f"{MODULE}.Bucket")
+    mock_bucket.return_value.sync_from_local.return_value = synced
+    mocker.patch(f"{MODULE}.sync_extra_files", return_value=list(extra_files))
+    mock_invalidate_distribution = mocker.patch(f"{MODULE}.invalidate_distribution")
+    mocker.patch(f"{MODULE}.prune_archives")
+    mocker.patch(f"{MODULE}.update_ssm_hash")
+    assert sync(cfngin_context, bucket_name="bucket", distribution_id="test-id")
+    if deploy_is_current:
+        mock_bucket.assert_not_called()
+    if expected:
+        mock_invalidate_distribution.assert_called_once_with(
+            MOCK_ANY, identifier="test-id", domain="undefined", paths=expected
+        )
+    else:
+        mock_invalidate_distribution.assert_not_called()
+
+
+def test_sync_rewrite_directory_index(
+    cfngin_context: MockCfnginContext, mocker: MockerFixture
+) -> None:
+    """Test sync with rewrite_directory_index."""
+    cfngin_context.hook_data["staticsite"] = {
+        "app_directory": "./dist",
+        "deploy_is_current": False,
+    }
+    mocker.patch(f"{MODULE}.Bucket").return_value.sync_from_local.return_value = [
+        "docs/default.htm"
+    ]
+    mocker.patch(f"{MODULE}.sync_extra_files", return_value=[])
+    mock_invalidate_distribution = mocker.patch(f"{MODULE}.invalidate_distribution")
+    mocker.patch(f"{MODULE}.prune_archives")
+    mocker.patch(f"{MODULE}.update_ssm_hash")
+    assert sync(
+        cfngin_context,
+        bucket_name="bucket",
+        distribution_id="test-id",
+        rewrite_directory_index="default.htm",
+    )
+    mock_invalidate_distribution.assert_called_once_with(
+        MOCK_ANY,
+        identifier="test-id",
+        domain="undefined",
+        paths=["/docs/", "/docs/default.htm"],
+    )
+
+
+def test_sync_distribution_path(cfngin_context: MockCfnginContext, mocker: MockerFixture) -> None:
+    """Test sync with distribution_path."""
+    cfngin_context.hook_data["staticsite"] = {
+        "app_directory": "./dist",
+        "deploy_is_current": False,
+    }
+    mocker.patch(f"{MODULE}.Bucket").return_value.sync_from_local.return_value = []
+    mocker.patch(f"{MODULE}.sync_extra_files", return_value=[])
+    mock_invalidate_distribution = mocker.patch(f"{MODULE}.invalidate_distribution")
+    mocker.patch(f"{MODULE}.prune_archives")
+    mocker.patch(f"{MODULE}.update_ssm_hash")
+    assert sync(
+        cfngin_context, bucket_name="bucket", distribution_id="test-id", distribution_path="/*"
+    )
+    mock_invalidate_distribution.assert_called_once_with(
+        MOCK_ANY, identifier="test-id", domain="undefined", path="/*"
+    )
@@ -2,14 +2,16 @@
 
 from __future__ import annotations
 
+import hashlib
 from typing import TYPE_CHECKING, cast
-from unittest.mock import Mock, call
+from unittest.mock import call
 
 import igittigitt
 import pytest
 
 from runway.cfngin.hooks.staticsite.utils import (
     calculate_hash_of_files,
+    get_files_to_hash,
     get_hash_of_files,
     get_ignorer,
 )
@@ -24,17 +26,59 @@ MODULE = "runway.cfngin.hooks.staticsite.utils"
 
 def test_calculate_hash_of_files(mocker: MockerFixture, tmp_path: Path) -> None:
     """Test calculate_hash_of_files."""
-    mock_file_hash_obj = Mock(add_files=Mock(), hexdigest="success")
-    mocker.patch(f"{MODULE}.FileHash", return_value=mock_file_hash_obj)
-
+    mocker.patch(f"{MODULE}.HASH_MAX_WORKERS", 1)
     file0 = tmp_path / "nested" / "file0.txt"
+    file0.parent.mkdir()
+    file0.write_text("file0")
     file1 = tmp_path / "file1.txt"
-    assert calculate_hash_of_files([file0, file1], tmp_path) == mock_file_hash_obj.hexdigest
-    mock_file_hash_obj.add_files.assert_called_once_with(
-        [str(file1), str(file0)], relative_to=tmp_path
+    file1.write_text("file1")
+    file2 = tmp_path / "nested" / "file2.txt"
+    file2.write_text("file2")
+    assert (
+        calculate_hash_of_files([file0, str(file2), file1], tmp_path)
+        == hashlib.md5(  # noqa: S324
+            b"file1.txt\0file1\0nested/file0.txt\0file0\0nested/file2.txt\0file2\0"
+        ).hexdigest()
     )
 
 
+def test_calculate_hash_of_files_empty(tmp_path: Path) -> None:
+    """Test calculate_hash_of_files with no files."""
+    assert calculate_hash_of_files([], tmp_path) == hashlib.md5().hexdigest()  # noqa: S324
+
+
+def test_get_files_to_hash(tmp_path: Path) -> None:
+    """Test get_files_to_hash."""
+    (tmp_path / ".gitignore").write_text("*.ignore\n")
+    (tmp_path / "foo").touch()
+    (tmp_path / "foo.ignore").touch()
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "bar").touch()
+    (tmp_path / "other").mkdir()
+    (tmp_path / "other" / "baz").touch()
+    assert sorted(get_files_to_hash(tmp_path)) == [
+        tmp_path / ".gitignore",
+        tmp_path / "foo",
+        tmp_path / "other" / "baz",
+        tmp_path / "src" / "bar",
+    ]
+    assert get_files_to_hash(tmp_path, [{"path": "src"}]) == [tmp_path / "src" / "bar"]
+
+
+def test_get_files_to_hash_prune(mocker: MockerFixture, tmp_path: Path) -> None:
+    """Test get_files_to_hash does not descend into ignored directories."""
+    gitignore = igittigitt.IgnoreParser()
+    gitignore.add_rule("node_modules/", tmp_path)
+    match = mocker.spy(gitignore, "match")
+    mocker.patch(f"{MODULE}.get_ignorer", return_value=gitignore)
+    (tmp_path / "node_modules" / "pkg").mkdir(parents=True)
+    (tmp_path / "node_modules" / "pkg" / "index.js").touch()
+    (tmp_path / "index.js").touch()
+    assert get_files_to_hash(tmp_path) == [tmp_path / "index.js"]
+    assert get_files_to_hash(tmp_path, [{"path": "node_modules"}]) == []
+    assert call(tmp_path / "node_modules" / "pkg") not in match.call_args_list
+
+
 @pytest.mark.parametrize(
     "directories", [None, [{"path": "./"}], [{"path": "./", "exclusions": ["foobar"]}]]
 )
@@ -12,7 +12,13 @@ import pytest
 
 from runway.cfngin.hooks.base import HookArgsBaseModel
 from runway.cfngin.hooks.protocols import CfnginHookProtocol
-from runway.cfngin.hooks.utils import handle_hooks
+from runway.cfngin.hooks.utils import (
+    build_hook_steps,
+    handle_hooks,
+    is_scheduled_hook,
+    run_hook,
+)
+from runway.cfngin.status import COMPLETE, FAILED
 from runway.config.models.cfngin import CfnginHookDefinitionModel
 
 from ..factories import mock_context, mock_provider
@@ -199,6 +205,116 @@ class TestHooks(unittest.TestCase):
         assert self.context.hook_data["my_hook_results"]["default_lookup"] == "default_value"
 
 
+def test_build_hook_steps() -> None:
+    """Test build_hook_steps."""
+    context = mock_context(
+        namespace="namespace",
+        extra_config_args={
+            "stacks": [
+                {
+                    "name": "app",
+                    "template_path": ".",
+                    "variables": {"Image": "${hook_data image.uri}"},
+                },
+                {"name": "db", "template_path": "."},
+                {"name": "vpc", "template_path": "."},
+                {"name": "other", "template_path": ".", "variables": {"Key": "${hook_data other}"}},
+            ]
+        },
+    )
+    hooks = {
+        "pre_deploy": [
+            CfnginHookDefinitionModel(path="hook.serial", data_key="other"),
+            CfnginHookDefinitionModel(path="hook.image", data_key="image", required_by=["db"]),
+        ],
+        "post_deploy": [
+            CfnginHookDefinitionModel(
+                path="hook.seed",
+                args={
+                    "cfn": "${cfn namespace-db.Name}",
+                    "external": "${cfn external.Name::default=x}",
+                    "hook_data": "${hook_data image.uri}",
+                    "output": "${output vpc.Id}",
+                },
+                requires=[],
+            ),
+            CfnginHookDefinitionModel(path="hook.disabled", enabled=False, requires=[]),
+        ],
+    }
+    steps = build_hook_steps(hooks, mock_provider(region="us-east-1"), context)
+    assert {step.name: (step.requires, step.required_by) for step in steps} == {
+        "pre_deploy.1": (set(), {"app", "db"}),
+        "post_deploy.0": ({"db", "pre_deploy.1", "vpc"}, set()),
+    }
+
+
+def test_build_hook_steps_fn() -> None:
+    """Test the function of steps built by build_hook_steps."""
+    context = mock_context(namespace="namespace")
+    success, failure = build_hook_steps(
+        {
+            "post_deploy": [
+                CfnginHookDefinitionModel(
+                    path="tests.unit.cfngin.hooks.test_utils.result_hook",
+                    data_key="result",
+                    requires=[],
+                ),
+                CfnginHookDefinitionModel(
+                    path="tests.unit.cfngin.hooks.test_utils.fail_hook", requires=[]
+                ),
+            ]
+        },
+        mock_provider(region="us-east-1"),
+        context,
+    )
+    assert success.run()
+    assert success.status == COMPLETE
+    assert context.hook_data["result"] == {"foo": "bar"}
+    assert not failure.run()
+    assert failure.status == FAILED
+    assert failure.status.reason == "required hook failed"
+
+
+@pytest.mark.parametrize(
+    "kwargs, expected",
+    [
+        ({}, False),
+        ({"requires": []}, True),
+        ({"required_by": ["stack"]}, True),
+        ({"enabled": False, "requires": ["stack"]}, False),
+    ],
+)
+def test_is_scheduled_hook(kwargs: dict[str, Any], expected: bool) -> None:
+    """Test is_scheduled_hook."""
+    assert is_scheduled_hook(CfnginHookDefinitionModel(path="hook", **kwargs)) is expected
+
+
+def test_run_hook() -> None:
+    """Test run_hook."""
+    context = mock_context(namespace="namespace")
+    provider = mock_provider(region="us-east-1")
+    assert run_hook(
+        "post_deploy",
+        CfnginHookDefinitionModel(path="tests.unit.cfngin.hooks.test_utils.context_hook"),
+        provider,
+        context,
+    )
+    assert not run_hook(
+        "post_deploy",
+        CfnginHookDefinitionModel(path="tests.unit.cfngin.hooks.test_utils.fail_hook"),
+        provider,
+        context,
+    )
+    assert run_hook(
+        "post_deploy",
+        CfnginHookDefinitionModel(
+            path="tests.unit.cfngin.hooks.test_utils.fail_hook", required=False
+        ),
+        provider,
+        context,
+    )
+
+
 class MockHook(CfnginHookProtocol):
     """Mock hook class."""
 
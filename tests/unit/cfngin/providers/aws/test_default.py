@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import concurrent.futures
+import contextvars
 import copy
 import locale
+import os
 import random
 import string
 import threading
@@ -25,6 +28,7 @@ from runway.cfngin.providers.aws import default
 from runway.cfngin.providers.aws.default import (
     DEFAULT_CAPABILITIES,
     MAX_TAIL_RETRIES,
+    ChangeSetWaiter,
     Provider,
     ask_for_approval,
     create_change_set,
@@ -147,9 +151,10 @@ def generate_change_set_response(
     execution_status: str = "AVAILABLE",
     changes: list[dict[str, Any]] | None = None,
     status_reason: str = "FAKE",
+    next_token: str | None = None,
 ) -> dict[str, Any]:
     """Generate change set response."""
-    return {
+    response: dict[str, Any] = {
         "ChangeSetName": "string",
         "ChangeSetId": "string",
         "StackId": "string",
@@ -170,8 +175,10 @@ def generate_change_set_response(
         "Capabilities": ["CAPABILITY_NAMED_IAM", "CAPABILITY_AUTO_EXPAND"],
         "Tags": [{"Key": "string", "Value": "string"}],
         "Changes": changes or [],
-        "NextToken": "string",
     }
+    if next_token:
+        response["NextToken"] = next_token
+    return response
 
 
 def generate_change(
@@ -346,6 +353,18 @@ class TestMethods(unittest.TestCase):
         with self.stubber:
             wait_till_change_set_complete(self.cfn, "FAKEID")
 
+    def test_wait_till_change_set_complete_shared_waiter(self) -> None:
+        """Test wait till change set complete uses the shared waiter by default."""
+        with patch.object(default.CHANGE_SET_WAITER, "wait", return_value="success") as mock_wait:
+            assert wait_till_change_set_complete(self.cfn, "FAKEID") == "success"
+            mock_wait.assert_called_once_with(self.cfn, "FAKEID")
+            self.stubber.add_response(
+                "describe_change_set", generate_change_set_response("CREATE_COMPLETE")
+            )
+            with self.stubber:
+                wait_till_change_set_complete(self.cfn, "FAKEID", try_count=2)
+            mock_wait.assert_called_once()
+
     def test_wait_till_change_set_complete_failed(self) -> None:
         """Test wait till change set complete failed."""
         # Need 2 responses for try_count
@@ -396,6 +415,107 @@ class TestMethods(unittest.TestCase):
                 tags=[],
             )
 
+    def test_create_change_set_paginated(self) -> None:
+        """Test create change set with changes split across pages."""
+        first = generate_resource_change()
+        second = generate_resource_change(replacement=False)
+        self.stubber.add_response("create_change_set", {"Id": "CHANGESETID", "StackId": "STACKID"})
+        self.stubber.add_response(
+            "describe_change_set",
+            generate_change_set_response("CREATE_COMPLETE", changes=[first], next_token="token"),
+            {"ChangeSetName": "CHANGESETID"},
+        )
+        self.stubber.add_response(
+            "describe_change_set",
+            generate_change_set_response("CREATE_COMPLETE", changes=[second]),
+            {"ChangeSetName": "CHANGESETID", "NextToken": "token"},
+        )
+
+        with self.stubber:
+            changes, change_set_id = create_change_set(
+                cfn_client=self.cfn,
+                fqn="my-fake-stack",
+                template=Template(url="http://fake.template.url.com/"),
+                parameters=[],
+                tags=[],
+            )
+        self.stubber.assert_no_pending_responses()
+        assert changes == [first, second]
+        assert change_set_id == "CHANGESETID"
+
+    def test_change_set_waiter(self) -> None:
+        """Test ChangeSetWaiter waiting on multiple change sets."""
+        responses = {
+            "cs-0": ["CREATE_PENDING", "CREATE_COMPLETE"],
+            "cs-1": ["CREATE_IN_PROGRESS", "CREATE_IN_PROGRESS", "FAILED"],
+            "cs-2": ["CREATE_COMPLETE"],
+        }
+        cfn = MagicMock()
+        cfn.describe_change_set.side_effect = lambda ChangeSetName: {  # noqa: N803
+            "Status": responses[ChangeSetName].pop(0)
+        }
+        waiter = ChangeSetWaiter(sleep_time=0.01, max_sleep=0.02)
+        with concurrent.futures.ThreadPoolExecutor() as executor:
+            results = {
+                change_set_id: executor.submit(waiter.wait, cfn, change_set_id)
+                for change_set_id in responses
+            }
+        assert {key: value.result()["Status"] for key, value in results.items()} == {
+            "cs-0": "CREATE_COMPLETE",
+            "cs-1": "FAILED",
+            "cs-2": "CREATE_COMPLETE",
+        }
+        assert cfn.describe_change_set.call_count == 6
+        assert not waiter._pending
+
+    def test_change_set_waiter_did_not_stabilize(self) -> None:
+        """Test ChangeSetWaiter raise ChangesetDidNotStabilize."""
+        cfn = MagicMock()
+        cfn.describe_change_set.return_value = {"Status": "CREATE_PENDING"}
+        waiter = ChangeSetWaiter(try_count=2, sleep_time=0.01)
+        with pytest.raises(exceptions.ChangesetDidNotStabilize):
+            waiter.wait(cfn, "FAKEID")
+        assert cfn.describe_change_set.call_count == 2
+
+        cfn.describe_change_set.side_effect = ValueError("describe failed")
+        with pytest.raises(ValueError, match="describe failed"):
+            waiter.wait(cfn, "FAKEID")
+
+    def test_change_set_waiter_context(self) -> None:
+        """Test ChangeSetWaiter describes change sets in the context of the caller."""
+        scope: contextvars.ContextVar[str] = contextvars.ContextVar("scope", default="")
+        scopes: dict[str, str] = {}
+
+        def describe_change_set(ChangeSetName: str) -> dict[str, str]:  # noqa: N803
+            scopes[ChangeSetName] = scope.get()
+            return {"Status": "CREATE_COMPLETE"}
+
+        def wait(change_set_id: str) -> None:
+            scope.set(f"stack-{change_set_id}")
+            waiter.wait(cfn, change_set_id)
+
+        cfn = MagicMock()
+        cfn.describe_change_set.side_effect = describe_change_set
+        waiter = ChangeSetWaiter(sleep_time=0.01)
+        with concurrent.futures.ThreadPoolExecutor() as executor:
+            for future in [executor.submit(wait, f"cs-{i}") for i in range(3)]:
+                future.result()
+        assert scopes == {f"cs-{i}": f"stack-cs-{i}" for i in range(3)}
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def test_change_set_waiter_fork(self) -> None:
+        """Test the shared ChangeSetWaiter is reset in a forked process."""
+        waiter = default.CHANGE_SET_WAITER
+        with waiter._lock:
+            waiter._pending["cs-0"] = MagicMock()
+            try:
+                pid = os.fork()
+                if pid == 0:  # child
+                    os._exit(int(waiter._lock.locked() or bool(waiter._pending)))
+            finally:
+                del waiter._pending["cs-0"]
+        assert os.waitstatus_to_exitcode(os.waitpid(pid, 0)[1]) == 0
+
     def test_create_change_set_bad_execution_status(self) -> None:
         """Test create change set bad execution status."""
         self.stubber.add_response("create_change_set", {"Id": "CHANGESETID", "StackId": "STACKID"})
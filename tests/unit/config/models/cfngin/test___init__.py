@@ -71,6 +71,7 @@ class TestCfnginConfigDefinitionModel:
         assert not obj.cfngin_bucket
         assert not obj.cfngin_bucket_region
         assert not obj.cfngin_cache_dir
+        assert not obj.deploy_fingerprint
         assert obj.log_formats == {}
         assert obj.lookups == {}
         assert obj.mappings == {}
@@ -64,6 +64,59 @@ class TestRunwayConfigDefinitionModel:
         with pytest.raises(ValidationError, match="invalid\n  Extra inputs are not permitted"):
             RunwayConfigDefinitionModel.model_validate({"invalid": "val"})
 
+    def test_validate_depends_on(self) -> None:
+        """Test _validate_depends_on."""
+        obj = RunwayConfigDefinitionModel.model_validate(
+            {
+                "deployments": [
+                    {"name": "network", "modules": ["network.cfn"], "regions": ["us-east-1"]},
+                    {
+                        "name": "app",
+                        "depends_on": ["network"],
+                        "modules": ["app.cfn"],
+                        "regions": ["us-east-1"],
+                    },
+                ]
+            }
+        )
+        assert obj.deployments[1].depends_on == ["network"]
+
+    @pytest.mark.parametrize(
+        "deployments, match",
+        [
+            ([{"name": "app", "depends_on": ["missing"]}], "depends on missing which does not"),
+            (
+                [{"name": "app", "depends_on": ["dup"]}, {"name": "dup"}, {"name": "dup"}],
+                "depends on dup which is not a unique name",
+            ),
+            (
+                [{"name": "app", "depends_on": ["other"]}, {"name": "app"}, {"name": "other"}],
+                "deployment app uses depends_on but its name is not unique",
+            ),
+            (
+                [
+                    {"name": "a", "depends_on": ["b"]},
+                    {"name": "b", "depends_on": ["c"]},
+                    {"name": "c", "depends_on": ["a"]},
+                ],
+                "depends_on is circular: a -> b -> c -> a",
+            ),
+        ],
+    )
+    def test_validate_depends_on_invalid(
+        self, deployments: list[dict[str, Any]], match: str
+    ) -> None:
+        """Test _validate_depends_on invalid."""
+        with pytest.raises(ValidationError, match=match):
+            RunwayConfigDefinitionModel.model_validate(
+                {
+                    "deployments": [
+                        {"modules": ["sampleapp.cfn"], "regions": ["us-east-1"], **deployment}
+                        for deployment in deployments
+                    ]
+                }
+            )
+
     def test_field_defaults(self) -> None:
         """Test filed default values."""
         obj = RunwayConfigDefinitionModel()
@@ -116,6 +169,7 @@ class TestRunwayDeploymentDefinitionModel:
         assert obj.account_alias is None
         assert obj.account_id is None
         assert isinstance(obj.assume_role, RunwayAssumeRoleDefinitionModel)
+        assert obj.depends_on == []
         assert obj.env_vars == {}
         assert obj.environments == {}
         assert obj.modules == []
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, call, patch
 
 import pytest
 import yaml
@@ -20,6 +20,8 @@ from runway.exceptions import ConfigNotFound
 if TYPE_CHECKING:
     from pathlib import Path
 
+    from pytest_mock import MockerFixture
+
 
 MODULE = "runway.config"
 
@@ -158,88 +160,107 @@ class TestCfnginConfig:
         )
         assert CfnginConfig.parse_obj({}).namespace == "success"
 
+    def test_merge_package_sources(
+        self, monkeypatch: pytest.MonkeyPatch, mocker: MockerFixture, tmp_path: Path
+    ) -> None:
+        """Test merge_package_sources."""
+        mock_source_processor = mocker.patch(f"{MODULE}.SourceProcessor")
+        mock_resolve_raw_data = MagicMock(side_effect=lambda x, **_: x.replace("$val", "rendered"))
+        monkeypatch.setattr(CfnginConfig, "resolve_raw_data", mock_resolve_raw_data)
+        mock_source_processor.return_value.configs_to_merge = []
+
+        config = {"namespace": "test"}
+        assert (
+            CfnginConfig.merge_package_sources(config, parameters={"key": "val"}, work_dir=tmp_path)
+            is config
+        )
+        mock_source_processor.assert_called_once_with(
+            sources=CfnginPackageSourcesDefinitionModel(),
+            cache_dir=tmp_path / "cache",
+        )
+        mock_source_processor.return_value.get_package_sources.assert_called_once_with()
+        mock_resolve_raw_data.assert_not_called()
+
+        first_config = tmp_path / "first.yml"
+        first_config.write_text("merged: $val\nnamespace: first\nother: first")
+        second_config = tmp_path / "second.yml"
+        second_config.write_text("other: second")
+        mock_source_processor.return_value.configs_to_merge = [first_config, second_config]
+        config = {"namespace": "test", "package_sources": {"git": [{"uri": "something"}]}}
+        assert CfnginConfig.merge_package_sources(
+            config, parameters={"key": "val"}, work_dir=tmp_path
+        ) == {**config, "merged": "rendered", "other": "first"}
+        mock_source_processor.assert_called_with(
+            sources=CfnginPackageSourcesDefinitionModel.model_validate(
+                {"git": [{"uri": "something"}]}
+            ),
+            cache_dir=tmp_path / "cache",
+        )
+        mock_resolve_raw_data.assert_has_calls(
+            [
+                call(first_config.read_text(), parameters={"key": "val"}),
+                call(second_config.read_text(), parameters={"key": "val"}),
+            ]
+        )
+
     def test_parse_raw(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
         """Test parse_raw."""
         mock_resolve_raw_data = MagicMock()
         mock_parse_obj = MagicMock()
-        mock_process_package_sources = MagicMock()
+        mock_merge_package_sources = MagicMock()
         monkeypatch.setattr(CfnginConfig, "resolve_raw_data", mock_resolve_raw_data)
         monkeypatch.setattr(CfnginConfig, "parse_obj", mock_parse_obj)
-        monkeypatch.setattr(CfnginConfig, "process_package_sources", mock_process_package_sources)
+        monkeypatch.setattr(CfnginConfig, "merge_package_sources", mock_merge_package_sources)
 
         data = {"namespace": "test"}
         data_str = yaml.dump(data)
         mock_resolve_raw_data.return_value = data_str
         mock_parse_obj.return_value = data
-        mock_process_package_sources.return_value = data_str
+        mock_merge_package_sources.return_value = {"namespace": "merged"}
 
         assert (
             CfnginConfig.parse_raw(data_str, skip_package_sources=True, work_dir=tmp_path) == data
         )
         mock_resolve_raw_data.assert_called_once_with(yaml.dump(data), parameters={})
         mock_parse_obj.assert_called_once_with(data)
-        mock_process_package_sources.assert_not_called()
+        mock_merge_package_sources.assert_not_called()
 
         assert (
-            CfnginConfig.parse_raw(data_str, parameters={"key": "val"}, work_dir=tmp_path) == data
+            CfnginConfig.parse_raw(
+                data_str, parameters={"key": "val"}, path=tmp_path, work_dir=tmp_path
+            )
+            == data
         )
         mock_resolve_raw_data.assert_called_with(
             yaml.dump(data),
             parameters={"key": "val"},
         )
-        mock_process_package_sources.assert_called_once_with(
-            data_str, parameters={"key": "val"}, work_dir=tmp_path
+        mock_merge_package_sources.assert_called_once_with(
+            data, parameters={"key": "val"}, work_dir=tmp_path
         )
+        mock_parse_obj.assert_called_with(mock_merge_package_sources.return_value, path=tmp_path)
         assert mock_parse_obj.call_count == 2
 
-    @patch(MODULE + ".SourceProcessor")
-    def test_process_package_sources(
-        self, mock_source_processor: MagicMock, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
-    ) -> None:
+    def test_process_package_sources(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
         """Test process_package_sources."""
-        mock_resolve_raw_data = MagicMock(return_value="rendered")
-        monkeypatch.setattr(CfnginConfig, "resolve_raw_data", mock_resolve_raw_data)
-        mock_source_processor.return_value = mock_source_processor
-        mock_source_processor.configs_to_merge = []
+        mock_merge_package_sources = MagicMock(side_effect=lambda x, **_: x)
+        monkeypatch.setattr(CfnginConfig, "merge_package_sources", mock_merge_package_sources)
 
         raw_data = "namespace: test"
-        merge_data = "merged: value"
-        other_config = tmp_path / "other_config.yml"
-        other_config.write_text(merge_data)
         assert (
             CfnginConfig.process_package_sources(
                 raw_data, parameters={"key": "val"}, work_dir=tmp_path
             )
             == raw_data
         )
-        mock_source_processor.assert_called_once_with(
-            sources=CfnginPackageSourcesDefinitionModel(),
-            cache_dir=tmp_path / "cache",
+        mock_merge_package_sources.assert_called_once_with(
+            {"namespace": "test"}, parameters={"key": "val"}, work_dir=tmp_path
         )
-        mock_source_processor.get_package_sources.assert_called_once_with()
-        mock_resolve_raw_data.assert_not_called()
 
-        data = {"namespace": "test", "package_sources": {"git": [{"uri": "something"}]}}
-        raw_data = yaml.dump(data)
-        mock_source_processor.configs_to_merge = [other_config.resolve()]
-        assert (
-            CfnginConfig.process_package_sources(
-                raw_data, parameters={"key": "val"}, work_dir=tmp_path
-            )
-            == "rendered"
-        )
-        mock_source_processor.assert_called_with(
-            sources=CfnginPackageSourcesDefinitionModel.model_validate(
-                {"git": [{"uri": "something"}]}
-            ),
-            cache_dir=tmp_path / "cache",
-        )
-        assert mock_source_processor.call_count == 2
-        expected = data.copy()
-        expected["merged"] = "value"
-        mock_resolve_raw_data.assert_called_once_with(
-            yaml.dump(expected), parameters={"key": "val"}
-        )
+        mock_merge_package_sources.side_effect = lambda x, **_: {**x, "merged": "value"}
+        assert CfnginConfig.process_package_sources(
+            raw_data, parameters={"key": "val"}, work_dir=tmp_path
+        ) == yaml.dump({"merged": "value", "namespace": "test"})
 
     def test_resolve_raw_data(self) -> None:
         """Test resolve_raw_data."""
@@ -37,7 +37,7 @@ TEST_ROOT = Path(__file__).parent
 
 def pytest_ignore_collect(path: Any, config: Config) -> bool:  # noqa: ARG001
     """Determine if this directory should have its tests collected."""
-    if config.option.functional:
+    if config.option.functional or config.option.benchmark:
         return True
     return cast("bool", config.option.integration_only)
 
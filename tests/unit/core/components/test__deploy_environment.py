@@ -106,6 +106,7 @@ class TestDeployEnvironment:
     def test_branch_name_invalid_repo(self, mocker: MockerFixture) -> None:
         """Test branch_name handle InvalidGitRepositoryError."""
         mock_git = mocker.patch(f"{MODULE}.git")
+        mocker.patch(f"{MODULE}.InvalidGitRepositoryError", InvalidGitRepositoryError)
         mock_git.Repo.side_effect = InvalidGitRepositoryError
 
         obj = DeployEnvironment()
@@ -139,6 +140,18 @@ class TestDeployEnvironment:
         assert excinfo.value.code == 1
         assert "Unable to retrieve the current git branch name!" in caplog.messages
 
+    def test_buffer_parallel_output(self) -> None:
+        """Test buffer_parallel_output."""
+        obj = DeployEnvironment(environ={})
+        assert not obj.buffer_parallel_output
+
+        obj.buffer_parallel_output = True
+        assert obj.buffer_parallel_output
+        assert obj.vars["RUNWAY_BUFFER_PARALLEL_OUTPUT"] == "1"
+
+        obj.vars["RUNWAY_BUFFER_PARALLEL_OUTPUT"] = "false"
+        assert not obj.buffer_parallel_output
+
     def test_ci(self) -> None:
         """Test ci."""
         obj = DeployEnvironment(environ={})
@@ -198,6 +211,21 @@ class TestDeployEnvironment:
         assert obj.max_concurrent_cfngin_stacks == 5
         assert obj.vars["RUNWAY_MAX_CONCURRENT_CFNGIN_STACKS"] == "5"
 
+    def test_max_concurrent_deployments(self, mocker: MockerFixture) -> None:
+        """Test max_concurrent_deployments."""
+        mock_cpu_count = MagicMock(return_value=4)
+        mocker.patch(f"{MODULE}.os.cpu_count", mock_cpu_count)
+        obj = DeployEnvironment(environ={})
+
+        assert obj.max_concurrent_deployments == 4
+
+        mock_cpu_count.return_value = 62
+        assert obj.max_concurrent_deployments == 61
+
+        obj.max_concurrent_deployments = 12
+        assert obj.max_concurrent_deployments == 12
+        assert obj.vars["RUNWAY_MAX_CONCURRENT_DEPLOYMENTS"] == "12"
+
     def test_max_concurrent_modules(self, mocker: MockerFixture) -> None:
         """Test max_concurrent_modules."""
         mock_cpu_count = MagicMock(return_value=4)
@@ -470,9 +470,9 @@ class TestDeployment:
         runway_context: MockRunwayContext,
     ) -> None:
         """Test run_list."""
-        dep0 = MagicMock()
+        dep0 = MagicMock(depends_on=[])
         dep0.modules = ["module"]
-        dep1 = MagicMock()
+        dep1 = MagicMock(depends_on=[])
         dep1.modules = []
         deployments = [dep0, dep1]
 
@@ -490,3 +490,48 @@ class TestDeployment:
         dep0.resolve.assert_called_once_with(runway_context, variables=mock_vars, pre_process=True)
         dep1.resolve.assert_called_once_with(runway_context, variables=mock_vars, pre_process=True)
         mock_action.assert_called_once_with()
+
+    @pytest.mark.parametrize(
+        "action, use_concurrent, use_async",
+        [
+            ("deploy", True, True),
+            ("destroy", True, True),
+            ("plan", True, False),
+            ("deploy", False, False),
+        ],
+    )
+    def test_run_list_depends_on(
+        self,
+        action: RunwayActionTypeDef,
+        mocker: MockerFixture,
+        runway_context: MockRunwayContext,
+        use_async: bool,
+        use_concurrent: bool,
+    ) -> None:
+        """Test run_list with depends_on."""
+        runway_context.use_concurrent = use_concurrent
+        mock_scheduler = mocker.patch(f"{MODULE}.DeploymentScheduler")
+        mock_scheduler.has_dependencies.return_value = True
+        mock_run_definition = mocker.patch.object(Deployment, "run_definition")
+        deployments = [MagicMock(depends_on=[]), MagicMock(depends_on=["dep0"])]
+        mock_vars = MagicMock()
+
+        assert not Deployment.run_list(
+            action=action,
+            context=runway_context,
+            deployments=deployments,  # type: ignore
+            future=None,  # type: ignore
+            variables=mock_vars,
+        )
+        mock_scheduler.assert_called_once_with(deployments, reverse=action == "destroy")
+        mock_scheduler.return_value.run.assert_called_once_with(
+            ANY,
+            buffer_output=runway_context.env.buffer_parallel_output,
+            max_workers=runway_context.env.max_concurrent_deployments,
+            use_async=use_async,
+        )
+        func = mock_scheduler.return_value.run.call_args.args[0]
+        func(deployments[0])
+        mock_run_definition.assert_called_once_with(
+            action, runway_context, deployments[0], future=None, variables=mock_vars
+        )
@@ -0,0 +1,112 @@
+"""Test runway.core.components._scheduler."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, NamedTuple
+
+import pytest
+
+from runway.core.components._scheduler import DeploymentScheduler
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
+MODULE = "runway.core.components._scheduler"
+
+
+class FakeDeployment(NamedTuple):
+    """Picklable stand-in for a deployment definition."""
+
+    name: str
+    depends_on: list[str]
+    log: str = ""
+
+
+def _record(deployment: FakeDeployment) -> None:
+    """Record that a deployment was processed."""
+    with open(deployment.log, "a") as handle:  # noqa: PTH123
+        handle.write(f"{deployment.name}\n")
+
+
+def _fail(deployment: FakeDeployment) -> None:
+    """Raise an error for a deployment."""
+    raise ValueError(deployment.name)
+
+
+class TestDeploymentScheduler:
+    """Test DeploymentScheduler."""
+
+    def test_has_dependencies(self) -> None:
+        """Test has_dependencies."""
+        assert not DeploymentScheduler.has_dependencies(
+            [FakeDeployment("a", []), FakeDeployment("b", [])]  # type: ignore
+        )
+        assert DeploymentScheduler.has_dependencies(
+            [FakeDeployment("a", []), FakeDeployment("b", ["a"])]  # type: ignore
+        )
+
+    def test_ordered(self) -> None:
+        """Test ordered."""
+        deployments = [
+            FakeDeployment("app", ["network", "iam"]),
+            FakeDeployment("network", []),
+            FakeDeployment("iam", []),
+            FakeDeployment("other", ["not-selected"]),
+        ]
+        assert [i.name for i in DeploymentScheduler(deployments).ordered()] == [  # type: ignore
+            "network",
+            "iam",
+            "app",
+            "other",
+        ]
+        assert [
+            i.name
+            for i in DeploymentScheduler(deployments, reverse=True).ordered()  # type: ignore
+        ] == ["app", "network", "iam", "other"]
+
+    def test_ordered_circular(self) -> None:
+        """Test ordered circular."""
+        with pytest.raises(ValueError, match="circular dependencies: a, b"):
+            DeploymentScheduler(
+                [FakeDeployment("a", ["b"]), FakeDeployment("b", ["a"])]  # type: ignore
+            ).ordered()
+
+    def test_run(self, mocker: MockerFixture) -> None:
+        """Test run."""
+        mock_executor = mocker.patch(f"{MODULE}.concurrent.futures.ProcessPoolExecutor")
+        deployments = [FakeDeployment("b", ["a"]), FakeDeployment("a", [])]
+        processed: list[str] = []
+        DeploymentScheduler(deployments).run(  # type: ignore
+            lambda deployment: processed.append(deployment.name),  # type: ignore
+            max_workers=5,
+        )
+        assert processed == ["a", "b"]
+        mock_executor.assert_not_called()
+
+    def test_run_async(self, tmp_path: Path) -> None:
+        """Test run async."""
+        log = str(tmp_path / "log.txt")
+        deployments = [
+            FakeDeployment("app", ["network"], log),
+            FakeDeployment("network", [], log),
+            FakeDeployment("other", [], log),
+        ]
+        DeploymentScheduler(deployments).run(  # type: ignore
+            _record,  # type: ignore
+            max_workers=2,
+            use_async=True,
+        )
+        result = (tmp_path / "log.txt").read_text().splitlines()
+        assert sorted(result) == ["app", "network", "other"]
+        assert result.index("network") < result.index("app")
+
+    def test_run_async_raise(self) -> None:
+        """Test run async raises exceptions from workers."""
+        with pytest.raises(ValueError, match="a"):
+            DeploymentScheduler([FakeDeployment("a", [])]).run(  # type: ignore
+                _fail,  # type: ignore
+                max_workers=2,
+                use_async=True,
+            )
@@ -0,0 +1,121 @@
+"""Test runway.core.components._worker_output."""
+
+from __future__ import annotations
+
+import concurrent.futures
+import logging
+import multiprocessing
+import os
+import subprocess
+import sys
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock
+
+import pytest
+
+from runway.core.components._worker_output import WorkerOutputMultiplexer, capture_output
+from runway.utils import run_worker
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
+MODULE = "runway.core.components._worker_output"
+
+
+def _noisy(name: str, fail: bool = False) -> str:
+    """Write to stdout, stderr, and a subprocess."""
+    os.write(1, f"stdout {name}\n".encode())
+    os.write(2, f"stderr {name}\n".encode())
+    subprocess.run([sys.executable, "-c", f"print('subprocess {name}')"], check=True)
+    if fail:
+        raise ValueError(name)
+    return name
+
+
+def test_capture_output(capfd: pytest.CaptureFixture[str], tmp_path: Path) -> None:
+    """Test capture_output."""
+    path = tmp_path / "output.log"
+    assert capture_output(path, _noisy, "test") == "test"
+    assert path.read_text().splitlines() == ["stdout test", "stderr test", "subprocess test"]
+    os.write(1, b"after\n")
+    assert capfd.readouterr().out == "after\n"
+
+
+def test_capture_output_raise(tmp_path: Path) -> None:
+    """Test capture_output restores file descriptors when an error is raised."""
+    path = tmp_path / "output.log"
+    stdout_stat = os.fstat(1)
+    with pytest.raises(ValueError, match="test"):
+        capture_output(path, _noisy, "test", fail=True)
+    assert (os.fstat(1).st_dev, os.fstat(1).st_ino) == (stdout_stat.st_dev, stdout_stat.st_ino)
+
+
+class TestWorkerOutputMultiplexer:
+    """Test WorkerOutputMultiplexer."""
+
+    def test_description(self) -> None:
+        """Test description."""
+        assert WorkerOutputMultiplexer().description == "(output will be interwoven)"
+        assert (
+            WorkerOutputMultiplexer(buffered=True, unit="region").description
+            == "(output will be grouped by region)"
+        )
+
+    def test_log_progress(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Test log_progress."""
+        caplog.set_level(logging.INFO, logger="runway")
+        executor = MagicMock()
+        executor.submit.return_value = concurrent.futures.Future()
+        with WorkerOutputMultiplexer(buffered=True, unit="region") as output:
+            output.submit(executor, "us-east-1", _noisy, "us-east-1")
+            output.log_progress()
+        assert "0 of 1 region(s) complete; in progress: us-east-1" in caplog.messages
+
+    def test_submit(self, capfd: pytest.CaptureFixture[str]) -> None:
+        """Test submit buffered."""
+        with (
+            WorkerOutputMultiplexer(buffered=True, unit="region") as output,
+            concurrent.futures.ProcessPoolExecutor(
+                max_workers=2, mp_context=multiprocessing.get_context("fork")
+            ) as executor,
+        ):
+            futures = [
+                output.submit(executor, "us-east-1", _noisy, "us-east-1"),
+                output.submit(executor, "us-west-2", _noisy, "us-west-2", fail=True),
+            ]
+            concurrent.futures.wait(futures)
+            output_dir = output._output_dir
+        assert futures[0].result() == "us-east-1"
+        with pytest.raises(ValueError, match="us-west-2"):
+            futures[1].result()
+        assert output_dir
+        assert not output_dir.exists()
+        lines = capfd.readouterr().err.splitlines()
+        for region in ["us-east-1", "us-west-2"]:
+            start = lines.index(f"stdout {region}")
+            assert lines[start : start + 3] == [
+                f"stdout {region}",
+                f"stderr {region}",
+                f"subprocess {region}",
+            ]
+
+    def test_submit_not_buffered(self) -> None:
+        """Test submit not buffered."""
+        executor = MagicMock()
+        with WorkerOutputMultiplexer() as output:
+            assert (
+                output.submit(executor, "name", _noisy, "name", fail=True)
+                == executor.submit.return_value
+            )
+        executor.submit.assert_called_once_with(_noisy, "name", fail=True)
+        assert not output._output_dir
+
+    def test_submit_api_stats(self, mocker: MockerFixture, tmp_path: Path) -> None:
+        """Test submit wraps jobs to spool API call statistics when collecting them."""
+        mocker.patch(f"{MODULE}.API_STATS", spool_dir=tmp_path)
+        executor = MagicMock()
+        with WorkerOutputMultiplexer() as output:
+            output.submit(executor, "name", _noisy, "name", fail=True)
+        executor.submit.assert_called_once_with(run_worker, _noisy, "name", fail=True)
@@ -2,17 +2,22 @@
 
 from __future__ import annotations
 
+import hashlib
 import os
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, cast
 from unittest.mock import Mock, call
 
 import pytest
 
 from runway.core.providers.aws.s3._helpers.action_architecture import ActionArchitecture
+from runway.core.providers.aws.s3._helpers.file_generator import FileStats
+from runway.core.providers.aws.s3._helpers.file_info import FileInfo
 from runway.core.providers.aws.s3._helpers.parameters import ParametersDataModel
 from runway.core.providers.aws.s3._helpers.transfer_config import RuntimeConfig
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from pytest_mock import MockerFixture
 
     from runway.core.providers.aws.s3._helpers.transfer_config import TransferConfigDict
@@ -205,3 +210,103 @@ class TestActionArchitecture:
         self.parameters.paths_type = "locals3"
         with pytest.raises(NotImplementedError):
             self.action.run()
+
+    def test_record_changed_keys(self, tmp_path: Path) -> None:
+        """Test _record_changed_keys."""
+        unchanged = tmp_path / "unchanged.txt"
+        unchanged.write_text("unchanged")
+        changed = tmp_path / "changed.txt"
+        changed.write_text("changed")
+        multipart = tmp_path / "multipart.txt"
+        multipart.write_text("multipart")
+        new = tmp_path / "new.txt"
+        new.write_text("new")
+        unchanged_etag = f'"{hashlib.md5(b"unchanged").hexdigest()}"'  # noqa: S324
+        dest_files = [
+            FileStats(
+                src=f"bucket/prefix/{name}",
+                compare_key=name,
+                operation_name="delete" if name == "deleted.txt" else "",
+                response_data=cast("Any", {"ETag": etag}),
+                src_type="s3",
+            )
+            for name, etag in [
+                ("changed.txt", f'"{hashlib.md5(b"old").hexdigest()}"'),  # noqa: S324
+                ("deleted.txt", '"etag"'),
+                ("multipart.txt", f'"{hashlib.md5(b"multipart").hexdigest()}-2"'),  # noqa: S324
+                ("unchanged.txt", unchanged_etag),
+            ]
+        ]
+        assert list(self.action._record_dest_etags(dest_files)) == dest_files
+        file_infos = [
+            FileInfo(
+                src=path,
+                compare_key=path.name,
+                dest=f"bucket/prefix/{path.name}",
+                dest_type="s3",
+                operation_name="upload",
+                src_type="local",
+            )
+            for path in [changed, multipart, new, unchanged]
+        ]
+        file_infos.append(
+            FileInfo(
+                src="bucket/prefix/deleted.txt",
+                compare_key="deleted.txt",
+                dest=str(tmp_path / "deleted.txt"),
+                dest_type="local",
+                operation_name="delete",
+                src_type="s3",
+            )
+        )
+        file_infos.append(
+            FileInfo(
+                src="bucket/prefix/download.txt",
+                compare_key="download.txt",
+                dest=str(tmp_path / "download.txt"),
+                dest_type="local",
+                operation_name="download",
+                src_type="s3",
+            )
+        )
+        assert list(self.action._record_changed_keys(file_infos)) == file_infos
+        assert self.action.changed_keys == [
+            "prefix/changed.txt",
+            "prefix/multipart.txt",
+            "prefix/new.txt",
+            "prefix/deleted.txt",
+        ]
+
+    def test_run_record_changes(self, mocker: MockerFixture) -> None:
+        """Test run recording changes."""
+        mocker.patch.object(
+            ActionArchitecture,
+            "choose_sync_strategies",
+            return_value={"sync_strategy": "test"},
+        )
+        mocker.patch(f"{MODULE}.FormatPath")
+        mocker.patch(f"{MODULE}.FileGenerator", return_value=Mock(call=Mock(return_value=[])))
+        mocker.patch(
+            f"{MODULE}.FileInfoBuilder", return_value=Mock(call=Mock(return_value="file_infos"))
+        )
+        mock_comparator = mocker.patch(f"{MODULE}.Comparator").return_value
+        mock_s3_transfer_handler = Mock(
+            call=Mock(return_value=Mock(num_tasks_failed=0, num_tasks_warned=0))
+        )
+        mocker.patch(
+            f"{MODULE}.S3TransferHandlerFactory",
+            return_value=Mock(return_value=mock_s3_transfer_handler),
+        )
+        record_dest_etags = mocker.patch.object(
+            ActionArchitecture, "_record_dest_etags", return_value="dest_etags"
+        )
+        record_changed_keys = mocker.patch.object(
+            ActionArchitecture, "_record_changed_keys", return_value="changed_keys"
+        )
+        self.parameters.paths_type = "locals3"
+        self.action.record_changes = True
+        assert self.action.run() == 0
+        record_dest_etags.assert_called_once_with([])
+        mock_comparator.call.assert_called_once_with([], "dest_etags")
+        record_changed_keys.assert_called_once_with("file_infos")
+        mock_s3_transfer_handler.call.assert_called_once_with("changed_keys")
@@ -318,8 +318,9 @@ class TestBucket:
         runway_context.add_stubber("s3")
         src_directory = "/test/"
         obj = Bucket(runway_context, "test-bucket")
-        assert not obj.sync_from_local(
-            src_directory, delete=True, exclude=["something"], prefix="prefix"
+        assert (
+            obj.sync_from_local(src_directory, delete=True, exclude=["something"], prefix="prefix")
+            == mock_handler.run.return_value
         )
         mock_handler_class.assert_called_once_with(
             context=runway_context,
@@ -31,7 +31,7 @@ class TestS3SyncHandler:
         mock_action = mocker.patch(f"{MODULE}.ActionArchitecture")
         transfer_config = mocker.patch.object(S3SyncHandler, "transfer_config", {"key": "val"})
         obj = S3SyncHandler(runway_context, dest="", src="")
-        assert not obj.run()
+        assert obj.run() == mock_action.return_value.changed_keys
         mock_register_sync_strategies.assert_called_once_with(obj._botocore_session)
         mock_action.assert_called_once_with(
             session=obj._session,
@@ -39,6 +39,7 @@ class TestS3SyncHandler:
             action="sync",
             parameters=obj.parameters.data,
             runtime_config=transfer_config,
+            record_changes=True,
         )
         mock_action().run.assert_called_once_with()
 
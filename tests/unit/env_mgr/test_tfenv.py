@@ -3,26 +3,35 @@
 # pyright: reportFunctionMemberAccess=none
 from __future__ import annotations
 
+import hashlib
 import json
+import os
 import re
 import subprocess
+import time
+import zipfile
 from typing import TYPE_CHECKING, Any
 from unittest.mock import MagicMock, call
 
 import hcl
 import hcl2
 import pytest
+import requests
 
 from runway._logging import LogLevels
 from runway.env_mgr.tfenv import (
     TF_VERSION_FILENAME,
     TFEnvManager,
+    download_tf_release,
+    fetch_tf_release,
     get_available_tf_versions,
     get_latest_tf_version,
+    get_tf_platform,
+    get_tf_release_versions,
     load_terraform_module,
 )
 from runway.exceptions import HclParserError
-from runway.utils import Version
+from runway.utils import Version, file_lock
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -60,11 +69,134 @@ terraform {
 """
 
 
+@pytest.fixture(autouse=True)
+def cache_dir(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    """Isolate the Runway cache directory."""
+    path = tmp_path / "cache"
+    monkeypatch.setenv("RUNWAY_CACHE_DIR", str(path))
+    return path / "tfenv"
+
+
+def create_release(path: Path, version: str, tf_platform: str, *, size: int = 0) -> None:
+    """Create the files of a Terraform release."""
+    path.mkdir(parents=True, exist_ok=True)
+    archive = path / f"terraform_{version}_{tf_platform}.zip"
+    with zipfile.ZipFile(archive, "w") as zip_file:
+        zip_file.writestr("terraform", "#!/bin/sh\n")
+        if size:
+            zip_file.writestr("LICENSE.txt", os.urandom(size))
+    (path / f"terraform_{version}_SHA256SUMS").write_text(
+        f"{hashlib.sha256(archive.read_bytes()).hexdigest()}  {archive.name}\n"
+    )
+
+
+def test_download_tf_release(cache_dir: Path, tmp_path: Path) -> None:
+    """Test download_tf_release."""
+    create_release(cache_dir / "archives" / "1.0.0", "1.0.0", "linux_amd64")
+    download_tf_release("1.0.0", tmp_path / "versions", "", "linux", "amd64")
+    assert (tmp_path / "versions" / "1.0.0" / "terraform").stat().st_mode & 0o0111
+
+
+def test_fetch_tf_release(cache_dir: Path, mocker: MockerFixture, tmp_path: Path) -> None:
+    """Test fetch_tf_release."""
+    create_release(tmp_path / "remote", "1.0.0", "linux_arm64")
+
+    def _urlretrieve(url: str, filename: Path) -> None:
+        # downloaded to the same filesystem as the archive store
+        assert filename.parent.parent == cache_dir / "archives"
+        filename.write_bytes((tmp_path / "remote" / url.rsplit("/", 1)[-1]).read_bytes())
+
+    mock_file_lock = mocker.patch(f"{MODULE}.file_lock", wraps=file_lock)
+    mock_urlretrieve = mocker.patch(f"{MODULE}.urlretrieve", side_effect=_urlretrieve)
+    expected = cache_dir / "archives" / "1.0.0" / "terraform_1.0.0_linux_arm64.zip"
+    assert fetch_tf_release("1.0.0", "linux", "arm64") == expected
+    mock_file_lock.assert_called_once_with(cache_dir / "archives" / "1.0.0.lock")
+    assert mock_urlretrieve.call_count == 2
+    assert expected.is_file()
+    assert sorted(i.name for i in (cache_dir / "archives").iterdir()) == ["1.0.0", "1.0.0.lock"]
+    assert fetch_tf_release("1.0.0", "linux", "arm64") == expected
+    assert mock_urlretrieve.call_count == 2
+
+
+def test_download_tf_release_cache_disabled(
+    cache_dir: Path, mocker: MockerFixture, tmp_path: Path
+) -> None:
+    """Test download_tf_release doesn't add the archive to the archive store."""
+    create_release(tmp_path / "remote", "1.0.0", "linux_amd64")
+    mock_urlretrieve = mocker.patch(
+        f"{MODULE}.urlretrieve",
+        side_effect=lambda url, filename: filename.write_bytes(
+            (tmp_path / "remote" / url.rsplit("/", 1)[-1]).read_bytes()
+        ),
+    )
+    download_tf_release("1.0.0", tmp_path / "versions", "", "linux", "amd64")
+    assert (tmp_path / "versions" / "1.0.0" / "terraform").is_file()
+    assert mock_urlretrieve.call_count == 2
+    assert not (cache_dir / "archives").exists()
+
+
+def test_download_tf_release_cache_enabled(
+    mocker: MockerFixture, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test download_tf_release adds the archive to the archive store."""
+    monkeypatch.setenv("RUNWAY_TFENV_CACHE", "true")
+    mock_fetch_tf_release = mocker.patch(f"{MODULE}.fetch_tf_release")
+    create_release(tmp_path / "remote", "1.0.0", "linux_amd64")
+    mock_fetch_tf_release.return_value = tmp_path / "remote" / "terraform_1.0.0_linux_amd64.zip"
+    download_tf_release("1.0.0", tmp_path / "versions", "", "linux", "amd64")
+    mock_fetch_tf_release.assert_called_once_with("1.0.0", "linux", "amd64", archive_root=None)
+
+
+def test_fetch_tf_release_large_archive(cache_dir: Path, mocker: MockerFixture) -> None:
+    """Test fetch_tf_release verifies an archive larger than one read."""
+    mock_urlretrieve = mocker.patch(f"{MODULE}.urlretrieve")
+    archive_dir = cache_dir / "archives" / "1.0.0"
+    create_release(archive_dir, "1.0.0", "linux_amd64", size=5 * 1024 * 1024)
+    archive = archive_dir / "terraform_1.0.0_linux_amd64.zip"
+    assert archive.stat().st_size > 1024 * 1024
+    assert fetch_tf_release("1.0.0", "linux", "amd64") == archive
+    mock_urlretrieve.assert_not_called()
+
+
+def test_fetch_tf_release_checksum_mismatch(cache_dir: Path, mocker: MockerFixture) -> None:
+    """Test fetch_tf_release checksum mismatch."""
+    mock_urlretrieve = mocker.patch(f"{MODULE}.urlretrieve")
+    archive_dir = cache_dir / "archives" / "1.0.0"
+    create_release(archive_dir, "1.0.0", "linux_amd64")
+    (archive_dir / "terraform_1.0.0_linux_amd64.zip").write_text("tampered")
+    with pytest.raises(SystemExit):
+        fetch_tf_release("1.0.0", "linux", "amd64")
+    mock_urlretrieve.assert_not_called()
+    assert not (archive_dir / "terraform_1.0.0_linux_amd64.zip").exists()
+
+
+@pytest.mark.parametrize(
+    "system, tf_platform, arch, expected",
+    [
+        ("Darwin", None, "arm64", "darwin_arm64"),
+        ("Linux", None, None, "linux_amd64"),
+        ("Linux", "freebsd", "386", "freebsd_386"),
+        ("MINGW64_NT-10.0", None, None, "windows_amd64"),
+        ("Windows", None, None, "windows_amd64"),
+    ],
+)
+def test_get_tf_platform(
+    arch: str | None,
+    expected: str,
+    mocker: MockerFixture,
+    monkeypatch: pytest.MonkeyPatch,
+    system: str,
+    tf_platform: str | None,
+) -> None:
+    """Test get_tf_platform."""
+    mocker.patch("platform.system", return_value=system)
+    monkeypatch.delenv("TFENV_ARCH", raising=False)
+    assert get_tf_platform(tf_platform, arch) == expected
+
+
 def test_get_available_tf_versions(mocker: MockerFixture) -> None:
     """Test runway.env_mgr.tfenv.get_available_tf_versions."""
-    mock_requests = mocker.patch(f"{MODULE}.requests")
-    response: dict[str, Any] = {"terraform": {"versions": {"0.12.0": {}, "0.12.0-beta": {}}}}
-    mock_requests.get.return_value = MagicMock(text=json.dumps(response))
+    mocker.patch(f"{MODULE}.get_tf_release_versions", return_value=["0.12.0", "0.12.0-beta"])
     assert get_available_tf_versions() == ["0.12.0"]
     assert get_available_tf_versions(include_prerelease=True) == [
         "0.12.0",
@@ -72,6 +204,73 @@ def test_get_available_tf_versions(mocker: MockerFixture) -> None:
     ]
 
 
+def test_get_tf_release_versions(
+    cache_dir: Path, mocker: MockerFixture, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test get_tf_release_versions."""
+    monkeypatch.setenv("RUNWAY_TFENV_CACHE", "true")
+    mock_get = mocker.patch(f"{MODULE}.requests.get")
+    response: dict[str, Any] = {
+        "terraform": {"versions": {"0.12.0": {}, "0.12.0-beta": {}, "0.13.0": {}, "invalid": {}}}
+    }
+    mock_get.return_value = MagicMock(text=json.dumps(response))
+    assert get_tf_release_versions() == ["0.13.0", "0.12.0", "0.12.0-beta"]
+    assert get_tf_release_versions() == ["0.13.0", "0.12.0", "0.12.0-beta"]
+    mock_get.assert_called_once()
+    assert json.loads((cache_dir / "index.json").read_text())["versions"] == [
+        "0.13.0",
+        "0.12.0",
+        "0.12.0-beta",
+    ]
+    response["terraform"]["versions"]["0.14.0"] = {}
+    mock_get.return_value = MagicMock(text=json.dumps(response))
+    assert get_tf_release_versions(refresh=True)[0] == "0.14.0"
+    assert mock_get.call_count == 2
+
+
+def test_get_tf_release_versions_cache_disabled(cache_dir: Path, mocker: MockerFixture) -> None:
+    """Test get_tf_release_versions only caches the index when enabled."""
+    mock_get = mocker.patch(f"{MODULE}.requests.get")
+    mock_get.return_value = MagicMock(text=json.dumps({"terraform": {"versions": {"0.13.0": {}}}}))
+    assert get_tf_release_versions() == ["0.13.0"]
+    assert not (cache_dir / "index.json").exists()
+    assert get_tf_release_versions(store=True) == ["0.13.0"]
+    assert mock_get.call_count == 2
+    assert get_tf_release_versions() == ["0.13.0"]
+    assert mock_get.call_count == 2
+
+
+def test_get_tf_release_versions_expired(
+    cache_dir: Path, mocker: MockerFixture, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test get_tf_release_versions cached copy expired."""
+    cache_dir.mkdir(parents=True)
+    (cache_dir / "index.json").write_text(
+        json.dumps({"fetched_at": time.time() - 60, "versions": ["0.12.0"]})
+    )
+    mock_get = mocker.patch(f"{MODULE}.requests.get")
+    mock_get.return_value = MagicMock(text=json.dumps({"terraform": {"versions": {"0.13.0": {}}}}))
+    assert get_tf_release_versions() == ["0.12.0"]
+    monkeypatch.setenv("RUNWAY_TFENV_INDEX_TTL", "30")
+    assert get_tf_release_versions() == ["0.13.0"]
+    mock_get.assert_called_once()
+
+
+def test_get_tf_release_versions_offline(
+    caplog: pytest.LogCaptureFixture, cache_dir: Path, mocker: MockerFixture
+) -> None:
+    """Test get_tf_release_versions unable to fetch the index."""
+    mocker.patch(
+        f"{MODULE}.requests.get", side_effect=requests.ConnectionError("network unreachable")
+    )
+    with pytest.raises(requests.ConnectionError):
+        get_tf_release_versions()
+    cache_dir.mkdir(parents=True)
+    (cache_dir / "index.json").write_text(json.dumps({"fetched_at": 0, "versions": ["0.12.0"]}))
+    assert get_tf_release_versions() == ["0.12.0"]
+    assert "using cached copy: network unreachable" in "\n".join(caplog.messages)
+
+
 def test_get_latest_tf_version(mocker: MockerFixture) -> None:
     """Test runway.env_mgr.tfenv.get_latest_tf_version."""
     mock_get_available_tf_versions = mocker.patch(
@@ -100,6 +299,44 @@ def test_load_terraform_module(
     assert load_terraform_module(parser, tmp_path) == expected
 
 
+@pytest.mark.parametrize("parser", [hcl, hcl2])
+def test_load_terraform_module_block(
+    cache_dir: Path, mocker: MockerFixture, parser: ModuleType, tmp_path: Path
+) -> None:
+    """Test load_terraform_module with block."""
+    module_dir = tmp_path / "module"
+    module_dir.mkdir()
+    (module_dir / "backend.tf").write_text(HCL_BACKEND_S3)
+    (module_dir / "main.tf").write_text('resource "null_resource" "this" {}')
+    (module_dir / "variables.tf").write_text('# terraform {}\nvariable "terraform" {}')
+    expected = {"terraform": parser.loads(HCL_BACKEND_S3)["terraform"]}
+    spy_loads = mocker.spy(parser, "loads")
+    assert load_terraform_module(parser, module_dir, block="terraform") == expected
+    spy_loads.assert_called_once_with(HCL_BACKEND_S3)
+    assert len(list((cache_dir / "blocks").iterdir())) == 1
+
+    assert load_terraform_module(parser, module_dir, block="terraform") == expected
+    spy_loads.assert_called_once_with(HCL_BACKEND_S3)
+
+    (module_dir / "backend.tf").write_text(HCL_ATTR_LIST)
+    assert load_terraform_module(parser, module_dir, block="terraform") == {
+        "terraform": parser.loads(HCL_ATTR_LIST)["terraform"]
+    }
+    assert len(list((cache_dir / "blocks").iterdir())) == 2
+
+
+def test_load_terraform_module_block_cache_error(
+    cache_dir: Path, mocker: MockerFixture, tmp_path: Path
+) -> None:
+    """Test load_terraform_module with block unable to write the cache."""
+    mocker.patch(f"{MODULE}.write_file_atomic", side_effect=OSError)
+    (tmp_path / "backend.tf").write_text(HCL_BACKEND_S3)
+    assert load_terraform_module(hcl2, tmp_path, block="terraform") == {
+        "terraform": hcl2.loads(HCL_BACKEND_S3)["terraform"]
+    }
+    assert not (cache_dir / "blocks").exists()
+
+
 def test_load_terraform_module_raise_hcl_parser_error(tmp_path: Path) -> None:
     """Test load_terraform_module raise HclParserError."""
     tf_file = tmp_path / "module.tf"
@@ -401,10 +638,13 @@ class TestTFEnvManager:
         if not isinstance(response[0], dict):
             assert "failed to parse as HCL2; trying HCL" in "\n".join(caplog.messages)
             mock_load_terraform_module.assert_has_calls(
-                [call(hcl2, tmp_path), call(hcl, tmp_path)]  # type: ignore
+                [
+                    call(hcl2, tmp_path, block="terraform"),  # type: ignore
+                    call(hcl, tmp_path, block="terraform"),  # type: ignore
+                ]
             )
         else:
-            mock_load_terraform_module.assert_called_once_with(hcl2, tmp_path)
+            mock_load_terraform_module.assert_called_once_with(hcl2, tmp_path, block="terraform")
 
     def test_version(self, mocker: MockerFixture, tmp_path: Path) -> None:
         """Test version."""
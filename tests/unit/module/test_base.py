@@ -10,6 +10,7 @@ import pytest
 
 from runway.exceptions import NpmNotFound
 from runway.module.base import NPM_BIN, ModuleOptions, RunwayModule, RunwayModuleNpm
+from runway.module.utils import NodeModulesCache
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
@@ -145,6 +146,49 @@ class TestRunwayModuleNpm:
         assert "running npm ci..." in caplog.messages
         assert fake_process.call_count(cmd) == 1
 
+    @pytest.mark.parametrize("restored", [False, True])
+    def test_npm_install_ci_cache(
+        self,
+        fake_process: FakeProcess,
+        mocker: MockerFixture,
+        restored: bool,
+        runway_context: MockRunwayContext,
+        tmp_path: Path,
+    ) -> None:
+        """Test npm_install ci with RUNWAY_NPM_CACHE."""
+        mocker.patch(f"{MODULE}.use_npm_ci", return_value=True)
+        mocker.patch.object(RunwayModuleNpm, "check_for_npm")
+        mocker.patch.object(RunwayModuleNpm, "warn_on_boto_env_vars")
+        mock_restore = mocker.patch.object(NodeModulesCache, "restore", return_value=restored)
+        mock_save = mocker.patch.object(NodeModulesCache, "save")
+        runway_context.env.ci = True
+        runway_context.env.vars["RUNWAY_CACHE_DIR"] = str(tmp_path / "cache")
+        runway_context.env.vars["RUNWAY_COLORIZE"] = "true"
+        runway_context.env.vars["RUNWAY_NPM_CACHE"] = "true"
+        (tmp_path / "package.json").write_text(
+            '{"scripts": {"build": "tsc", "postinstall": "patch-package", "prepare": "husky"}}'
+        )
+        fake_process.register_subprocess([NPM_BIN, "ci"], returncode=0)
+        fake_process.register_subprocess([NPM_BIN, "run", "postinstall"], returncode=0)
+        fake_process.register_subprocess([NPM_BIN, "run", "prepare"], returncode=0)
+        obj = RunwayModuleNpm(runway_context, module_root=tmp_path)
+        assert obj.node_modules_cache
+        assert obj.node_modules_cache.cache_dir == tmp_path / "cache" / "node_modules"
+        assert obj.node_modules_cache.environ is runway_context.env.vars
+        obj.npm_install()
+        mock_restore.assert_called_once_with()
+        if restored:
+            assert fake_process.call_count([NPM_BIN, "ci"]) == 0
+            assert list(fake_process.calls) == [
+                [NPM_BIN, "run", "postinstall"],
+                [NPM_BIN, "run", "prepare"],
+            ]
+            mock_save.assert_not_called()
+        else:
+            assert fake_process.call_count([NPM_BIN, "ci"]) == 1
+            assert fake_process.call_count([NPM_BIN, "run", fake_process.any(min=1)]) == 0
+            mock_save.assert_called_once_with()
+
     @pytest.mark.parametrize(
         "colorize, is_noninteractive, use_ci",
         [
@@ -193,9 +237,9 @@ class TestRunwayModuleNpm:
         caplog.set_level(logging.INFO, logger=MODULE)
         mocker.patch.object(RunwayModuleNpm, "check_for_npm")
         mocker.patch.object(RunwayModuleNpm, "warn_on_boto_env_vars")
-        RunwayModuleNpm(
-            runway_context, module_root=tmp_path, options={"skip_npm_ci": True}
-        ).npm_install()
+        obj = RunwayModuleNpm(runway_context, module_root=tmp_path, options={"skip_npm_ci": True})
+        assert not obj.node_modules_cache
+        obj.npm_install()
         assert "skipped npm ci/npm install" in caplog.messages
 
     def test_package_json_missing(
@@ -5,7 +5,7 @@ from __future__ import annotations
 import logging
 from subprocess import CalledProcessError
 from typing import TYPE_CHECKING, Any
-from unittest.mock import Mock, call
+from unittest.mock import Mock
 
 import pytest
 
@@ -180,6 +180,63 @@ class TestCloudDevelopmentKit:
             CloudDevelopmentKit(runway_context, module_root=tmp_path).cdk_diff()
         assert excinfo.value.args == (return_code,)
 
+    def test_cdk_diff_stacks(
+        self,
+        caplog: pytest.LogCaptureFixture,
+        capsys: pytest.CaptureFixture[str],
+        fake_process: FakeProcess,
+        runway_context: RunwayContext,
+        tmp_path: Path,
+    ) -> None:
+        """Test cdk_diff_stacks."""
+        caplog.set_level(logging.INFO, logger=MODULE)
+        obj = CloudDevelopmentKit(runway_context, module_root=tmp_path)
+        app = tmp_path / "cdk.out"
+        for stack_name in ["Stack0", "Stack1"]:
+            fake_process.register_subprocess(
+                obj.gen_cmd("diff", args_list=["--app", str(app), stack_name]),
+                returncode=0,
+                stdout=[f"{stack_name} diff"],
+            )
+        assert not obj.cdk_diff_stacks(["Stack0", "Stack1"], app=app)
+        for stack_name in ["Stack0", "Stack1"]:
+            assert (
+                fake_process.call_count(
+                    obj.gen_cmd("diff", args_list=["--app", str(app), stack_name])
+                )
+                == 1
+            )
+        assert capsys.readouterr().err == "Stack0 diff\nStack1 diff\n"
+        logs = "\n".join(caplog.messages)
+        assert "plan (in progress)" in logs
+        assert "stack Stack0:" in logs
+        assert "plan (complete)" in logs
+
+    def test_cdk_diff_stacks_sys_exit(
+        self,
+        caplog: pytest.LogCaptureFixture,
+        fake_process: FakeProcess,
+        runway_context: RunwayContext,
+        tmp_path: Path,
+    ) -> None:
+        """Test cdk_diff_stacks calls sys.exit() after all stacks are diffed."""
+        caplog.set_level(logging.ERROR, logger=MODULE)
+        obj = CloudDevelopmentKit(runway_context, module_root=tmp_path)
+        app = tmp_path / "cdk.out"
+        for index, stack_name in enumerate(["Stack0", "Stack1", "Stack2"]):
+            fake_process.register_subprocess(
+                obj.gen_cmd("diff", args_list=["--app", str(app), stack_name]),
+                returncode=index,
+            )
+        with pytest.raises(SystemExit) as excinfo:
+            obj.cdk_diff_stacks(["Stack0", "Stack1", "Stack2"], app=app)
+        assert excinfo.value.args == (1,)
+        assert fake_process.call_count(obj.gen_cmd("diff", args_list=["--app", str(app), "Stack2"]))
+        logs = "\n".join(caplog.messages)
+        assert "CDK returned 1 when running diff for stack Stack1" in logs
+        assert "CDK returned 2 when running diff for stack Stack2" in logs
+        assert "Stack0" not in logs
+
     def test_cdk_list(
         self,
         fake_process: FakeProcess,
@@ -197,6 +254,22 @@ class TestCloudDevelopmentKit:
         mock_gen_cmd.assert_called_once_with("list", include_context=True)
         assert fake_process.call_count(mock_gen_cmd.return_value) == 1
 
+    def test_cdk_list_app(
+        self,
+        fake_process: FakeProcess,
+        mocker: MockerFixture,
+        runway_context: RunwayContext,
+        tmp_path: Path,
+    ) -> None:
+        """Test cdk_list with app."""
+        mock_gen_cmd = mocker.patch.object(CloudDevelopmentKit, "gen_cmd", return_value=["list"])
+        fake_process.register_subprocess(
+            mock_gen_cmd.return_value, returncode=0, stdout="Stack0\nStack1"
+        )
+        obj = CloudDevelopmentKit(runway_context, module_root=tmp_path)
+        assert obj.cdk_list(app=tmp_path) == ["Stack0", "Stack1"]
+        mock_gen_cmd.assert_called_once_with("list", args_list=["--app", str(tmp_path)])
+
     def test_cdk_list_empty(
         self,
         fake_process: FakeProcess,
@@ -228,6 +301,33 @@ class TestCloudDevelopmentKit:
             CloudDevelopmentKit(runway_context, module_root=tmp_path).cdk_list()
         assert fake_process.call_count(mock_gen_cmd.return_value) == 1
 
+    def test_cdk_synth(
+        self,
+        caplog: pytest.LogCaptureFixture,
+        mocker: MockerFixture,
+        runway_context: RunwayContext,
+        tmp_path: Path,
+    ) -> None:
+        """Test cdk_synth."""
+        caplog.set_level(logging.INFO, logger=MODULE)
+        mock_gen_cmd = mocker.patch.object(CloudDevelopmentKit, "gen_cmd", return_value=["synth"])
+        mock_run_module_command = mocker.patch(f"{MODULE}.run_module_command")
+        obj = CloudDevelopmentKit(runway_context, module_root=tmp_path)
+        assert not obj.cdk_synth(tmp_path / "cdk.out")
+        mock_gen_cmd.assert_called_once_with(
+            "synthesize",
+            ["--output", str(tmp_path / "cdk.out"), "--quiet"],
+            include_context=True,
+        )
+        mock_run_module_command.assert_called_once_with(
+            cmd_list=mock_gen_cmd.return_value,
+            env_vars=runway_context.env.vars,
+            logger=obj.logger,
+        )
+        logs = "\n".join(caplog.messages)
+        assert "synth (in progress)" in logs
+        assert "synth (complete)" in logs
+
     @pytest.mark.parametrize(
         "debug, no_color, verbose, expected",
         [
@@ -444,25 +544,46 @@ class TestCloudDevelopmentKit:
         """Test plan."""
         mocker.patch.object(CloudDevelopmentKit, "skip", skip)
         cdk_bootstrap = mocker.patch.object(CloudDevelopmentKit, "cdk_bootstrap")
+        cdk_diff_stacks = mocker.patch.object(CloudDevelopmentKit, "cdk_diff_stacks")
         cdk_list = mocker.patch.object(
             CloudDevelopmentKit, "cdk_list", return_value=["Stack0", "Stack1"]
         )
-        cdk_diff = mocker.patch.object(CloudDevelopmentKit, "cdk_diff")
+        cdk_synth = mocker.patch.object(CloudDevelopmentKit, "cdk_synth")
         npm_install = mocker.patch.object(CloudDevelopmentKit, "npm_install")
         run_build_steps = mocker.patch.object(CloudDevelopmentKit, "run_build_steps")
         assert not CloudDevelopmentKit(runway_context, module_root=tmp_path).plan()
         cdk_bootstrap.assert_not_called()
         if skip:
+            cdk_diff_stacks.assert_not_called()
             cdk_list.assert_not_called()
-            cdk_diff.assert_not_called()
+            cdk_synth.assert_not_called()
             npm_install.assert_not_called()
             run_build_steps.assert_not_called()
         else:
-            cdk_list.assert_called_once_with()
-            cdk_diff.assert_has_calls([call("Stack0"), call("Stack1")])
+            app = cdk_synth.call_args.args[0]
+            assert app.name == "cdk.out"
+            assert not app.parent.exists()
+            cdk_list.assert_called_once_with(app=app)
+            cdk_diff_stacks.assert_called_once_with(["Stack0", "Stack1"], app=app)
             npm_install.assert_called_once_with()
             run_build_steps.assert_called_once_with()
 
+    def test_plan_no_stacks(
+        self,
+        mocker: MockerFixture,
+        runway_context: RunwayContext,
+        tmp_path: Path,
+    ) -> None:
+        """Test plan no stacks."""
+        mocker.patch.object(CloudDevelopmentKit, "skip", False)
+        cdk_diff_stacks = mocker.patch.object(CloudDevelopmentKit, "cdk_diff_stacks")
+        mocker.patch.object(CloudDevelopmentKit, "cdk_list", return_value=[""])
+        mocker.patch.object(CloudDevelopmentKit, "cdk_synth")
+        mocker.patch.object(CloudDevelopmentKit, "npm_install")
+        mocker.patch.object(CloudDevelopmentKit, "run_build_steps")
+        assert not CloudDevelopmentKit(runway_context, module_root=tmp_path).plan()
+        cdk_diff_stacks.assert_not_called()
+
     def test_run_build_steps_empty(
         self,
         caplog: pytest.LogCaptureFixture,
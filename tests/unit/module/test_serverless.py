@@ -10,6 +10,7 @@ from unittest.mock import ANY, MagicMock, Mock, call
 
 import pytest
 import yaml
+from botocore.exceptions import ClientError
 from pydantic import ValidationError
 
 from runway.config.models.runway.options.serverless import (
@@ -518,6 +519,126 @@ class TestServerless:
             ["print"], env={"SLS_DEPRECATION_DISABLE": "*", **runway_context.env.vars}
         )
 
+    def test_sls_print_cache(
+        self,
+        mocker: MockerFixture,
+        runway_context: MockRunwayContext,
+        tmp_path: Path,
+    ) -> None:
+        """Test sls_print using cached results."""
+        runway_context.env.vars["RUNWAY_CACHE_DIR"] = str(tmp_path / "cache")
+        runway_context.env.vars["RUNWAY_SLS_PRINT_CACHE"] = "true"
+        module_root = tmp_path / "module"
+        module_root.mkdir()
+        config = module_root / "serverless.yml"
+        config.write_text("service: ${env:SERVICE_NAME}")
+        (module_root / "node_modules").mkdir()
+        (module_root / "node_modules" / "ignored.json").write_text("{}")
+        mocker.patch.object(Serverless, "gen_cmd", return_value=["print"])
+        mocker.patch.object(Serverless, "npm_install")
+        mock_check_output = mocker.patch(
+            "subprocess.check_output", return_value=yaml.safe_dump({"service": "first"})
+        )
+        obj = Serverless(runway_context, module_root=module_root)
+        assert obj.sls_print() == {"service": "first"}
+        assert obj.sls_print() == {"service": "first"}
+        (module_root / "node_modules" / "ignored.json").write_text('{"key": "value"}')
+        assert obj.sls_print() == {"service": "first"}
+        mock_check_output.assert_called_once()
+
+        mock_check_output.return_value = yaml.safe_dump({"service": "second"})
+        runway_context.env.vars["SERVICE_NAME"] = "second"
+        assert obj.sls_print() == {"service": "second"}
+        config.write_text("service: ${env:SERVICE_NAME}\n")
+        assert obj.sls_print() == {"service": "second"}
+        assert mock_check_output.call_count == 3
+        assert len(list((tmp_path / "cache" / "serverless").iterdir())) == 3
+
+    def test_sls_print_cache_disabled(
+        self, runway_context: MockRunwayContext, tmp_path: Path
+    ) -> None:
+        """Test sls_print cache is disabled by default."""
+        (tmp_path / "serverless.yml").write_text("service: test")
+        assert not Serverless(runway_context, module_root=tmp_path)._get_sls_print_cache_file(
+            ["print"]
+        )
+
+    @pytest.mark.parametrize(
+        "config_file, content",
+        [
+            ("serverless.js", "module.exports = {};"),
+            ("serverless.ts", "export default {};"),
+            ("serverless.yml", "key: ${ssm:/path/to/param}"),
+            ("serverless.yml", "key: ${cf(us-west-2):stack.Output}"),
+            ("serverless.yml", "key: ${cf.us-west-2:stack.Output}"),
+            ("serverless.yml", "key: ${aws:accountId}"),
+            ("serverless.yml", "key: ${file(./config.js):value}"),
+            ("serverless.yml", "key: ${file(../shared/config.yml):value}"),
+            ("serverless.yml", "key: ${file(./config/../../shared.yml)}"),
+            ("serverless.yml", "key: ${file(/etc/config.yml)}"),
+            ("serverless.yml", "key: ${file(~/config.yml)}"),
+            ("serverless.yml", "key: ${file(${self:custom.path})}"),
+            ("serverless.yml", "key: ${file(./${self:custom.dir}/config.yml)}"),
+            ("serverless.yml", "key: ${file('./node_modules/pkg/config.yml')}"),
+            ("serverless.yml", "key: ${file(./.config/config.yml)}"),
+        ],
+    )
+    def test_sls_print_cache_uncacheable(
+        self,
+        config_file: str,
+        content: str,
+        runway_context: MockRunwayContext,
+        tmp_path: Path,
+    ) -> None:
+        """Test sls_print cache is not used for config resolved remotely or by code."""
+        runway_context.env.vars["RUNWAY_SLS_PRINT_CACHE"] = "1"
+        (tmp_path / config_file).write_text(content)
+        assert not Serverless(runway_context, module_root=tmp_path)._get_sls_print_cache_file(
+            ["print"]
+        )
+
+    def test_sls_print_cache_file_ref(
+        self, runway_context: MockRunwayContext, tmp_path: Path
+    ) -> None:
+        """Test sls_print cache with files referenced in the module."""
+        runway_context.env.vars["RUNWAY_CACHE_DIR"] = str(tmp_path / "cache")
+        runway_context.env.vars["RUNWAY_SLS_PRINT_CACHE"] = "1"
+        module_root = tmp_path / "module"
+        (module_root / "config").mkdir(parents=True)
+        (module_root / "serverless.yml").write_text(
+            "custom: ${file(./config/${sls:stage}.yml):custom}"
+        )
+        (module_root / "config" / "nested.yml").write_text("key: ${file(../other.yml)}")
+        (module_root / "config" / "dev.yml").write_text("custom: {}")
+        obj = Serverless(runway_context, module_root=module_root)
+        first = obj._get_sls_print_cache_file(["print"])
+        assert first
+        (module_root / "config" / "dev.yml").write_text("custom: {key: value}")
+        assert obj._get_sls_print_cache_file(["print"]) != first
+
+    def test_sls_print_cache_tmp_config(
+        self, runway_context: MockRunwayContext, tmp_path: Path
+    ) -> None:
+        """Test sls_print cache keys temporary config files by their content."""
+        runway_context.env.vars["RUNWAY_CACHE_DIR"] = str(tmp_path / "cache")
+        runway_context.env.vars["RUNWAY_SLS_PRINT_CACHE"] = "1"
+        module_root = tmp_path / "module"
+        module_root.mkdir()
+        (module_root / "serverless.yml").write_text("service: test")
+        (module_root / "first.tmp.serverless.yml").write_text("service: merged")
+        (module_root / "second.tmp.serverless.yml").write_text("service: merged")
+        obj = Serverless(runway_context, module_root=module_root)
+        first = obj._get_sls_print_cache_file(["print", "--config", "first.tmp.serverless.yml"])
+        assert first
+        assert first.parent == tmp_path / "cache" / "serverless"
+        assert first == obj._get_sls_print_cache_file(
+            ["print", "--config", "second.tmp.serverless.yml"]
+        )
+        (module_root / "second.tmp.serverless.yml").write_text("service: other")
+        assert first != obj._get_sls_print_cache_file(
+            ["print", "--config", "second.tmp.serverless.yml"]
+        )
+
     @pytest.mark.parametrize("skip_install", [False, True])
     def test_sls_remove(
         self,
@@ -614,6 +735,49 @@ class TestServerlessArtifact:
         assert obj.package_path == tmp_path
         assert obj.path == tmp_path
 
+    def test_get_hash_of_files(
+        self, mocker: MockerFixture, runway_context: MockRunwayContext, tmp_path: Path
+    ) -> None:
+        """Test get_hash_of_files."""
+        mocker.patch.dict(f"{MODULE}.SOURCE_HASH_CACHE", clear=True)
+        calculate_hash_of_files = mocker.patch(
+            f"{MODULE}.calculate_hash_of_files", side_effect=["hash0", "hash1", "hash2"]
+        )
+        src = tmp_path / "src"
+        src.mkdir()
+        (src / "handler.py").write_text("def handler(): ...")
+        obj = ServerlessArtifact(runway_context, {}, package_path=tmp_path, path=tmp_path)
+        assert obj.get_hash_of_files(src) == "hash0"
+        assert obj.get_hash_of_files(src) == "hash0"
+        assert obj.get_hash_of_files(tmp_path, [{"path": "src"}]) == "hash1"
+        calculate_hash_of_files.assert_has_calls(
+            [call([src / "handler.py"], src), call([src / "handler.py"], tmp_path)]
+        )
+
+        (src / "handler.py").write_text("def handler(): return True")
+        assert obj.get_hash_of_files(src) == "hash2"
+        assert calculate_hash_of_files.call_count == 3
+
+    def test_get_hash_of_files_cache(
+        self, mocker: MockerFixture, runway_context: MockRunwayContext, tmp_path: Path
+    ) -> None:
+        """Test get_hash_of_files persisting results."""
+        runway_context.env.vars["RUNWAY_CACHE_DIR"] = str(tmp_path / "cache")
+        runway_context.env.vars["RUNWAY_SLS_HASH_CACHE"] = "true"
+        source_hash_cache = mocker.patch.dict(f"{MODULE}.SOURCE_HASH_CACHE", clear=True)
+        calculate_hash_of_files = mocker.patch(
+            f"{MODULE}.calculate_hash_of_files", return_value="hash"
+        )
+        src = tmp_path / "src"
+        src.mkdir()
+        (src / "handler.py").write_text("def handler(): ...")
+        obj = ServerlessArtifact(runway_context, {}, package_path=tmp_path, path=tmp_path)
+        assert obj.get_hash_of_files(src) == "hash"
+        assert len(list((tmp_path / "cache" / "serverless" / "hash").iterdir())) == 1
+        source_hash_cache.clear()
+        assert obj.get_hash_of_files(src) == "hash"
+        calculate_hash_of_files.assert_called_once_with([src / "handler.py"], src)
+
     @pytest.mark.parametrize(
         "service, service_name",
         [("test-service", "test-service"), ({"name": "test-service"}, "test-service")],
@@ -627,7 +791,9 @@ class TestServerlessArtifact:
         tmp_path: Path,
     ) -> None:
         """Test source_hash."""
-        get_hash_of_files = mocker.patch(f"{MODULE}.get_hash_of_files", Mock(return_value="hash"))
+        get_hash_of_files = mocker.patch.object(
+            ServerlessArtifact, "get_hash_of_files", Mock(return_value="hash")
+        )
         assert ServerlessArtifact(
             runway_context,
             {
@@ -656,8 +822,8 @@ class TestServerlessArtifact:
         tmp_path: Path,
     ) -> None:
         """Test source_hash."""
-        get_hash_of_files = mocker.patch(
-            f"{MODULE}.get_hash_of_files", Mock(side_effect=["hash0", "hash1"])
+        get_hash_of_files = mocker.patch.object(
+            ServerlessArtifact, "get_hash_of_files", Mock(side_effect=["hash0", "hash1"])
         )
         assert ServerlessArtifact(
             runway_context,
@@ -679,95 +845,146 @@ class TestServerlessArtifact:
             ]
         )
 
-    def test_sync_with_s3_download(
-        self, mocker: MockerFixture, runway_context: MockRunwayContext, tmp_path: Path
+    def test_sync_with_s3(
+        self,
+        caplog: pytest.LogCaptureFixture,
+        mocker: MockerFixture,
+        runway_context: MockRunwayContext,
+        tmp_path: Path,
     ) -> None:
         """Test sync_with_s3."""
-        does_s3_object_exist = mocker.patch(f"{MODULE}.does_s3_object_exist", return_value=True)
-        download = mocker.patch(f"{MODULE}.download")
+        caplog.set_level(logging.INFO, logger=MODULE)
         session = Mock()
+        s3_client = session.client.return_value
+        s3_client.get_paginator.return_value.paginate.return_value = [
+            {"Contents": [{"Key": "other.zip"}], "IsTruncated": True},
+            {"Contents": [{"Key": "hash0.zip"}], "IsTruncated": False},
+        ]
         package_path = tmp_path / "package"
-        upload = mocker.patch(f"{MODULE}.upload")
+        package_path.mkdir()
+        (package_path / "func1.zip").touch()
+        (package_path / "func2.zip").touch()
         mocker.patch.object(runway_context, "get_session", return_value=session)
-        mocker.patch.object(ServerlessArtifact, "source_hash", {"service": "hash"})
+        mocker.patch.object(
+            ServerlessArtifact,
+            "source_hash",
+            {"func0": "hash0", "func1": "hash1", "func2": "hash1", "func3": "hash3"},
+        )
         assert not ServerlessArtifact(
             runway_context,
             {},
             package_path=package_path,
             path=tmp_path,
         ).sync_with_s3("test-bucket")
-        does_s3_object_exist.assert_called_once_with(
-            "test-bucket",
-            "hash.zip",
-            session=session,
-            region=runway_context.env.aws_region,
+        session.client.assert_called_once_with("s3")
+        s3_client.get_paginator.assert_called_once_with("list_objects_v2")
+        s3_client.get_paginator.return_value.paginate.assert_called_once_with(
+            Bucket="test-bucket", Delimiter="/"
+        )
+        s3_client.head_object.assert_not_called()
+        s3_client.download_file.assert_called_once_with(
+            Bucket="test-bucket",
+            Key="hash0.zip",
+            Filename=str(package_path / "func0.zip"),
         )
-        download.assert_called_once_with(
-            bucket="test-bucket",
-            key="hash.zip",
-            file_path=str(package_path / "service.zip"),
-            session=session,
+        s3_client.upload_file.assert_called_once_with(
+            Filename=str(package_path / "func1.zip"),
+            Bucket="test-bucket",
+            Key="hash1.zip",
         )
-        upload.assert_not_called()
+        assert "found existing package for func0" in caplog.messages
+        assert "no existing package found for func1" in caplog.messages
+        assert "local file not found for func3" in caplog.messages
 
-    def test_sync_with_s3_upload(
+    def test_sync_with_s3_list_access_denied(
         self, mocker: MockerFixture, runway_context: MockRunwayContext, tmp_path: Path
     ) -> None:
-        """Test sync_with_s3."""
-        does_s3_object_exist = mocker.patch(f"{MODULE}.does_s3_object_exist", return_value=False)
-        download = mocker.patch(f"{MODULE}.download")
+        """Test sync_with_s3 unable to list the bucket."""
         session = Mock()
+        s3_client = session.client.return_value
+        s3_client.get_paginator.return_value.paginate.side_effect = ClientError(
+            {"Error": {"Code": "AccessDenied"}}, "ListObjectsV2"
+        )
+
+        def _head_object(**kwargs: str) -> None:
+            if kwargs["Key"] != "hash0.zip":
+                raise ClientError({"Error": {"Code": "404"}}, "HeadObject")
+
+        s3_client.head_object.side_effect = _head_object
         package_path = tmp_path / "package"
-        upload = mocker.patch(f"{MODULE}.upload")
-        mocker.patch.object(runway_context, "get_session", return_value=session)
-        mocker.patch.object(ServerlessArtifact, "source_hash", {"service": "hash"})
         package_path.mkdir()
-        (package_path / "service.zip").touch()
+        (package_path / "func1.zip").touch()
+        mocker.patch.object(runway_context, "get_session", return_value=session)
+        mocker.patch.object(ServerlessArtifact, "source_hash", {"func0": "hash0", "func1": "hash1"})
         assert not ServerlessArtifact(
             runway_context,
             {},
             package_path=package_path,
             path=tmp_path,
         ).sync_with_s3("test-bucket")
-        does_s3_object_exist.assert_called_once_with(
-            "test-bucket",
-            "hash.zip",
-            session=session,
-            region=runway_context.env.aws_region,
+        assert s3_client.head_object.call_count == 2
+        s3_client.download_file.assert_called_once_with(
+            Bucket="test-bucket",
+            Key="hash0.zip",
+            Filename=str(package_path / "func0.zip"),
         )
-        download.assert_not_called()
-        upload.assert_called_once_with(
-            bucket="test-bucket",
-            key="hash.zip",
-            filename=str(package_path / "service.zip"),
-            session=session,
+        s3_client.upload_file.assert_called_once_with(
+            Filename=str(package_path / "func1.zip"),
+            Bucket="test-bucket",
+            Key="hash1.zip",
         )
 
-    def test_sync_with_s3_upload_not_exist(
+    def test_sync_with_s3_list_max_pages(
         self, mocker: MockerFixture, runway_context: MockRunwayContext, tmp_path: Path
     ) -> None:
-        """Test sync_with_s3."""
-        does_s3_object_exist = mocker.patch(f"{MODULE}.does_s3_object_exist", return_value=False)
-        download = mocker.patch(f"{MODULE}.download")
+        """Test sync_with_s3 stops listing a large bucket."""
+        mocker.patch(f"{MODULE}.ARTIFACT_LIST_MAX_PAGES", 2)
         session = Mock()
+        s3_client = session.client.return_value
+        pages = iter(
+            [
+                {"Contents": [{"Key": "hash0.zip"}], "IsTruncated": True},
+                {"Contents": [{"Key": "other.zip"}], "IsTruncated": True},
+                {"Contents": [{"Key": "hash1.zip"}], "IsTruncated": False},
+            ]
+        )
+        s3_client.get_paginator.return_value.paginate.return_value = pages
         package_path = tmp_path / "package"
-        upload = mocker.patch(f"{MODULE}.upload")
+        package_path.mkdir()
         mocker.patch.object(runway_context, "get_session", return_value=session)
-        mocker.patch.object(ServerlessArtifact, "source_hash", {"service": "hash"})
+        mocker.patch.object(ServerlessArtifact, "source_hash", {"func0": "hash0", "func1": "hash1"})
         assert not ServerlessArtifact(
             runway_context,
             {},
             package_path=package_path,
             path=tmp_path,
         ).sync_with_s3("test-bucket")
-        does_s3_object_exist.assert_called_once_with(
-            "test-bucket",
-            "hash.zip",
-            session=session,
-            region=runway_context.env.aws_region,
-        )
-        download.assert_not_called()
-        upload.assert_not_called()
+        assert next(pages)["Contents"] == [{"Key": "hash1.zip"}]
+        s3_client.head_object.assert_called_once_with(Bucket="test-bucket", Key="hash1.zip")
+        assert s3_client.download_file.call_count == 2
+
+    def test_sync_with_s3_raise_client_error(
+        self, mocker: MockerFixture, runway_context: MockRunwayContext, tmp_path: Path
+    ) -> None:
+        """Test sync_with_s3 raise ClientError."""
+        session = Mock()
+        s3_client = session.client.return_value
+        s3_client.get_paginator.return_value.paginate.return_value = [{}]
+        s3_client.upload_file.side_effect = ClientError(
+            {"Error": {"Code": "AccessDenied"}}, "PutObject"
+        )
+        package_path = tmp_path / "package"
+        package_path.mkdir()
+        (package_path / "service.zip").touch()
+        mocker.patch.object(runway_context, "get_session", return_value=session)
+        mocker.patch.object(ServerlessArtifact, "source_hash", {"service": "hash"})
+        with pytest.raises(ClientError):
+            ServerlessArtifact(
+                runway_context,
+                {},
+                package_path=package_path,
+                path=tmp_path,
+            ).sync_with_s3("test-bucket")
 
 
 class TestServerlessOptions:
@@ -160,6 +160,9 @@ class TestTerraform:
         dot_tf_plugins = dot_tf / "plugins"
         dot_tf_plugins.mkdir(parents=True)
         (dot_tf_plugins / "some_file").touch()
+        dot_tf_providers = dot_tf / "providers"
+        dot_tf_providers.mkdir(parents=True)
+        (dot_tf_providers / "some_file").touch()
         dot_tf_tfstate = dot_tf / "terraform.tfstate"
         dot_tf_tfstate.touch()
 
@@ -168,6 +171,7 @@ class TestTerraform:
         assert not dot_tf_modules.exists()
         assert dot_tf_plugins.exists()
         assert (dot_tf_plugins / "some_file").exists()
+        assert (dot_tf_providers / "some_file").exists()
         assert not dot_tf_tfstate.exists()
         assert "removing some of its contents" in "\n".join(caplog.messages)
 
@@ -278,6 +282,18 @@ class TestTerraform:
         obj.terraform_workspace_list.assert_called_once_with()
         obj.terraform_workspace_select.assert_called_once_with("test")
         obj.terraform_workspace_new.assert_not_called()
+        assert obj.terraform_init.call_count == 2
+        logs = "\n".join(caplog.messages)
+        assert "re-running init after workspace change..." not in logs
+        assert "skipped re-running init" in logs
+        caplog.clear()
+
+        # module is run; switch to workspace changes the backend
+        obj.terraform_workspace_select.side_effect = lambda _: (
+            tmp_path / ".terraform.lock.hcl"
+        ).write_text("changed")
+        assert not obj[action]()
+        assert obj.terraform_init.call_count == 4
         logs = "\n".join(caplog.messages)
         assert "re-running init after workspace change..." in logs
 
@@ -464,6 +480,52 @@ class TestTerraform:
         mock_update_envvars.assert_called_once_with(runway_context.env.vars, {})
         assert obj.ctx.env.vars == {"result": "success"}
 
+    def test_init_state(self, runway_context: MockRunwayContext, tmp_path: Path) -> None:
+        """Test init_state."""
+        obj = Terraform(runway_context, module_root=tmp_path)
+        init_state = obj.init_state
+        assert init_state == obj.init_state
+        (tmp_path / ".terraform.lock.hcl").write_text("lock")
+        assert obj.init_state != init_state
+        init_state = obj.init_state
+        (tmp_path / ".terraform").mkdir()
+        (tmp_path / ".terraform" / "terraform.tfstate").write_text("{}")
+        assert obj.init_state != init_state
+        init_state = obj.init_state
+        assert (
+            Terraform(
+                runway_context,
+                module_root=tmp_path,
+                options={"args": {"init": ["-upgrade"]}},
+            ).init_state
+            != init_state
+        )
+
+    @pytest.mark.parametrize(
+        "env_vars, expected",
+        [
+            ({}, False),
+            ({"RUNWAY_TF_PLUGIN_CACHE": "false"}, False),
+            ({"RUNWAY_TF_PLUGIN_CACHE": "true"}, True),
+            ({"RUNWAY_TF_PLUGIN_CACHE": "true", "TF_PLUGIN_CACHE_DIR": "/tmp"}, False),
+        ],
+    )
+    def test_plugin_cache_dir(
+        self,
+        env_vars: dict[str, str],
+        expected: bool,
+        runway_context: MockRunwayContext,
+        tmp_path: Path,
+    ) -> None:
+        """Test plugin_cache_dir."""
+        runway_context.env.vars.pop("TF_PLUGIN_CACHE_DIR", None)
+        runway_context.env.vars.update(env_vars, RUNWAY_CACHE_DIR=str(tmp_path))
+        obj = Terraform(runway_context, module_root=tmp_path)
+        if expected:
+            assert obj.plugin_cache_dir == tmp_path / "terraform" / "plugins"
+        else:
+            assert not obj.plugin_cache_dir
+
     @pytest.mark.parametrize(
         "env, param, expected",
         [
@@ -670,6 +732,26 @@ class TestTerraform:
             assert obj.terraform_init()
         assert excinfo.value.code == 1
 
+    def test_terraform_init_plugin_cache_dir(
+        self, mocker: MockerFixture, runway_context: MockRunwayContext, tmp_path: Path
+    ) -> None:
+        """Test terraform_init with plugin_cache_dir."""
+        mocker.patch.object(Terraform, "gen_command", return_value=["mock_gen_command"])
+        mock_file_lock = mocker.patch(f"{MODULE}.file_lock")
+        mock_run_command = mocker.patch(f"{MODULE}.run_module_command")
+        plugin_cache_dir = tmp_path / "cache" / "plugins"
+        mocker.patch.object(Terraform, "plugin_cache_dir", plugin_cache_dir)
+        obj = Terraform(runway_context, module_root=tmp_path)
+        assert not obj.terraform_init()
+        assert plugin_cache_dir.is_dir()
+        mock_file_lock.assert_called_once_with(tmp_path / "cache" / "plugins.lock")
+        mock_run_command.assert_called_once_with(
+            ["mock_gen_command"],
+            env_vars={**obj.ctx.env.vars, "TF_PLUGIN_CACHE_DIR": str(plugin_cache_dir)},
+            exit_on_error=False,
+            logger=obj.logger,
+        )
+
     def test_terraform_plan(
         self, mocker: MockerFixture, runway_context: MockRunwayContext, tmp_path: Path
     ) -> None:
@@ -10,8 +10,10 @@ import pytest
 from runway.module.utils import (
     NPM_BIN,
     NPX_BIN,
+    NodeModulesCache,
     format_npm_command_for_logging,
     generate_node_command,
+    get_node_versions,
     run_module_command,
     use_npm_ci,
 )
@@ -25,6 +27,137 @@ if TYPE_CHECKING:
 MODULE = "runway.module.utils"
 
 
+@pytest.fixture
+def node_modules_cache(mocker: MockerFixture, tmp_path: Path) -> NodeModulesCache:
+    """Return a NodeModulesCache for a module with a lockfile."""
+    mocker.patch(f"{MODULE}.get_node_versions", return_value=("v20.0.0", "10.0.0"))
+    module_dir = tmp_path / "module"
+    module_dir.mkdir()
+    (module_dir / "package-lock.json").write_text("{}")
+    return NodeModulesCache(module_dir, cache_dir=tmp_path / "cache")
+
+
+class TestNodeModulesCache:
+    """Test NodeModulesCache."""
+
+    def test_key(self, node_modules_cache: NodeModulesCache, mocker: MockerFixture) -> None:
+        """Test key."""
+        key = node_modules_cache.key
+        assert key
+        assert node_modules_cache.entry == node_modules_cache.cache_dir / key
+        del node_modules_cache.key
+        (node_modules_cache.path / "package-lock.json").write_text('{"changed": true}')
+        assert node_modules_cache.key != key
+        del node_modules_cache.key
+        (node_modules_cache.path / "package-lock.json").write_text("{}")
+        mocker.patch(f"{MODULE}.get_node_versions", return_value=("v22.0.0", "10.0.0"))
+        assert node_modules_cache.key != key
+
+    @pytest.mark.parametrize(
+        "environ",
+        [{"NODE_ENV": "production"}, {"npm_config_omit": "dev"}, {"NPM_CONFIG_OMIT": "dev"}],
+    )
+    def test_key_environ(
+        self, environ: dict[str, str], node_modules_cache: NodeModulesCache
+    ) -> None:
+        """Test key changes with npm configuration from environment variables."""
+        node_modules_cache.environ = {"UNRELATED": "value"}
+        key = node_modules_cache.key
+        del node_modules_cache.key
+        node_modules_cache.environ = {**node_modules_cache.environ, **environ}
+        assert node_modules_cache.key != key
+
+    def test_key_npmrc(self, node_modules_cache: NodeModulesCache) -> None:
+        """Test key changes with .npmrc."""
+        key = node_modules_cache.key
+        del node_modules_cache.key
+        (node_modules_cache.path / ".npmrc").write_text("omit=dev\n")
+        assert node_modules_cache.key != key
+
+    def test_key_no_lockfile(self, node_modules_cache: NodeModulesCache) -> None:
+        """Test key no lockfile."""
+        (node_modules_cache.path / "package-lock.json").unlink()
+        assert not node_modules_cache.key
+        assert not node_modules_cache.entry
+        assert not node_modules_cache.is_current()
+        assert not node_modules_cache.restore()
+
+    def test_key_no_node(self, mocker: MockerFixture, tmp_path: Path) -> None:
+        """Test key node not found."""
+        mocker.patch(f"{MODULE}.get_node_versions", side_effect=FileNotFoundError)
+        (tmp_path / "npm-shrinkwrap.json").write_text("{}")
+        assert not NodeModulesCache(tmp_path, cache_dir=tmp_path / "cache").key
+
+    @pytest.mark.parametrize(
+        "package_json, expected",
+        [
+            (None, []),
+            ("invalid", []),
+            ("[]", []),
+            ('{"scripts": null}', []),
+            (
+                '{"scripts": {"build": "tsc", "prepare": "husky", "postinstall": "patch-package"}}',
+                ["postinstall", "prepare"],
+            ),
+        ],
+    )
+    def test_lifecycle_scripts(
+        self, expected: list[str], node_modules_cache: NodeModulesCache, package_json: str | None
+    ) -> None:
+        """Test lifecycle_scripts."""
+        if package_json is not None:
+            (node_modules_cache.path / "package.json").write_text(package_json)
+        assert node_modules_cache.lifecycle_scripts == expected
+
+    def test_restore(self, node_modules_cache: NodeModulesCache) -> None:
+        """Test restore."""
+        assert not node_modules_cache.restore()
+        node_modules_cache.node_modules.mkdir()
+        (node_modules_cache.node_modules / "pkg.js").write_text("pkg")
+        node_modules_cache.save()
+        assert node_modules_cache.is_current()
+        assert node_modules_cache.entry
+        assert (node_modules_cache.entry / "pkg.js").read_text() == "pkg"
+        assert not list(node_modules_cache.cache_dir.glob(".*"))
+
+        (node_modules_cache.node_modules / "pkg.js").write_text("changed")
+        assert node_modules_cache.restore()
+        assert (node_modules_cache.node_modules / "pkg.js").read_text() == "changed"
+
+        (node_modules_cache.node_modules / NodeModulesCache.MARKER).unlink()
+        (node_modules_cache.node_modules / "extra.js").touch()
+        assert node_modules_cache.restore()
+        assert (node_modules_cache.node_modules / "pkg.js").read_text() == "pkg"
+        assert not (node_modules_cache.node_modules / "extra.js").exists()
+        assert node_modules_cache.is_current()
+
+    def test_restore_error(
+        self, mocker: MockerFixture, node_modules_cache: NodeModulesCache
+    ) -> None:
+        """Test restore error."""
+        assert node_modules_cache.entry
+        node_modules_cache.entry.mkdir(parents=True)
+        mocker.patch(f"{MODULE}.shutil.copytree", side_effect=OSError)
+        assert not node_modules_cache.restore()
+        assert not node_modules_cache.node_modules.exists()
+
+    def test_save_no_node_modules(self, node_modules_cache: NodeModulesCache) -> None:
+        """Test save when node_modules does not exist."""
+        node_modules_cache.save()
+        assert not node_modules_cache.cache_dir.exists()
+
+
+def test_get_node_versions(fake_process: FakeProcess) -> None:
+    """Test get_node_versions."""
+    get_node_versions.cache_clear()
+    fake_process.register_subprocess(["node", "--version"], stdout="v20.0.0\n")
+    fake_process.register_subprocess([NPM_BIN, "--version"], stdout="10.0.0\n")
+    assert get_node_versions() == ("v20.0.0", "10.0.0")
+    assert get_node_versions() == ("v20.0.0", "10.0.0")
+    assert fake_process.call_count(["node", "--version"]) == 1
+    get_node_versions.cache_clear()
+
+
 @pytest.mark.parametrize(
     "command, expected",
     [
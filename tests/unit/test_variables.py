@@ -96,6 +96,22 @@ class TestVariables:
         )
         assert Variable("Param", "val").dependencies == {"test"}
 
+    def test_lookups(self) -> None:
+        """Test lookups."""
+        assert Variable("Param", "val").lookups == []
+        obj = Variable(
+            "Param",
+            {
+                "dict": {"key": "${test query}"},
+                "list": ["${test ${test nested}}"],
+                "model": ExampleModel(test="${test model}"),
+            },
+        )
+        assert len(obj.lookups) == 4
+        assert [lookup.lookup_query.value for lookup in obj.lookups[::2]] == ["query", "nested"]
+        assert obj.lookups[1].lookups == obj.lookups[1:3]
+        assert obj.lookups[3].lookup_query.value == "model"
+
     def test_get(self) -> None:
         """Test get."""
         obj = Variable("Para", {"key": "val"})
@@ -266,6 +282,10 @@ class TestVariableValue:
         obj = VariableValue()
         assert obj.dependencies == set()
 
+    def test_lookups(self) -> None:
+        """Test lookups."""
+        assert VariableValue().lookups == []
+
     def test_parse_obj_dict_empty(self) -> None:
         """Test parse_obj dict empty."""
         assert isinstance(VariableValue.parse_obj({}), VariableValueDict)
@@ -0,0 +1,186 @@
+"""Test runway.utils._api_stats."""
+
+from __future__ import annotations
+
+import json
+import logging
+from typing import TYPE_CHECKING
+from unittest.mock import Mock
+
+import boto3
+from botocore.awsrequest import AWSResponse
+
+from runway.utils._api_stats import (
+    ApiCallKey,
+    ApiCallRecorder,
+    ApiCallStats,
+    run_worker,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pytest
+    from pytest_mock import MockerFixture
+
+MODULE = "runway.utils._api_stats"
+
+KEY = ApiCallKey("runway", "us-east-1", "cloudformation", "DescribeStacks")
+
+
+def _describe_stacks_response(**_: object) -> AWSResponse:
+    """Response returned instead of sending a DescribeStacks request."""
+    return AWSResponse(
+        "https://example.com",
+        200,
+        {},
+        Mock(
+            stream=Mock(
+                return_value=[
+                    b"<DescribeStacksResponse><DescribeStacksResult><Stacks/>"
+                    b"</DescribeStacksResult></DescribeStacksResponse>"
+                ]
+            )
+        ),
+    )
+
+
+class TestApiCallStats:
+    """Test ApiCallStats."""
+
+    def test_add_call(self) -> None:
+        """Test add_call."""
+        obj = ApiCallStats()
+        obj.add_call(10.0)
+        obj.add_call(300.0, error=True, retries=2)
+        obj.add_call(20000.0)
+        assert obj.calls == 3
+        assert obj.errors == 1
+        assert obj.retries == 2
+        assert obj.max_latency == 20000.0  # noqa: PLR2004
+        assert obj.histogram == [1, 0, 0, 1, 0, 0, 0, 0, 1]
+
+    def test_merge(self) -> None:
+        """Test merge."""
+        obj = ApiCallStats()
+        obj.add_call(10.0)
+        other = ApiCallStats()
+        other.add_call(60.0, retries=1)
+        other.throttles = 1
+        obj.merge(other)
+        assert obj.to_dict() == {
+            "calls": 2,
+            "errors": 0,
+            "histogram": [1, 1, 0, 0, 0, 0, 0, 0, 0],
+            "latency": 70.0,
+            "max_latency": 60.0,
+            "retries": 1,
+            "throttles": 1,
+        }
+        assert ApiCallStats.parse_obj(obj.to_dict()).to_dict() == obj.to_dict()
+
+    def test_percentile(self) -> None:
+        """Test percentile."""
+        obj = ApiCallStats()
+        assert obj.percentile(50) == "-"
+        for latency in (10.0, 10.0, 10.0, 200.0, 20000.0):
+            obj.add_call(latency)
+        assert obj.percentile(50) == "<=50"
+        assert obj.percentile(70) == "<=250"
+        assert obj.percentile(90) == ">10000"
+
+
+class TestApiCallRecorder:
+    """Test ApiCallRecorder."""
+
+    def test_collect(self, caplog: pytest.LogCaptureFixture, tmp_path: Path) -> None:
+        """Test collect."""
+        caplog.set_level(logging.INFO, logger=MODULE)
+        recorder = ApiCallRecorder()
+        recorder.record(KEY, 1.0)
+        report = tmp_path / "reports" / "api.json"
+        with recorder.collect({"RUNWAY_API_STATS": "true", "RUNWAY_API_STATS_REPORT": str(report)}):
+            assert recorder.spool_dir
+            spool_dir = recorder.spool_dir
+            recorder.record(KEY, 10.0)
+            worker = ApiCallRecorder()
+            worker.spool_dir = spool_dir
+            worker.record(KEY._replace(scope="stack"), 20.0)
+            worker.spool()
+        assert not spool_dir.exists()
+        assert not recorder.spool_dir
+        assert [(key.scope, value.calls) for key, value in recorder.stats().items()] == [
+            ("runway", 1),
+            ("stack", 1),
+        ]
+        data = json.loads(report.read_text())
+        assert [(call["scope"], call["calls"]) for call in data["calls"]] == [
+            ("runway", 1),
+            ("stack", 1),
+        ]
+        assert caplog.messages[0].startswith("AWS API calls:\n")
+        assert caplog.messages[1] == f"AWS API call report written to {report}"
+
+    def test_collect_disabled(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Test collect when not enabled."""
+        caplog.set_level(logging.DEBUG, logger=MODULE)
+        recorder = ApiCallRecorder()
+        with recorder.collect({"RUNWAY_API_STATS": "false"}):
+            assert not recorder.spool_dir
+        assert not caplog.messages
+
+    def test_format_summary(self) -> None:
+        """Test format_summary."""
+        recorder = ApiCallRecorder()
+        recorder.record(KEY, 40.0)
+        recorder.record(KEY._replace(scope="stack", region="us-west-2"), 60.0, retries=1)
+        recorder.record_throttle(KEY)
+        recorder.record(ApiCallKey("stack", "us-east-1", "s3", "HeadObject"), 120.0, error=True)
+        assert recorder.format_summary().splitlines() == [
+            "service         operation       calls  errors  retries  throttles  avg ms  p50 ms"
+            "  p90 ms  max ms",
+            "cloudformation  DescribeStacks      2       0        1          1      50    <=50"
+            "   <=100      60",
+            "s3              HeadObject          1       1        0          0     120   <=250"
+            "   <=250     120",
+            "total                               3       1        1          1      73   <=100"
+            "   <=250     120",
+        ]
+
+    def test_register(self) -> None:
+        """Test register."""
+        recorder = ApiCallRecorder()
+        session = boto3.Session(
+            aws_access_key_id="foo", aws_secret_access_key="bar", region_name="us-east-1"
+        )
+        recorder.register(session)
+        client = session.client("cloudformation")
+        client.meta.events.register("before-send", _describe_stacks_response)
+        with recorder.scope("module"), recorder.scope("stack"):
+            assert recorder.current_scope() == "module > stack"
+            client.describe_stacks()
+        assert recorder.current_scope() == "runway"
+        key = KEY._replace(scope="module > stack")
+        assert list(recorder.stats()) == [key]
+        assert recorder.stats()[key].calls == 1
+        assert recorder.stats()[key].errors == 0
+
+        context = {"runway_api_stats": (key, 0.0)}
+        session.events.emit(
+            "needs-retry.cloudformation.DescribeStacks",
+            request_dict={"context": context},
+            response=(Mock(), {"Error": {"Code": "Throttling"}}),
+        )
+        session.events.emit("after-call-error.cloudformation.DescribeStacks", context=context)
+        assert recorder.stats()[key].throttles == 1
+        assert recorder.stats()[key].errors == 1
+
+
+def test_run_worker(mocker: MockerFixture, tmp_path: Path) -> None:
+    """Test run_worker."""
+    recorder = mocker.patch(f"{MODULE}.API_STATS", ApiCallRecorder())
+    recorder.spool_dir = tmp_path
+    recorder.record(KEY, 1.0)  # inherited from the parent process
+    assert run_worker(recorder.record, KEY, 20.0) is None
+    (path,) = tmp_path.iterdir()
+    assert ApiCallRecorder.parse_dict(json.loads(path.read_text()))[KEY].calls == 1
@@ -0,0 +1,65 @@
+"""Test runway.utils._cache."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from runway.utils._cache import file_lock, get_cache_dir, read_json_file, write_file_atomic
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+MODULE = "runway.utils._cache"
+
+
+def test_file_lock(tmp_path: Path) -> None:
+    """Test file_lock."""
+    lock_path = tmp_path / "sub" / ".lock"
+    with file_lock(lock_path):
+        assert lock_path.is_file()
+    with file_lock(lock_path, shared=True), file_lock(lock_path, shared=True):
+        assert lock_path.is_file()
+
+
+@pytest.mark.parametrize(
+    "environ, expected",
+    [
+        ({"RUNWAY_CACHE_DIR": "/tmp/runway-cache"}, Path("/tmp/runway-cache").resolve()),
+        ({"XDG_CACHE_HOME": "/tmp/xdg"}, Path("/tmp/xdg/runway")),
+        ({}, Path.home() / ".cache" / "runway"),
+    ],
+)
+def test_get_cache_dir(environ: dict[str, str], expected: Path, mocker: MockerFixture) -> None:
+    """Test get_cache_dir."""
+    mocker.patch(f"{MODULE}.platform.system", return_value="Linux")
+    assert get_cache_dir(environ) == expected
+
+
+def test_get_cache_dir_windows(mocker: MockerFixture, tmp_path: Path) -> None:
+    """Test get_cache_dir on Windows."""
+    mocker.patch(f"{MODULE}.platform.system", return_value="Windows")
+    assert get_cache_dir({"LOCALAPPDATA": str(tmp_path)}) == tmp_path / "runway" / "cache"
+
+
+def test_read_json_file(tmp_path: Path) -> None:
+    """Test read_json_file."""
+    path = tmp_path / "test.json"
+    assert read_json_file(path) is None
+    path.write_text("{invalid")
+    assert read_json_file(path) is None
+    path.write_text('{"key": "val"}')
+    assert read_json_file(path) == {"key": "val"}
+
+
+def test_write_file_atomic(tmp_path: Path) -> None:
+    """Test write_file_atomic."""
+    path = tmp_path / "sub" / "test.json"
+    write_file_atomic(path, "foo", mode=0o600)
+    assert path.read_text() == "foo"
+    assert path.stat().st_mode & 0o777 == 0o600
+    write_file_atomic(path, "bar")
+    assert path.read_text() == "bar"
+    assert [i.name for i in path.parent.iterdir()] == ["test.json"]
@@ -0,0 +1,105 @@
+"""Test runway.utils._credential_cache."""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING
+
+import pytest
+
+from runway.constants import BOTO3_CREDENTIAL_CACHE
+from runway.utils._credential_cache import FileCredentialCache, get_credential_cache
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+MODULE = "runway.utils._credential_cache"
+
+
+def _creds(expiration: datetime) -> dict[str, object]:
+    """Build a cached credential response."""
+    return {
+        "Credentials": {
+            "AccessKeyId": "foo",
+            "SecretAccessKey": "bar",
+            "SessionToken": "foobar",
+            "Expiration": expiration,
+        }
+    }
+
+
+class TestFileCredentialCache:
+    """Test FileCredentialCache."""
+
+    def test___contains__(self, tmp_path: Path) -> None:
+        """Test __contains__."""
+        cache = FileCredentialCache(tmp_path)
+        assert "key" not in cache
+        cache["key"] = _creds(datetime.now(timezone.utc) + timedelta(hours=1))
+        assert "key" in cache
+
+    def test___delitem__(self, tmp_path: Path) -> None:
+        """Test __delitem__."""
+        cache = FileCredentialCache(tmp_path)
+        cache["key"] = {"foo": "bar"}
+        del cache["key"]
+        assert not (tmp_path / "key.json").exists()
+        with pytest.raises(KeyError):
+            del cache["key"]
+
+    def test___getitem___expired(self, tmp_path: Path) -> None:
+        """Test __getitem__ expired."""
+        cache = FileCredentialCache(tmp_path)
+        cache["key"] = _creds(datetime.now(timezone.utc) - timedelta(minutes=1))
+        with pytest.raises(KeyError):
+            cache["key"]  # pyright: ignore[reportUnusedExpression]
+
+    def test___getitem___shared(self, tmp_path: Path) -> None:
+        """Test __getitem__ value written by another process."""
+        expiration = datetime.now(timezone.utc) + timedelta(hours=1)
+        FileCredentialCache(tmp_path)["key"] = _creds(expiration)
+        result = FileCredentialCache(tmp_path)["key"]
+        assert result["Credentials"]["Expiration"] == expiration.isoformat()
+
+    def test___iter__(self, tmp_path: Path) -> None:
+        """Test __iter__ and __len__."""
+        cache = FileCredentialCache(tmp_path / "missing")
+        assert not list(cache)
+        cache["b"] = {}
+        cache["a"] = {}
+        assert list(cache) == ["a", "b"]
+        assert len(cache) == 2
+
+    def test___setitem__(self, tmp_path: Path) -> None:
+        """Test __setitem__."""
+        memory: dict[str, object] = {}
+        cache = FileCredentialCache(tmp_path, memory=memory)
+        value = _creds(datetime(2000, 1, 1, tzinfo=timezone.utc))
+        cache["key"] = value
+        assert memory["key"] is value
+        path = tmp_path / "key.json"
+        assert json.loads(path.read_text()) == {
+            "Credentials": {
+                "AccessKeyId": "foo",
+                "SecretAccessKey": "bar",
+                "SessionToken": "foobar",
+                "Expiration": "2000-01-01T00:00:00+00:00",
+            }
+        }
+        assert path.stat().st_mode & 0o777 == 0o600
+
+
+@pytest.mark.parametrize("value", ["", "0", "false"])
+def test_get_credential_cache_disabled(value: str) -> None:
+    """Test get_credential_cache disabled."""
+    assert get_credential_cache({"RUNWAY_CREDENTIAL_CACHE": value}) is BOTO3_CREDENTIAL_CACHE
+
+
+def test_get_credential_cache_enabled(tmp_path: Path) -> None:
+    """Test get_credential_cache enabled."""
+    environ = {"RUNWAY_CACHE_DIR": str(tmp_path), "RUNWAY_CREDENTIAL_CACHE": "true"}
+    result = get_credential_cache(environ)
+    assert isinstance(result, FileCredentialCache)
+    assert result.cache_dir == tmp_path / "credentials"
+    assert get_credential_cache(environ) is result
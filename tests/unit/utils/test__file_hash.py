@@ -36,6 +36,18 @@ class TestFileHash:
         assert result.digest == expected.digest()
         assert result.hexdigest == expected.hexdigest()
 
+    @pytest.mark.parametrize("alg", ALGS_TO_TEST)
+    def test_add_file_chunks(self, alg: str, tmp_path: Path) -> None:
+        """Test add_file with a file larger than one chunk."""
+        content = b"".join(bytes([i]) * 1024 for i in range(5))
+        test_file = tmp_path / "test.bin"
+        test_file.write_bytes(content)
+
+        result = FileHash(hashlib.new(alg), chunk_size=1024)
+        result.add_file(test_file)
+
+        assert result.hexdigest == hashlib.new(alg, content).hexdigest()
+
     @pytest.mark.parametrize("alg", ALGS_TO_TEST)
     def test_add_file_name(self, alg: str, tmp_path: Path) -> None:
         """Test add_file_name."""
@@ -0,0 +1,254 @@
+"""Test runway.utils._rate_limiter."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import TYPE_CHECKING
+from unittest.mock import Mock
+
+import boto3
+import pytest
+from botocore.awsrequest import AWSResponse
+from botocore.config import Config
+from moto.core.decorator import mock_aws
+
+from runway.cfngin.session_cache import get_session
+from runway.utils._rate_limiter import AdaptiveRateLimiter, RateLimitKey, RateLimitStats
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
+MODULE = "runway.utils._rate_limiter"
+
+KEY = RateLimitKey("123456789012", "us-east-1", "cloudformation")
+
+
+DESCRIBE_STACKS_RESPONSE = (
+    b"<DescribeStacksResponse><DescribeStacksResult><Stacks/>"
+    b"</DescribeStacksResult></DescribeStacksResponse>"
+)
+
+
+def _raw(body: bytes) -> Mock:
+    """Raw response body of an AWSResponse."""
+    return Mock(stream=Mock(return_value=[body]))
+
+
+@pytest.fixture
+def mock_time(mocker: MockerFixture) -> Mock:
+    """Patch time used by the rate limiter."""
+    return mocker.patch(f"{MODULE}.time", monotonic=Mock(return_value=100.0), sleep=Mock())
+
+
+class TestAdaptiveRateLimiter:
+    """Test AdaptiveRateLimiter."""
+
+    def test_acquire_not_limited(self, mock_time: Mock) -> None:
+        """Test acquire before any calls are throttled."""
+        limiter = AdaptiveRateLimiter()
+        for _ in range(100):
+            limiter.acquire(KEY)
+        mock_time.sleep.assert_not_called()
+        assert limiter.stats() == {KEY: RateLimitStats(100, 0, 0.0, None)}
+
+    def test_on_throttle(self, mock_time: Mock) -> None:
+        """Test on_throttle."""
+        limiter = AdaptiveRateLimiter(burst=2, cooldown=1)
+        for second in range(10):
+            mock_time.monotonic.return_value = 100.0 + second
+            limiter.acquire(KEY)
+        limiter.on_throttle(KEY)
+        # 10 calls over 9 seconds, halved
+        assert limiter.stats()[KEY].rate == pytest.approx(10 / 9 / 2)
+
+        # another throttle from the same overload doesn't decrease the rate again
+        limiter.on_throttle(KEY)
+        assert limiter.stats()[KEY].rate == pytest.approx(10 / 9 / 2)
+        assert limiter.stats()[KEY].throttles == 2
+
+        mock_time.monotonic.return_value = 200.0
+        limiter.on_throttle(KEY)
+        assert limiter.stats()[KEY].rate == limiter.min_rate
+
+    def test_acquire_limited(self, mock_time: Mock) -> None:
+        """Test acquire while limited."""
+        limiter = AdaptiveRateLimiter(burst=2, min_rate=2)
+        limiter.on_throttle(KEY)
+        assert limiter.stats()[KEY].rate == 2
+        limiter.acquire(KEY)
+        mock_time.sleep.assert_called_once_with(0.5)
+        limiter.acquire(KEY)
+        mock_time.sleep.assert_called_with(1.0)
+        mock_time.monotonic.return_value = 110.0  # bucket refills to burst
+        mock_time.sleep.reset_mock()
+        limiter.acquire(KEY)
+        limiter.acquire(KEY)
+        mock_time.sleep.assert_not_called()
+        assert limiter.stats()[KEY].waited == pytest.approx(1.5)
+
+    def test_on_success(self, mock_time: Mock) -> None:  # noqa: ARG002
+        """Test on_success."""
+        limiter = AdaptiveRateLimiter(increase=1, max_rate=4, min_rate=2)
+        limiter.on_success(KEY)
+        assert limiter.stats()[KEY].rate is None
+        limiter.on_throttle(KEY)
+        limiter.on_success(KEY)
+        assert limiter.stats()[KEY].rate == pytest.approx(2.5)
+        limiter.on_success(KEY)
+        limiter.on_success(KEY)
+        assert limiter.stats()[KEY].rate == pytest.approx(3.24, abs=0.01)
+        for _ in range(3):
+            limiter.on_success(KEY)
+        assert limiter.stats()[KEY].rate is None
+
+    def test_register(self) -> None:
+        """Test register."""
+        limiter = AdaptiveRateLimiter()
+        session = boto3.Session(
+            aws_access_key_id="foo", aws_secret_access_key="bar", region_name="us-east-1"
+        )
+        limiter.register(session)
+        client = session.client("cloudformation")
+        client.meta.events.register(
+            "before-send",
+            lambda **_: AWSResponse("https://example.com", 200, {}, _raw(DESCRIBE_STACKS_RESPONSE)),
+        )
+        client.describe_stacks()
+        stats = limiter.stats()
+        assert len(stats) == 1
+        key = next(iter(stats))
+        assert key.account != "foo"
+        assert key.region == "us-east-1"
+        assert key.service == "cloudformation"
+        assert stats[key] == RateLimitStats(1, 0, 0.0, None)
+
+        session.events.emit(
+            "needs-retry.cloudformation.DescribeStacks",
+            request_dict={"context": {"runway_rate_limit_key": key}},
+            response=(Mock(), {"Error": {"Code": "Throttling"}}),
+        )
+        assert limiter.stats()[key].throttles == 1
+        assert limiter.stats()[key].rate is not None
+
+    def test_register_assume_role(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+        """Test register with a profile that assumes a role.
+
+        Credentials are refreshed with a call made by the session so they must
+        not be refreshed by the hooks.
+
+        """
+        config_file = tmp_path / "config"
+        config_file.write_text(
+            "[profile role]\n"
+            "role_arn = arn:aws:iam::123456789012:role/test\n"
+            "source_profile = base\n"
+            "[profile base]\n"
+            "aws_access_key_id = foo\n"
+            "aws_secret_access_key = bar\n"
+        )
+        monkeypatch.setenv("AWS_CONFIG_FILE", str(config_file))
+        monkeypatch.setenv("AWS_SHARED_CREDENTIALS_FILE", str(tmp_path / "credentials"))
+        for name in ("AWS_ACCESS_KEY_ID", "AWS_SECRET_ACCESS_KEY", "AWS_SESSION_TOKEN"):
+            monkeypatch.delenv(name, raising=False)
+        # keep the assumed role credentials out of the process-wide cache
+        monkeypatch.setattr("runway.utils._credential_cache.BOTO3_CREDENTIAL_CACHE", {})
+        result: list[str] = []
+        with mock_aws():
+            session = get_session(region="us-east-1", profile="role")
+            thread = threading.Thread(
+                target=lambda: result.append(
+                    session.client("sts").get_caller_identity()["Account"]
+                ),
+                daemon=True,
+            )
+            thread.start()
+            thread.join(timeout=30)
+        assert not thread.is_alive(), "call deadlocked while refreshing credentials"
+        assert result == ["123456789012"]
+
+    def test_register_credentials_resolved_lazily(self, mocker: MockerFixture) -> None:
+        """Test register resolves credentials once, when the first call is made."""
+        limiter = AdaptiveRateLimiter()
+        session = boto3.Session(
+            aws_access_key_id="foo", aws_secret_access_key="bar", region_name="us-east-1"
+        )
+        get_account = mocker.spy(limiter, "_get_account")
+        limiter.register(session)
+        get_account.assert_not_called()
+        client = session.client("cloudformation")
+        client.meta.events.register(
+            "before-send",
+            lambda **_: AWSResponse("https://example.com", 200, {}, _raw(DESCRIBE_STACKS_RESPONSE)),
+        )
+        client.describe_stacks()
+        client.describe_stacks()
+        get_account.assert_called_once_with(session)
+        assert next(iter(limiter.stats().values())).calls == 2
+
+    def test_register_retry(self, mocker: MockerFixture) -> None:
+        """Test register rate limits retries of a call."""
+        mocker.patch("botocore.endpoint.time.sleep")
+        limiter = AdaptiveRateLimiter()
+        session = boto3.Session(
+            aws_access_key_id="foo", aws_secret_access_key="bar", region_name="us-east-1"
+        )
+        limiter.register(session)
+        client = session.client(
+            "cloudformation", config=Config(retries={"max_attempts": 2, "mode": "standard"})
+        )
+        responses = [
+            AWSResponse(
+                "https://example.com",
+                400,
+                {},
+                _raw(b"<ErrorResponse><Error><Code>Throttling</Code></Error></ErrorResponse>"),
+            ),
+            AWSResponse("https://example.com", 200, {}, _raw(DESCRIBE_STACKS_RESPONSE)),
+        ]
+        client.meta.events.register("before-send", lambda **_: responses.pop(0))
+        client.describe_stacks()
+        assert not responses
+        stats = next(iter(limiter.stats().values()))
+        assert stats.calls == 2
+        assert stats.throttles == 1
+
+    def test_register_credentials_not_resolved_in_hook(self, mocker: MockerFixture) -> None:
+        """Test register doesn't resolve credentials for calls that aren't rate limited."""
+        limiter = AdaptiveRateLimiter()
+        session = boto3.Session(
+            aws_access_key_id="foo", aws_secret_access_key="bar", region_name="us-east-1"
+        )
+        limiter.register(session)
+        get_credentials = mocker.patch.object(session, "get_credentials")
+        client = session.client("sts")
+        client.meta.events.register(
+            "before-send", lambda **_: AWSResponse("https://example.com", 500, {}, Mock())
+        )
+        with pytest.raises(Exception):  # noqa: B017, PT011
+            client.get_caller_identity()
+        get_credentials.assert_not_called()
+        assert not limiter.stats()
+
+    def test_reset_stats(self) -> None:
+        """Test reset_stats."""
+        limiter = AdaptiveRateLimiter()
+        limiter.on_throttle(KEY)
+        limiter.acquire(KEY)
+        limiter.reset_stats()
+        assert limiter.stats() == {KEY: RateLimitStats(0, 0, 0.0, limiter.min_rate)}
+
+    def test_log_stats(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Test log_stats."""
+        caplog.set_level(logging.INFO, logger=MODULE)
+        limiter = AdaptiveRateLimiter()
+        limiter.acquire(KEY)
+        limiter.acquire(RateLimitKey("123456789012", "us-west-2", "s3"))
+        limiter.on_throttle(KEY)
+        limiter.log_stats()
+        assert caplog.messages == [
+            "cloudformation (123456789012, us-east-1): 1 call(s); 1 throttled; "
+            "0.0s waiting on rate limit; current limit: 0.5/s"
+        ]
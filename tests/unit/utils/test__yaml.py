@@ -0,0 +1,72 @@
+"""Test runway.utils._yaml."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import yaml
+
+from runway.utils._yaml import YamlCache, YamlLoader, yaml_load
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+MODULE = "runway.utils._yaml"
+
+
+def test_yaml_load() -> None:
+    """Test yaml_load."""
+    assert yaml_load("key: [1, 2]\nother: null") == {"key": [1, 2], "other": None}
+    assert yaml_load(b"- value") == ["value"]
+    assert not yaml_load("")
+
+
+def test_yaml_loader() -> None:
+    """Test YamlLoader."""
+    assert YamlLoader is (yaml.CSafeLoader if yaml.__with_libyaml__ else yaml.SafeLoader)
+
+
+class TestYamlCache:
+    """Test YamlCache."""
+
+    def test_clear(self) -> None:
+        """Test clear."""
+        cache = YamlCache()
+        cache.load("key: value")
+        cache.load("key: value")
+        cache.clear()
+        assert not len(cache)
+        assert cache.hits == cache.misses == 0
+
+    def test_load(self, mocker: MockerFixture) -> None:
+        """Test load."""
+        mock_yaml_load = mocker.patch(f"{MODULE}.yaml_load", side_effect=yaml_load)
+        cache = YamlCache()
+        first = cache.load("key:\n  - value")
+        assert first == {"key": ["value"]}
+        first["key"].append("changed")
+        assert cache.load(b"key:\n  - value") == {"key": ["value"]}
+        mock_yaml_load.assert_called_once_with("key:\n  - value", loader=YamlLoader)
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_load_loader(self) -> None:
+        """Test load with a different loader."""
+        cache = YamlCache()
+        cache.load("key: value")
+        cache.load("key: value", loader=yaml.SafeLoader)
+        assert len(cache) == 2
+        assert cache.misses == 2
+
+    def test_load_max_size(self) -> None:
+        """Test load removes the least recently used document."""
+        cache = YamlCache(max_size=2)
+        cache.load("first")
+        cache.load("second")
+        cache.load("first")
+        cache.load("third")
+        assert len(cache) == 2
+        cache.load("first")
+        assert cache.hits == 2
+        cache.load("second")
+        assert cache.misses == 4